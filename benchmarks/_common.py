@@ -0,0 +1,40 @@
+"""
+Utilitários compartilhados pelos benchmarks.
+
+Todos rodam headless (drivers `dummy` do SDL), então dá pra usar em
+máquina de CI sem placa de vídeo nem som. Rode sempre da raiz do projeto:
+
+    $ python -m benchmarks.<nome>
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402  (precisa vir depois das variáveis de ambiente)
+
+
+def init_headless(size=(1280, 720)):
+    """Inicializa o Pygame com janela fake (necessária pro `convert_alpha`)."""
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+def timeit(fn, repeat=1):
+    """Roda `fn` `repeat` vezes e devolve o tempo médio em milissegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def best_ms(fn, repeat=1, rounds=5):
+    """Melhor média (ms) de `rounds` rodadas de `timeit` — menos sensível a ruído da máquina."""
+    return min(timeit(fn, repeat) for _ in range(rounds))
+
+
+def samples_ms(fn, repeat=1, rounds=5):
+    """Média (ms) de cada uma de `rounds` rodadas de `timeit`, na ordem em que rodaram."""
+    return [timeit(fn, repeat) for _ in range(rounds)]
@@ -0,0 +1,115 @@
+"""
+Benchmark: avanço de animação de muitas entidades, `frame_index` em
+float + if/elif por estado (como era) vs tabelas por tick do
+`core.animation`.
+
+Usa os clipes do Bringer (velocidades diferentes por estado, fim que
+volta pro idle, feitiço no quadro 5) em 5.000 entidades espalhadas pelos
+estados, mede o tempo por tick e confere com `tracemalloc` que avançar
+não aloca nada:
+
+    $ python -m benchmarks.animation
+"""
+
+import tracemalloc
+
+from benchmarks._common import init_headless, timeit
+
+init_headless()
+
+from core.animation import Animator  # noqa: E402
+from core.bringer import BringerOfDeathEnemy  # noqa: E402
+from core.timing import FIXED_DT  # noqa: E402
+
+N_ENTITIES = 5000
+N_TICKS = 60
+STATES = ("idle", "walk", "cast", "attack", "hurt")
+
+
+class _Legacy:
+    """Estado de animação do jeito antigo (atributos soltos, quadro em float)."""
+
+    def __init__(self, state):
+        self.state = state
+        self.frame_index = 0
+        self.has_cast_spell = False
+        self.has_attacked = False
+
+
+def legacy_tick(entities, lengths, dt):
+    """Cópia da lógica do `BringerOfDeathEnemy.animate` antigo, sem o desenho."""
+    casts = 0
+    for e in entities:
+        if e.state == "death":
+            e.frame_index += 4.2 * dt
+        elif e.state == "hurt":
+            e.frame_index += 4.2 * dt
+        else:
+            e.frame_index += 21 * dt
+        n = lengths[e.state]
+        if e.state == "cast":
+            if not e.has_cast_spell and int(e.frame_index) == 5:
+                casts += 1
+                e.has_cast_spell = True
+            if e.frame_index >= n:
+                e.frame_index = 0
+                e.state = "idle"
+        elif e.state == "attack":
+            if not e.has_attacked and int(e.frame_index) == 5:
+                e.has_attacked = True
+            if e.frame_index >= n:
+                e.frame_index = 0
+                e.state = "idle"
+                e.has_attacked = False
+        elif e.state == "hurt":
+            if e.frame_index >= n:
+                e.frame_index = 0
+                e.state = "idle"
+        elif e.frame_index >= n:
+            e.frame_index = 0
+        int(e.frame_index)  # índice do frame a desenhar
+    return casts
+
+
+def table_tick(animators, dt):
+    casts = 0
+    for anim in animators:
+        if anim.advance(dt) == "cast":
+            casts += 1
+    return casts
+
+
+def allocated_blocks(fn):
+    """Blocos de memória ainda vivos depois de rodar `fn` 10x."""
+    fn()  # aquece caches (tabelas de outro `dt`, etc.)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(10):
+        fn()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]  # o próprio snapshot
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    return sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+
+
+def main():
+    template = BringerOfDeathEnemy((0, 0))
+    lengths = {state: len(frames) for state, frames in template.animations.items()}
+    clips = template.anim.clips
+
+    legacy = [_Legacy(STATES[i % len(STATES)]) for i in range(N_ENTITIES)]
+    animators = [Animator(clips, STATES[i % len(STATES)]) for i in range(N_ENTITIES)]
+
+    legacy_ms = timeit(lambda: legacy_tick(legacy, lengths, FIXED_DT), repeat=N_TICKS)
+    table_ms = timeit(lambda: table_tick(animators, FIXED_DT), repeat=N_TICKS)
+    blocks = allocated_blocks(lambda: table_tick(animators, FIXED_DT))
+
+    print(f"{N_ENTITIES} Bringers animando, {N_TICKS} ticks")
+    print(f"float + if/elif:   {legacy_ms:7.2f} ms/tick")
+    print(f"tabelas por tick:  {table_ms:7.2f} ms/tick  ({legacy_ms / table_ms:.1f}×)")
+    print(f"blocos alocados avançando 10 ticks: {blocks}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: desenho de uma onda grande com frames soltos (um `blit` por
+entidade) vs atlas de texturas (`TextureAtlas`, um `blits` por camada).
+
+Monta a sala da passarela com o player, o boss e uma onda misturada de
+esqueletos, NightBornes e Bringers, desenha a mesma sequência de frames
+nos dois modos e confere se as telas saem idênticas:
+
+    $ python -m benchmarks.atlas
+"""
+
+import time
+
+import pygame
+
+from benchmarks._common import init_headless
+
+screen = init_headless()
+
+from core.asset_cache import asset_cache  # noqa: E402
+from core.bringer import BringerOfDeathEnemy  # noqa: E402
+from core.knight_boss import KnightBoss  # noqa: E402
+from core.nightborne import NightBorneEnemy  # noqa: E402
+from core.player import Player  # noqa: E402
+from core.room_manager import RoomManager  # noqa: E402
+from core.skeleton import SkeletonEnemy  # noqa: E402
+
+N_ENEMIES = 300
+N_FRAMES = 60
+GROUND = 660
+
+
+def build_scene():
+    width = screen.get_width()
+    player = Player((width // 2, 0))
+    player.rect.bottom = GROUND
+    kinds = (SkeletonEnemy, NightBorneEnemy, BringerOfDeathEnemy)
+    enemies = [kinds[i % 3](((i * 97) % width, 560)) for i in range(N_ENEMIES)]
+    boss = KnightBoss((width // 2, GROUND - 100), GROUND)
+    return player, enemies, boss
+
+
+def animate(sprites, frame):
+    """Troca o frame de cada entidade sem rodar a lógica (mesma sequência nos dois modos)."""
+    for i, sprite in enumerate(sprites):
+        frames = sprite.animations["idle"].facing(i % 2 == 0)
+        sprite.image = frames[(frame + i) % len(frames)]
+
+
+def run(atlas):
+    asset_cache.clear()
+    room_manager = RoomManager(*screen.get_size(), music=None)
+    room_manager.current_room = 1
+    room_manager._load_room(1)  # benchmark: sem esperar o streaming
+    if atlas:
+        build_scene()  # monta os frames uma vez antes de empacotar
+        asset_cache.build_atlas()
+    player, enemies, boss = build_scene()
+    sprites = [player, boss] + enemies
+
+    start = time.process_time()
+    for frame in range(N_FRAMES):
+        animate(sprites, frame)
+        room_manager.draw_room(screen)
+        if atlas:
+            screen.blits([player.blit_item()])
+            room_manager.draw_foreground(screen)
+            screen.blits([enemy.blit_item() for enemy in enemies])
+            screen.blits([boss.blit_item()])
+        else:
+            player.draw(screen)
+            room_manager.draw_foreground(screen)
+            for enemy in enemies:
+                enemy.draw(screen)
+            boss.draw(screen)
+    elapsed = time.process_time() - start
+    return elapsed * 1000 / N_FRAMES, pygame.image.tobytes(screen, "RGB"), asset_cache.stats()["bytes"]
+
+
+def main():
+    loose_ms, loose_screen, loose_bytes = run(atlas=False)
+    atlas_ms, atlas_screen, atlas_bytes = run(atlas=True)
+
+    print(f"player + boss + {N_ENEMIES} inimigos na passarela, {N_FRAMES} frames")
+    print(f"frames soltos:  {loose_ms:7.2f} ms CPU/frame  {loose_bytes / 1024 / 1024:6.1f} MiB de frames")
+    print(f"atlas:          {atlas_ms:7.2f} ms CPU/frame  {atlas_bytes / 1024 / 1024:6.1f} MiB de frames")
+    print(f"telas idênticas: {'sim' if loose_screen == atlas_screen else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
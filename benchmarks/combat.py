@@ -0,0 +1,88 @@
+"""
+Benchmark: custo da passada de combate (`core.combat`) por tick, variando
+o número de entidades na sala e o número de golpes ativos.
+
+Espalha alvos do tamanho de um esqueleto num corredor que cresce com a
+onda (densidade constante) e põe K players no quadro do smash em pontos
+sorteados. Cada tick medido é o que o `Game.update` faz: inscreve os
+golpes ativos e roda `CombatResolver.resolve`, nada montado fora do
+tempo:
+
+    $ python -m benchmarks.combat
+
+Com nenhum golpe ativo a passada é só a checagem da lista vazia. Cada
+golpe do player varre os alvos com `colliderect` numa compreensão (o
+laço fica em C, ~0,05 µs por alvo), então o custo cresce com K × alvos;
+uma grade espacial em Python custava mais pra manter a cada tick do que
+essa varredura.
+"""
+
+import random
+
+import pygame
+
+from benchmarks._common import init_headless, timeit
+
+init_headless()
+
+from core.combat import PLAYER, CombatResolver, Hitbox  # noqa: E402
+from core.player import Player  # noqa: E402
+
+SIZES = (300, 3000, 30000)
+ACTIVE = (0, 1, 8, 32)
+SPACING = 40          # px de corredor por alvo (densidade constante)
+TARGET_SIZE = (96, 128)
+N_TICKS = 200
+
+
+class Target(pygame.sprite.Sprite):
+    """Alvo mínimo: `rect` e `take_damage`."""
+
+    def __init__(self, rect):
+        super().__init__()
+        self.rect = rect
+        self.hp = 0
+
+    def take_damage(self, amount):
+        self.hp -= amount
+
+
+def make_attackers(k, width, resolver, rng):
+    """K players no primeiro quadro do smash, com o hitbox inscrito em `resolver`."""
+    attackers = []
+    for _ in range(k):
+        player = Player((0, 0))
+        player.state = "smash"
+        player.anim.seek(8)
+        player.rect.midtop = (rng.randrange(width), 540)
+        attackers.append((player, Hitbox(player, player.hitbox.tracks, PLAYER, resolver)))
+    return attackers
+
+
+def main():
+    rng = random.Random(1234)
+    resolver = CombatResolver()
+    print(f"passada de combate por tick (µs), {SPACING} px de chão por alvo")
+    print(f"{'entidades':>9} " + " ".join(f"{f'{k} golpes':>10}" for k in ACTIVE))
+    for n in SIZES:
+        width = n * SPACING
+        targets = pygame.sprite.Group(
+            Target(pygame.Rect(rng.randrange(width), 560 + rng.randrange(40), *TARGET_SIZE))
+            for _ in range(n)
+        )
+        row = []
+        for k in ACTIVE:
+            attackers = make_attackers(k, width, resolver, rng)
+
+            def tick():
+                for player, hitbox in attackers:
+                    hitbox.reset()  # golpe novo a cada tick: todo alvo pode levar de novo
+                    hitbox.sync(player.anim, player.rect, player.facing_right)
+                resolver.resolve(None, targets)
+
+            row.append(timeit(tick, repeat=N_TICKS) * 1000)
+        print(f"{n:>9} " + " ".join(f"{us:>10.1f}" for us in row))
+
+
+if __name__ == "__main__":
+    main()
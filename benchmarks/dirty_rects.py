@@ -0,0 +1,81 @@
+"""
+Benchmark: CPU por frame do gameplay com `display.flip()` completo vs
+renderer de retângulos sujos (`DirtyRectRenderer`).
+
+Monta a sala da passarela (fundo + foreground) com o player e uma
+fila de esqueletos andando, desenha a mesma sequência de frames nos dois
+modos e confere se a tela do modo sujo bate com um redesenho completo
+do mesmo estado:
+
+    $ python -m benchmarks.dirty_rects
+
+Obs: com o driver `dummy` o `flip`/`update` quase não custam nada, então
+o número medido é só o lado da CPU (blits); numa janela real a diferença
+do upload pra tela soma a favor do modo sujo.
+"""
+
+import time
+
+import pygame
+
+from benchmarks._common import init_headless
+
+screen = init_headless()
+
+from core.combat import combat  # noqa: E402
+from core.dirty_renderer import DirtyRectRenderer  # noqa: E402
+from core.player import Player  # noqa: E402
+from core.room_manager import RoomManager  # noqa: E402
+from core.skeleton import SkeletonEnemy  # noqa: E402
+
+N_ENEMIES = 10
+N_FRAMES = 300
+
+
+def run(enabled):
+    room_manager = RoomManager(*screen.get_size(), music=None)
+    room_manager.current_room = 1
+    room_manager._load_room(1)  # benchmark: sem esperar o streaming
+    ground = room_manager.get_ground_level()
+
+    player = Player((100, 0))
+    player.rect.bottom = ground
+    enemies = [SkeletonEnemy((700 + i * 50, 560)) for i in range(N_ENEMIES)]
+
+    renderer = DirtyRectRenderer(enabled=enabled)
+    start = time.process_time()
+    for _ in range(N_FRAMES):
+        renderer.begin_frame(room_manager.current_room)
+        player_area = player.image.get_rect(topleft=player.rect.topleft)
+        room_manager.draw_room(screen, renderer.restore_rects([player_area]))
+        renderer.mark(player.draw(screen))
+        room_manager.draw_foreground(screen, renderer.dirty_rects())
+        for enemy in enemies:
+            enemy.update(player)
+            renderer.mark(enemy.draw(screen))
+        combat.clear()  # golpes descartados: ninguém morre no meio da medição
+        renderer.present()
+    elapsed = time.process_time() - start
+
+    # referência: redesenho completo do estado final
+    shown = pygame.image.tobytes(screen, "RGB")
+    room_manager.draw_room(screen)
+    player.draw(screen)
+    room_manager.draw_foreground(screen)
+    for enemy in enemies:
+        enemy.draw(screen)
+    return elapsed * 1000 / N_FRAMES, shown == pygame.image.tobytes(screen, "RGB")
+
+
+def main():
+    full_ms, _ = run(enabled=False)
+    dirty_ms, matches = run(enabled=True)
+
+    print(f"player + {N_ENEMIES} esqueletos na passarela, {N_FRAMES} frames")
+    print(f"flip completo:        {full_ms:6.2f} ms CPU/frame")
+    print(f"retângulos sujos:     {dirty_ms:6.2f} ms CPU/frame")
+    print(f"tela confere com redesenho completo: {'sim' if matches else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark: memória por inimigo e tick de simulação, Sprite por inimigo
+vs `EnemyWorld` (componentes com `__slots__`, `core.ecs`).
+
+Monta uma onda misturada de esqueletos, NightBornes e Bringers nos dois
+modos, mede com `tracemalloc` quantos bytes cada inimigo ocupa (os
+frames são compartilhados pelo `asset_cache` e ficam de fora) e depois
+o tempo de lógica por tick (IA, movimento, animação, golpes), com o player no
+meio da tela:
+
+    $ python -m benchmarks.ecs
+"""
+
+import gc
+import random
+import tracemalloc
+
+import pygame
+
+from benchmarks._common import init_headless, timeit
+
+screen = init_headless()
+
+from core.bringer import BringerOfDeathEnemy  # noqa: E402
+from core.combat import combat  # noqa: E402
+from core.ecs import EnemyWorld  # noqa: E402
+from core.nightborne import NightBorneEnemy  # noqa: E402
+from core.player import Player  # noqa: E402
+from core.skeleton import SkeletonEnemy  # noqa: E402
+from core.timing import FIXED_DT  # noqa: E402
+
+SIZES = (300, 3000)
+N_TICKS = 60
+KINDS = (
+    (SkeletonEnemy, 560, ()),
+    (NightBorneEnemy, 660, (NightBorneEnemy.default_sheet,)),
+    (BringerOfDeathEnemy, 670, ()),
+)
+
+
+def make_player():
+    player = Player((0, 0))
+    player.rect.midbottom = (640, 750)
+    player.max_health = player.health = 10 ** 9  # ninguém para a medição morrendo
+    return player
+
+
+def wave(n):
+    rng = random.Random(42)
+    return [(KINDS[i % 3], rng.randrange(0, 1280)) for i in range(n)]
+
+
+def build_sprites(n):
+    enemies = pygame.sprite.Group()
+    for (cls, y, args), x in wave(n):
+        enemy = cls((x, y), *args)
+        enemy.facing_right = False
+        enemies.add(enemy)
+    return enemies
+
+
+def build_world(n, spells):
+    world = EnemyWorld(spells)
+    for (cls, y, _), x in wave(n):
+        world.spawn(cls, (x, y))
+    return world
+
+
+def bytes_per_enemy(build, n):
+    """Bytes alocados por `build(n)` (e ainda vivos) divididos por `n`."""
+    build(3)  # frames e instâncias modelo já no cache: não entram na conta
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(n)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / n
+
+
+def sprite_tick_ms(n):
+    player = make_player()
+    spells = pygame.sprite.Group()
+    enemies = build_sprites(n)
+
+    def tick():
+        for enemy in enemies:
+            if isinstance(enemy, BringerOfDeathEnemy):
+                enemy.update(player, spells, FIXED_DT)
+            else:
+                enemy.update(player, FIXED_DT)
+        combat.resolve(player, ())  # golpes dos inimigos no player
+        spells.empty()
+
+    return timeit(tick, repeat=N_TICKS)
+
+
+def world_tick_ms(n):
+    player = make_player()
+    spells = pygame.sprite.Group()
+    world = build_world(n, spells)
+
+    def tick():
+        world.update(player, FIXED_DT)
+        combat.resolve(player, (), batch=world)  # golpes da fila no player
+        spells.empty()
+
+    return timeit(tick, repeat=N_TICKS)
+
+
+def main():
+    spells = pygame.sprite.Group()
+    print("onda misturada (esqueleto, NightBorne, Bringer), player no meio da tela")
+    print(f"{'inimigos':>8} {'B/sprite':>9} {'B/entidade':>11} {'memória':>8}   "
+          f"{'ms sprites':>10} {'ms ECS':>8} {'ganho':>6}")
+    for n in SIZES:
+        sprite_bytes = bytes_per_enemy(build_sprites, n)
+        world_bytes = bytes_per_enemy(lambda k: build_world(k, spells), n)
+        sprite_ms = sprite_tick_ms(n)
+        world_ms = world_tick_ms(n)
+        print(f"{n:>8} {sprite_bytes:>9.0f} {world_bytes:>11.0f} "
+              f"{world_bytes / sprite_bytes:>7.0%}   "
+              f"{sprite_ms:>10.2f} {world_ms:>8.2f} {sprite_ms / world_ms:>5.1f}×")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: tick de simulação de ondas enormes, Sprite por inimigo vs
+`EnemyBatch` (NumPy).
+
+Spawna 100, 1.000 e 3.000 esqueletos espalhados pela tela, com o player
+no meio, e mede só a lógica (perseguição, golpe, animação) por tick em
+cada backend; o desenho aparece numa coluna à parte:
+
+    $ python -m benchmarks.enemy_batch
+
+A meta é caber em um tick de 60 Hz (16,7 ms) com milhares de esqueletos.
+"""
+
+import random
+
+import pygame
+
+from benchmarks._common import init_headless, timeit
+
+screen = init_headless()
+
+from core.combat import combat  # noqa: E402
+from core.enemy_batch import EnemyBatch, available  # noqa: E402
+from core.player import Player  # noqa: E402
+from core.skeleton import SkeletonEnemy  # noqa: E402
+from core.timing import FIXED_DT  # noqa: E402
+
+SIZES = (100, 1000, 3000)
+N_TICKS = 60
+TICK_BUDGET_MS = 1000 / 60
+
+
+def make_player():
+    player = Player((0, 0))
+    player.rect.midbottom = (640, 750)
+    player.max_health = player.health = 10 ** 9  # ninguém para a medição morrendo
+    return player
+
+
+def positions(n):
+    rng = random.Random(42)
+    return [(rng.randrange(0, 1280), 560) for _ in range(n)]
+
+
+def sprite_tick_ms(n):
+    player = make_player()
+    enemies = pygame.sprite.Group(SkeletonEnemy(pos) for pos in positions(n))
+
+    def tick():
+        for enemy in enemies:
+            enemy.update(player, FIXED_DT)
+        combat.resolve(player, ())  # golpes dos esqueletos no player
+
+    update_ms = timeit(tick, repeat=N_TICKS)
+    draw_ms = timeit(lambda: [enemy.draw(screen) for enemy in enemies], repeat=5)
+    return update_ms, draw_ms
+
+
+def batch_tick_ms(n):
+    player = make_player()
+    batch = EnemyBatch()
+    for pos in positions(n):
+        batch.spawn(SkeletonEnemy, pos)
+
+    def tick():
+        batch.update(player, FIXED_DT)
+        combat.resolve(player, (), batch=batch)  # golpes do lote no player
+
+    update_ms = timeit(tick, repeat=N_TICKS)
+    draw_ms = timeit(lambda: batch.draw(screen), repeat=5)
+    return update_ms, draw_ms
+
+
+def main():
+    if not available():
+        print("NumPy não instalado: EnemyBatch indisponível")
+        return
+
+    print(f"ms por tick ({N_TICKS} ticks); orçamento de 60 Hz = {TICK_BUDGET_MS:.1f} ms")
+    print(f"{'esqueletos':>10} {'sprites':>9} {'lote':>9} {'ganho':>7}   "
+          f"{'desenho sprites':>15} {'desenho lote':>12}")
+    for n in SIZES:
+        sprite_update, sprite_draw = sprite_tick_ms(n)
+        batch_update, batch_draw = batch_tick_ms(n)
+        print(f"{n:>10} {sprite_update:>9.2f} {batch_update:>9.3f} "
+              f"{sprite_update / batch_update:>6.0f}×   "
+              f"{sprite_draw:>15.2f} {batch_draw:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
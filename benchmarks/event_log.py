@@ -0,0 +1,84 @@
+"""
+Benchmark: custo por evento de combate, `print` (como era) vs registro
+no `core.event_log`.
+
+Compara, por evento "esqueleto levou dano":
+
+- `print` formatado pra um arquivo (stdout redirecionado pro disco);
+- `print` pra um pipe com um leitor lento do outro lado (o caso em que
+  o jogo travava esperando o stdout);
+- `combat_log.info` no buffer circular, com e sem a thread exportando;
+- o canal desligado (`OFF`).
+
+    $ python -m benchmarks.event_log
+"""
+
+import contextlib
+import os
+import tempfile
+import threading
+import time
+
+from benchmarks._common import timeit
+from core.event_log import OFF, EventLog
+
+N_EVENTS = 20000
+PIPE_READ_DELAY_S = 0.001   # leitor do pipe: 4 KB por ms
+
+
+def print_events(out):
+    with contextlib.redirect_stdout(out):
+        for i in range(N_EVENTS):
+            print(f"Skeleton took {15} damage! Remaining health: {i}")
+        out.flush()
+
+
+def slow_pipe():
+    """Ponta de escrita de um pipe cujo leitor consome devagar."""
+    read_fd, write_fd = os.pipe()
+
+    def reader():
+        with os.fdopen(read_fd, "rb") as pipe:
+            while pipe.read1(4096):
+                time.sleep(PIPE_READ_DELAY_S)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    return os.fdopen(write_fd, "w"), thread
+
+
+def log_events(channel):
+    info = channel.info
+    for i in range(N_EVENTS):
+        info("hit", "skeleton", 15, i)
+
+
+def main():
+    per_event = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "stdout.txt"), "w") as out:
+            per_event["print → arquivo"] = timeit(lambda: print_events(out))
+
+        out, reader = slow_pipe()
+        per_event["print → pipe lento"] = timeit(lambda: print_events(out))
+        out.close()
+        reader.join()
+
+        log = EventLog()
+        channel = log.channel("combat")
+        per_event["buffer circular"] = timeit(lambda: log_events(channel))
+
+        log.open_export(os.path.join(tmp, "events.jsonl"))
+        per_event["buffer + thread exportando"] = timeit(lambda: log_events(channel))
+        log.close_export()
+
+        log.set_level(OFF)
+        per_event["canal desligado"] = timeit(lambda: log_events(channel))
+
+    print(f"{N_EVENTS} eventos de dano")
+    for name, ms in per_event.items():
+        print(f"{name:<28} {ms * 1000 / N_EVENTS:8.3f} µs/evento")
+
+
+if __name__ == "__main__":
+    main()
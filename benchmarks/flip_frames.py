@@ -0,0 +1,86 @@
+"""
+Benchmark: alocação de Surfaces por frame com 100 inimigos na tela.
+
+Compara o caminho antigo (`pygame.transform.flip` a cada frame pra
+quem olha pro lado "errado") com o lookup nos frames pré-espelhados
+de `Animation.mirrored`:
+
+    $ python -m benchmarks.flip_frames
+"""
+
+import time
+
+import pygame
+
+from benchmarks._common import init_headless
+
+screen = init_headless()
+
+from core.skeleton import SkeletonEnemy  # noqa: E402
+from core.timing import FIXED_DT  # noqa: E402
+
+N_ENEMIES = 100
+N_FRAMES = 300
+
+
+class _FlipCounter:
+    """Embrulha `pygame.transform.flip` contando quantas Surfaces ele criou."""
+
+    def __init__(self):
+        self.original = pygame.transform.flip
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.original(*args, **kwargs)
+
+
+class _Dummy:
+    """Player parado bem longe, fora do `vision_range`, só pros inimigos animarem."""
+
+    rect = pygame.Rect(-5000, 0, 10, 10)
+
+
+def legacy_animate(enemy):
+    """Reproduz o `SkeletonEnemy.animate` antigo (flip a cada frame)."""
+    frames = enemy.animations[enemy.state]
+    step = enemy.animation_fps * FIXED_DT
+    enemy.legacy_frame = (getattr(enemy, "legacy_frame", 0) + step) % len(frames)
+    image = frames[int(enemy.legacy_frame)]
+    if not enemy.facing_right:
+        image = pygame.transform.flip(image, True, False)
+    enemy.image = image
+
+
+def run(step):
+    enemies = [SkeletonEnemy((40 + i * 12, 560)) for i in range(N_ENEMIES)]
+    for enemy in enemies:
+        enemy.facing_right = False
+        enemy.vision_range = 0
+
+    counter = _FlipCounter()
+    pygame.transform.flip = counter
+    try:
+        start = time.perf_counter()
+        for _ in range(N_FRAMES):
+            for enemy in enemies:
+                step(enemy)
+                enemy.draw(screen)
+        elapsed = time.perf_counter() - start
+    finally:
+        pygame.transform.flip = counter.original
+    return counter.calls / N_FRAMES, elapsed * 1000 / N_FRAMES
+
+
+def main():
+    player = _Dummy()
+    before = run(legacy_animate)
+    after = run(lambda enemy: enemy.update(player))
+
+    print(f"{N_ENEMIES} esqueletos olhando pra esquerda, {N_FRAMES} frames")
+    print(f"antes  (flip por frame): {before[0]:6.1f} Surfaces/frame  {before[1]:6.2f} ms/frame")
+    print(f"depois (mirrored):       {after[0]:6.1f} Surfaces/frame  {after[1]:6.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: pressão no GC numa partida longa com muitas ondas, com e sem
+os pools de sprites (`sprite_pools`).
+
+Roda headless uma passarela com 30 ondas (esqueletos, Bringers
+lançando feitiços e NightBornes) com o bot do `tools.headless_sim` e
+conta quantos sprites foram construídos, quantas coletas o GC fez e
+quanto tempo elas pausaram o jogo:
+
+    $ python -m benchmarks.pool_gc
+"""
+
+import gc
+import time
+
+from benchmarks._common import init_headless
+
+init_headless()
+
+from core.bringer import BringerOfDeathEnemy  # noqa: E402
+from core.game import Game  # noqa: E402
+from core.headless import run  # noqa: E402
+from core.nightborne import NightBorneEnemy  # noqa: E402
+from core.pool import sprite_pools  # noqa: E402
+from core.skeleton import SkeletonEnemy  # noqa: E402
+from tools.headless_sim import chase_bot  # noqa: E402
+
+N_WAVES = 30
+WAVES = [
+    [(SkeletonEnemy, 4), (BringerOfDeathEnemy, 1), (NightBorneEnemy, 1)]
+    for _ in range(N_WAVES)
+]
+MAX_TICKS = 200_000
+
+
+class GCTimer:
+    """Mede quantas coletas o GC fez e quanto tempo elas levaram."""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pause_ms = 0.0
+        self.worst_ms = 0.0
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            ms = (time.perf_counter() - self._start) * 1000
+            self.pause_ms += ms
+            self.worst_ms = max(self.worst_ms, ms)
+            self.collections[info["generation"]] += 1
+
+
+def waves_done(game):
+    """Para quando a última onda foi limpa (prompt do pátio)."""
+    return game.show_patio_prompt or not game.player.alive
+
+
+def measure(pooled):
+    sprite_pools.clear()
+    sprite_pools.enabled = pooled
+    game = Game(1280, 720, wave_definitions=WAVES, load_scenery=False)
+    game.player.max_health = game.player.health = 10 ** 9  # a partida toda, sem morrer
+
+    timer = GCTimer()
+    gc.collect()
+    gc.callbacks.append(timer)
+    start = time.perf_counter()
+    try:
+        result = run(chase_bot, MAX_TICKS, game=game, stop=waves_done)
+    finally:
+        elapsed = time.perf_counter() - start
+        gc.callbacks.remove(timer)
+    created = sum(stats["created"] for stats in sprite_pools.stats().values())
+    return result, created, timer, elapsed
+
+
+def main():
+    print(f"{N_WAVES} ondas na passarela (4 esqueletos + Bringer + NightBorne cada)")
+    for pooled in (False, True):
+        result, created, timer, elapsed = measure(pooled)
+        label = "com pools" if pooled else "sem pools"
+        print(
+            f"{label}: {result['ticks']} ticks em {elapsed:.2f} s, "
+            f"{created} sprites construídos, "
+            f"GC gen0/1/2 = {timer.collections[0]}/{timer.collections[1]}/{timer.collections[2]}, "
+            f"pausa total {timer.pause_ms:.1f} ms (pior {timer.worst_ms:.2f} ms)"
+        )
+    print("high-water:", {name: s["high_water"] for name, s in sprite_pools.stats().items()})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""
+Suíte de benchmarks dos caminhos quentes do Hollow Mooni, com baseline.
+
+Mede, headless (drivers `dummy` do SDL):
+
+- construção cold (cache de assets vazio) e warm de `Player`,
+  `SkeletonEnemy`, `NightBorneEnemy`, `BringerOfDeathEnemy` e `KnightBoss`;
+- `RoomManager` (init, carregando a primeira sala);
+- `update()` por tipo de entidade com 10, 100 e 1.000 instâncias;
+- `combat.resolve` (um golpe do player contra 100 e 1.000 inimigos);
+- frame completo desenhado em cada sala (fundo, entidades, foreground).
+
+Cada medida roda `ROUNDS` rodadas e guarda a mediana e a faixa
+(`low`/`high`, a rodada mais rápida e a mais lenta) em ms, menor é melhor,
+num JSON. O `meta` guarda também o tempo de um laço Python fixo
+(`calibration_ms`, medido no começo e no fim), que dá a velocidade da
+máquina naquela rodada.
+
+Com `--baseline` cada medida é comparada com a de um JSON salvo antes,
+já descontada a diferença de calibração (máquina carregada deixa tudo
+mais lento por igual). É regressão só se a mediana atual passar do
+`high` do baseline mais a tolerância; se alguma passar, a suíte lista as
+regressões e sai com código 1:
+
+    $ python -m benchmarks.suite --out benchmarks/baseline.json
+    ... (mudanças) ...
+    $ python -m benchmarks.suite --baseline benchmarks/baseline.json
+
+`--self-check` roda a suíte duas vezes e compara a segunda com a
+primeira: com o mesmo código tem que passar (sai com 0).
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import pygame
+
+from benchmarks._common import init_headless, samples_ms, timeit
+
+screen = init_headless()
+
+from core.asset_cache import asset_cache  # noqa: E402
+from core.bringer import BringerOfDeathEnemy  # noqa: E402
+from core.clock import game_clock  # noqa: E402
+from core.combat import PLAYER, CombatResolver, Hitbox, combat  # noqa: E402
+from core.headless import NO_KEYS  # noqa: E402
+from core.knight_boss import KnightBoss  # noqa: E402
+from core.nightborne import NightBorneEnemy  # noqa: E402
+from core.player import Player  # noqa: E402
+from core.room_manager import RoomManager  # noqa: E402
+from core.skeleton import SkeletonEnemy  # noqa: E402
+from core.timing import FIXED_DT  # noqa: E402
+
+SCREEN_SIZE = screen.get_size()
+GROUND = 660
+COUNTS = (10, 100, 1000)
+UPDATE_TICKS = 60            # ticks por rodada no benchmark de update (1 s de jogo)
+RENDER_FRAMES = 20           # frames por rodada no benchmark de desenho
+ROUNDS = 7                   # rodadas por medida (mediana e faixa; no mínimo 5)
+CALIBRATION_N = 200000       # iterações do laço de calibração
+DEFAULT_OUT = "benchmarks/results.json"
+DEFAULT_TOLERANCE = 0.5      # mediana +50% acima do `high` do baseline = regressão
+MIN_DELTA_MS = 0.05          # diferenças menores que isso são ruído, não regressão
+
+CONSTRUCTORS = {
+    "player": lambda: Player((0, 0)),
+    "skeleton": lambda: SkeletonEnemy((0, 560)),
+    "nightborne": lambda: NightBorneEnemy((0, 560)),
+    "bringer": lambda: BringerOfDeathEnemy((0, 560)),
+    "knight_boss": lambda: KnightBoss((540, GROUND - 100), GROUND),
+}
+
+
+def make_target():
+    """Player parado no meio do chão que ninguém consegue matar."""
+    player = Player((0, 0))
+    player.rect.midbottom = (SCREEN_SIZE[0] // 2, GROUND)
+    player.max_health = player.health = 10 ** 9
+    return player
+
+
+def spread(n):
+    """Posições espalhadas pela largura da tela (determinísticas)."""
+    width = SCREEN_SIZE[0]
+    return [((i * 97) % width, 560) for i in range(n)]
+
+
+def summarize(samples):
+    """Mediana e faixa (`low`, `high`) dos tempos (ms) das rodadas de uma medida."""
+    return {"median": statistics.median(samples), "low": min(samples), "high": max(samples)}
+
+
+def measure(fn, repeat=1):
+    """`summarize` de `ROUNDS` rodadas de `fn` (média de `repeat` chamadas cada)."""
+    return summarize(samples_ms(fn, repeat, ROUNDS))
+
+
+def calibration_samples():
+    """Tempos (ms) de um laço Python fixo — a velocidade da máquina agora."""
+    def loop():
+        total = 0
+        for i in range(CALIBRATION_N):
+            total += i * i
+        return total
+
+    return samples_ms(loop, rounds=ROUNDS)
+
+
+# ------------------------------------------------------------------
+# construção
+# ------------------------------------------------------------------
+def bench_construction(results):
+    for name, build in CONSTRUCTORS.items():
+        def cold():
+            asset_cache.clear()
+            build()
+
+        results[f"construct.{name}.cold"] = measure(cold)
+        build()  # garante o cache quente
+        results[f"construct.{name}.warm"] = measure(build, repeat=20)
+
+    def rooms_cold():
+        asset_cache.clear()
+        RoomManager(*SCREEN_SIZE, music=None)
+
+    results["room_manager.init.cold"] = measure(rooms_cold)
+    results["room_manager.init.warm"] = measure(lambda: RoomManager(*SCREEN_SIZE, music=None), repeat=5)
+
+
+# ------------------------------------------------------------------
+# update por tipo de entidade
+# ------------------------------------------------------------------
+def update_tick(kind, n):
+    """Monta `n` entidades de um tipo e devolve a função que roda um tick em todas."""
+    player = make_target()
+
+    if kind == "player":
+        players = [Player((x, 0)) for x, _ in spread(n)]
+        for p in players:
+            p.rect.bottom = GROUND
+
+        def tick():
+            for p in players:
+                p.update(NO_KEYS, GROUND, SCREEN_SIZE[0], FIXED_DT)
+        return tick
+
+    if kind == "bringer":
+        spells = pygame.sprite.Group()
+        enemies = [BringerOfDeathEnemy(pos) for pos in spread(n)]
+
+        def tick():
+            for enemy in enemies:
+                enemy.update(player, spells, FIXED_DT)
+            spells.empty()  # só o custo do Bringer, não dos feitiços acumulando
+            combat.clear()  # nem dos golpes inscritos
+        return tick
+
+    if kind == "knight_boss":
+        enemies = [KnightBoss((x, GROUND - 100), GROUND) for x, _ in spread(n)]
+    else:
+        cls = {"skeleton": SkeletonEnemy, "nightborne": NightBorneEnemy}[kind]
+        enemies = [cls(pos) for pos in spread(n)]
+
+    def tick():
+        for enemy in enemies:
+            enemy.update(player, FIXED_DT)
+        combat.clear()  # só o `update`: os golpes inscritos não se acumulam
+    return tick
+
+
+def bench_update(results):
+    for kind in CONSTRUCTORS:
+        for n in COUNTS:
+            # inimigos novos a cada rodada (montados fora do tempo medido):
+            # todas medem os mesmos ticks desde o spawn, e não um estado que
+            # foi mudando entre rodadas (o player parado não muda, e construir
+            # 1.000 deles custa ~15 s)
+            samples = []
+            tick = None
+            for _ in range(ROUNDS):
+                if tick is None or kind != "player":
+                    tick = update_tick(kind, n)
+                gc.collect()
+
+                def run_ticks():
+                    for _ in range(UPDATE_TICKS):
+                        game_clock.advance(FIXED_DT)  # cooldowns andam como no jogo
+                        tick()
+
+                samples.append(timeit(run_ticks) / UPDATE_TICKS)
+            results[f"update.{kind}.{n}"] = summarize(samples)
+
+
+# ------------------------------------------------------------------
+# combate
+# ------------------------------------------------------------------
+def bench_combat(results):
+    resolver = CombatResolver()
+    player = Player((0, 0))
+    player.attack_damage = {"smash": 0, "thrust": 0}  # 0 de dano: ninguém morre entre as rodadas
+    player.state = "smash"
+    player.anim.seek(8)  # quadro do golpe
+    player.rect.midtop = (SCREEN_SIZE[0] // 2, 540)
+    hitbox = Hitbox(player, player.hitbox.tracks, PLAYER, resolver)
+    for n in (100, 1000):
+        enemies = pygame.sprite.Group(SkeletonEnemy(pos) for pos in spread(n))
+
+        def hit():
+            hitbox.reset()  # golpe novo a cada rodada: todo mundo pode levar de novo
+            hitbox.sync(player.anim, player.rect, player.facing_right)
+            resolver.resolve(player, enemies)
+
+        results[f"combat.{n}"] = measure(hit, repeat=20)
+
+
+# ------------------------------------------------------------------
+# desenho
+# ------------------------------------------------------------------
+def bench_render(results):
+    room_manager = RoomManager(*SCREEN_SIZE, music=None)
+    player = make_target()
+    skeletons = [SkeletonEnemy(pos) for pos in spread(6)]
+    boss = KnightBoss((SCREEN_SIZE[0] // 2, GROUND - 100), GROUND)
+
+    for room_id in range(len(room_manager.rooms)):
+        room_manager.current_room = room_id
+        room_manager._load_room(room_id)  # benchmark: sem esperar o streaming
+        sprites = [player]
+        if room_id == 1:
+            sprites += skeletons
+        elif room_id == 2:
+            sprites.append(boss)
+
+        def frames():
+            for _ in range(RENDER_FRAMES):
+                room_manager.draw_room(screen)
+                for sprite in sprites:
+                    sprite.draw(screen)
+                room_manager.draw_foreground(screen)
+                pygame.display.flip()
+
+        results[f"render.room{room_id}"] = summarize(
+            [ms / RENDER_FRAMES for ms in samples_ms(frames, rounds=ROUNDS)]
+        )
+
+
+BENCHMARKS = (bench_construction, bench_update, bench_combat, bench_render)
+
+
+# ------------------------------------------------------------------
+# baseline
+# ------------------------------------------------------------------
+def run_suite():
+    """
+    Roda todos os benchmarks, com a calibração no começo e no fim.
+
+    Returns
+    -------
+    dict
+        `{"meta": ..., "results": nome → {"median", "low", "high"}}`.
+    """
+    start = time.perf_counter()
+    calibration = calibration_samples()
+    results = {}
+    for bench in BENCHMARKS:
+        bench(results)
+    calibration += calibration_samples()
+
+    for name, m in results.items():
+        print(f"{name:<32} {m['median']:>10.3f} ms  [{m['low']:.3f} – {m['high']:.3f}]")
+    print(f"({len(results)} medidas em {time.perf_counter() - start:.1f} s)")
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "rounds": ROUNDS,
+            "calibration_ms": summarize(calibration),
+        },
+        "results": results,
+    }
+
+
+def machine_scale(report, baseline):
+    """Quanto a máquina está mais lenta agora que no baseline (razão das calibrações)."""
+    before = baseline["meta"].get("calibration_ms")
+    if before is None:  # baseline de antes da calibração
+        return 1.0
+    return report["meta"]["calibration_ms"]["median"] / before["median"]
+
+
+def compare(results, baseline, tolerance, scale=1.0):
+    """
+    Compara `results` com `baseline` (ambos nome → `{"median", "low", "high"}`).
+
+    Parameters
+    ----------
+    scale : float, opcional
+        `machine_scale`: as medianas atuais são divididas por ele antes da
+        comparação.
+
+    Returns
+    -------
+    list[tuple[str, float, float]]
+        (nome, limite, mediana atual normalizada) de cada medida acima do
+        `high` do baseline mais a tolerância.
+    """
+    regressions = []
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if not isinstance(before, dict):  # baseline antigo: um número por medida
+            before = {"median": before, "low": before, "high": before}
+        median = current["median"] / scale
+        limit = before["high"] * (1 + tolerance)
+        if median > limit and median - before["high"] > MIN_DELTA_MS:
+            regressions.append((name, limit, median))
+    return regressions
+
+
+def check(report, baseline, tolerance, label):
+    """Imprime o resultado de `compare`; devolve o código de saída (1 = regressão)."""
+    scale = machine_scale(report, baseline)
+    print(f"\nbaseline: {label}; calibração: máquina {scale:.2f}x o tempo do baseline")
+    regressions = compare(report["results"], baseline["results"], tolerance, scale)
+    if regressions:
+        print(f"REGRESSÃO: {len(regressions)} medida(s) acima de "
+              f"+{tolerance:.0%} do high do baseline:")
+        for name, limit, median in regressions:
+            print(f"  {name:<32} limite {limit:>10.3f} → {median:>10.3f} ms "
+                  f"({median / limit - 1:+.0%})")
+        return 1
+    print(f"sem regressões (tolerância +{tolerance:.0%})")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=DEFAULT_OUT,
+                        help=f"JSON com os resultados (padrão: {DEFAULT_OUT})")
+    parser.add_argument("--baseline", help="JSON de uma rodada anterior pra comparar")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="piora relativa aceita antes de falhar (padrão: 0.5 = +50%%)")
+    parser.add_argument("--self-check", action="store_true",
+                        help="roda duas vezes e compara a segunda com a primeira")
+    args = parser.parse_args(argv)
+
+    report = run_suite()
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"resultados em {args.out}")
+
+    if args.self_check:
+        print("\nself-check: segunda rodada, comparada com a primeira")
+        return check(run_suite(), report, args.tolerance, "primeira rodada")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        return check(report, baseline, args.tolerance, args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
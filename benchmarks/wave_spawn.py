@@ -0,0 +1,34 @@
+"""
+Benchmark: custo de spawnar uma wave grande com o `asset_cache`.
+
+Confere que 50 esqueletos custam uma decodificação de cada sheet,
+não cinquenta:
+
+    $ python -m benchmarks.wave_spawn
+"""
+
+from benchmarks._common import init_headless, timeit
+
+init_headless()
+
+from core.asset_cache import asset_cache  # noqa: E402
+from core.skeleton import SkeletonEnemy  # noqa: E402
+
+WAVE_SIZE = 50
+
+
+def main():
+    first = timeit(lambda: SkeletonEnemy((0, 560)))
+    rest = timeit(lambda: SkeletonEnemy((0, 560)), repeat=WAVE_SIZE - 1)
+    stats = asset_cache.stats()
+
+    print(f"1º esqueleto (cold): {first:.2f} ms")
+    print(f"demais {WAVE_SIZE - 1} (warm): {rest:.3f} ms cada")
+    print(
+        f"cache: {stats['misses']} misses, {stats['hits']} hits, "
+        f"{stats['entries']} entradas, {stats['bytes'] / 1024:.0f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
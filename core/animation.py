@@ -0,0 +1,285 @@
+"""
+Máquina de estados de animação com tabelas pré-compiladas (**Animator**).
+
+Cada entidade fazia `frame_index += animation_speed * dt` em float, com
+`int()` pra achar o quadro e um if/elif por estado pra decidir o que
+acontece no fim (volta pro idle, segura o último quadro, some…), e
+eventos como "o Bringer lança o feitiço no quadro 5" viravam flags
+`has_cast_spell` espalhadas pela classe.
+
+Aqui cada estado declara um **clipe** (`Clip`): quantos quadros, a
+velocidade, o que fazer no fim (`LOOP`, `HOLD` ou ir pra outro estado),
+eventos disparados ao entrar num quadro e janelas de quadros marcadas
+(ex.: o golpe do smash acerta nos quadros 8–12). Ao carregar, o clipe é
+compilado pra tabelas por tick — quadro, evento e máscara das janelas
+em cada tick desde o começo do clipe, com a mesma soma em float que o
+`frame_index` fazia, então a sequência de quadros é a mesma. Avançar
+uma entidade vira `tick += 1` e três consultas em tupla, sem alocar
+nada.
+
+Clipes com a mesma velocidade compartilham a linha do tempo: trocar de
+estado sem reiniciar (andar → atacar) mantém o tick, como o
+`frame_index` antigo; com velocidade diferente, o tick é convertido pro
+mesmo ponto da animação.
+
+Uso típico:
+    clips = compile_clips(self.animations, self.clip_data, fps=9)
+    self.anim = Animator(clips, "idle")
+    ...
+    self.anim.play("smash")               # troca de estado
+    if self.anim.advance(dt) == END: ...  # 1x por tick
+    frames[self.anim.frame]
+    self.anim.active("hit")               # janela de dano aberta?
+"""
+
+from bisect import bisect_left
+
+from core.timing import FIXED_DT
+
+LOOP = "loop"    # no fim volta pro quadro 0 (mesmo estado)
+HOLD = "hold"    # no fim segura o último quadro
+END = "end"      # evento devolvido por `advance` quando o clipe chega ao fim
+
+_window_bits = {}  # nome da janela → bit na máscara
+
+
+def window_bit(name):
+    """Bit da janela `name` nas máscaras (`Animator.mask`)."""
+    bit = _window_bits.get(name)
+    if bit is None:
+        bit = _window_bits[name] = 1 << len(_window_bits)
+    return bit
+
+
+# ------------------------------------------------------------------
+# clipes
+# ------------------------------------------------------------------
+class Schedule:
+    """
+    Tabelas de um clipe pra um `dt`, indexadas pelo tick desde o começo do clipe.
+
+    Atributos: `frames` (quadro de cada tick), `events` (evento disparado
+    ao chegar no tick, ou `None`), `masks` (janelas abertas) e `ticks`
+    (duração do clipe em ticks).
+    """
+
+    __slots__ = ("frames", "events", "masks", "ticks")
+
+    def __init__(self, clip, dt):
+        frames = [0]
+        frame = 0.0
+        step = clip.fps * dt
+        while True:
+            frame += step   # mesma soma do `frame_index` antigo, tick a tick
+            if frame >= clip.length:
+                break
+            frames.append(int(frame))
+        self.frames = tuple(frames)
+        self.ticks = len(frames)
+
+        events = clip.events
+        self.events = tuple(
+            events.get(f) if t and f != frames[t - 1] else None
+            for t, f in enumerate(frames)
+        )
+        windows = [(window_bit(name), first, last) for name, (first, last) in clip.windows.items()]
+        self.masks = tuple(
+            sum(bit for bit, first, last in windows if first <= f <= last) for f in frames
+        )
+
+    def seek(self, frame):
+        """Primeiro tick que mostra `frame` (ou depois do fim, se o clipe não chega lá)."""
+        return bisect_left(self.frames, frame)
+
+
+class Clip:
+    """
+    Declaração de uma animação.
+
+    Parâmetros
+    ----------
+    length : int
+        Número de quadros.
+    fps : float
+        Quadros por segundo.
+    end : str, opcional
+        `LOOP`, `HOLD` ou o estado que começa quando este termina.
+    events : dict[int, str], opcional
+        Quadro → evento devolvido por `Animator.advance` ao entrar nele
+        (o quadro 0 não dispara).
+    windows : dict[str, tuple[int, int]], opcional
+        Nome → (primeiro, último) quadro em que a janela fica aberta
+        (`Animator.active`).
+    """
+
+    __slots__ = ("length", "fps", "end", "next", "events", "windows", "_schedules")
+
+    def __init__(self, length, fps, end=LOOP, events=None, windows=None):
+        self.length = length
+        self.fps = fps
+        self.end = end
+        self.next = None if end in (LOOP, HOLD) else end
+        self.events = dict(events or {})
+        self.windows = dict(windows or {})
+        if 0 in self.events:
+            raise ValueError("evento no quadro 0 não dispara (o clipe começa nele)")
+        self._schedules = {}
+        self.schedule(FIXED_DT)  # compilado já no carregamento
+
+    def schedule(self, dt):
+        """Tabelas do clipe pra ticks de `dt` segundos (compiladas 1x por `dt`)."""
+        schedule = self._schedules.get(dt)
+        if schedule is None:
+            schedule = self._schedules[dt] = Schedule(self, dt)
+        return schedule
+
+
+_clip_sets = {}  # (id da declaração, fps, nº de quadros por estado) → clipes
+
+
+def compile_clips(animations, clip_data, fps):
+    """
+    Clipes de cada estado a partir dos frames carregados e da declaração da classe.
+
+    Compartilhados: toda instância da classe (e todo esqueleto da onda)
+    usa as mesmas tabelas.
+
+    Parameters
+    ----------
+    animations : dict[str, Sequence]
+        Estado → frames (só o número de quadros importa).
+    clip_data : dict[str, dict]
+        Estado → argumentos extras do `Clip` (`fps`, `end`, `events`,
+        `windows`); estados ausentes fazem `LOOP` na velocidade padrão.
+    fps : float
+        Velocidade padrão (quadros/s).
+
+    Returns
+    -------
+    dict[str, Clip]
+    """
+    lengths = tuple((state, len(frames)) for state, frames in animations.items())
+    key = (id(clip_data), fps, lengths)
+    clips = _clip_sets.get(key)
+    if clips is None:
+        clips = _clip_sets[key] = {}
+        for state, length in lengths:
+            spec = dict(clip_data.get(state, {}))
+            clips[state] = Clip(length, spec.pop("fps", fps), **spec)
+    return clips
+
+
+# ------------------------------------------------------------------
+# estado de uma entidade
+# ------------------------------------------------------------------
+class Animator:
+    """
+    Estado de animação de uma entidade: clipe atual e tick dentro dele.
+
+    Parâmetros
+    ----------
+    clips : dict[str, Clip]
+        Clipes da entidade (`compile_clips`).
+    state : str
+        Estado inicial.
+
+    Atributos lidos pelas entidades: `state`, `frame` (quadro a desenhar),
+    `tick` e `mask` (janelas abertas; ver `active`).
+    """
+
+    __slots__ = ("clips", "state", "clip", "tick", "frame", "mask", "_schedule", "_dt")
+
+    def __init__(self, clips, state):
+        self.clips = clips
+        self.reset(state)
+
+    def reset(self, state):
+        """Começa `state` do quadro 0 (spawn / reuso pelo `sprite_pools`)."""
+        self.state = state
+        self.clip = self.clips[state]
+        self._dt = FIXED_DT
+        self._schedule = self.clip.schedule(FIXED_DT)
+        self.tick = self.frame = 0
+        self.mask = self._schedule.masks[0]
+
+    def play(self, state):
+        """
+        Troca pro clipe de `state` (nada se já for ele).
+
+        Velocidade igual: continua no mesmo tick (como o `frame_index`
+        antigo, que não zerava na troca). Velocidade diferente: o tick é
+        convertido pra cair no mesmo ponto da animação (ida e volta na
+        mesma troca não perde progresso).
+        """
+        if state == self.state:
+            return
+        clip = self.clips[state]
+        if clip.fps != self.clip.fps:
+            self.tick = int(self.tick * self.clip.fps / clip.fps)
+        self.state, self.clip, self._schedule = state, clip, clip.schedule(self._dt)
+
+    def restart(self):
+        """Volta o clipe atual pro quadro 0."""
+        self.tick = self.frame = 0
+        self.mask = self._schedule.masks[0]
+
+    def seek(self, frame):
+        """Pula pro primeiro tick do clipe atual que mostra `frame`."""
+        schedule = self._schedule
+        self.tick = min(schedule.seek(frame), schedule.ticks - 1)
+        self.frame = schedule.frames[self.tick]
+        self.mask = schedule.masks[self.tick]
+
+    def advance(self, dt=FIXED_DT):
+        """
+        Avança um tick.
+
+        Returns
+        -------
+        str | None
+            `END` se o clipe terminou neste tick (já tratado: voltou pro 0,
+            segurou o último quadro ou trocou pro estado seguinte), o
+            evento do quadro em que entrou, ou `None`.
+        """
+        if dt != self._dt:
+            self._dt = dt
+            self._schedule = self.clip.schedule(dt)
+        schedule = self._schedule
+        tick = self.tick + 1
+        if tick < schedule.ticks:
+            event = schedule.events[tick]
+        else:
+            event = END
+            clip = self.clip
+            if clip.end == HOLD:
+                tick = schedule.ticks - 1
+            else:
+                tick = 0
+                if clip.next is not None:
+                    self.state = clip.next
+                    self.clip = self.clips[clip.next]
+                    schedule = self._schedule = self.clip.schedule(dt)
+        self.tick = tick
+        self.frame = schedule.frames[tick]
+        self.mask = schedule.masks[tick]
+        return event
+
+    def active(self, window):
+        """`True` se a janela `window` está aberta no quadro atual."""
+        return bool(self.mask & window_bit(window))
+
+
+class Animated:
+    """
+    Mixin dos sprites animados: `state` é o estado do `self.anim`.
+
+    Atribuir `sprite.state = "x"` chama `self.anim.play("x")`.
+    """
+
+    @property
+    def state(self):
+        return self.anim.state
+
+    @state.setter
+    def state(self, state):
+        self.anim.play(state)
@@ -0,0 +1,358 @@
+"""
+Cache global de sprites/animações (**AssetCache**) do Hollow Mooni.
+
+Antes cada inimigo fazia `pygame.image.load(...).convert_alpha()` e
+`pygame.transform.scale` em todos os sheets no próprio `__init__`, então
+uma wave com 50 esqueletos decodificava os mesmos PNGs 50 vezes.
+Agora cada lista de frames é montada uma única vez por processo e todas
+as instâncias recebem a mesma tupla (somente leitura).
+
+As chaves são (tipo, caminho, layout dos frames, escala), então dois
+pedidos iguais sempre batem no mesmo registro.
+
+Se existir um pack baked (`tools/bake_assets.py`) e ele estiver em dia
+com os PNGs, os frames saem direto dele, sem decodificar nada; caso
+contrário o cache cai no carregamento normal dos arquivos em `assets/`.
+
+Cada animação já vem com a versão espelhada (`Animation.mirrored`),
+calculada uma vez no load, então virar o personagem é só escolher a
+tupla certa — nada de `pygame.transform.flip` por frame.
+
+Depois de tudo montado, `build_atlas()` troca os frames das animações
+por recortes empacotados num `TextureAtlas` (ver `core.atlas`).
+
+Uso típico:
+    from core.asset_cache import asset_cache
+    frames = asset_cache.sheet("assets/enemies/skeleton/Skeleton Idle.png", 11)
+    image = frames.facing(flip=True)[0]
+    print(asset_cache.stats())
+"""
+
+import os
+
+import pygame
+
+from core.asset_pack import DEFAULT_PACK_PATH, AssetPack
+from core.atlas import AtlasFrame, TextureAtlas
+
+
+class Animation(tuple):
+    """
+    Tupla de frames que carrega junto a versão espelhada horizontalmente.
+
+    `anim[i]` continua funcionando igual a antes (frame original);
+    `anim.mirrored[i]` é o mesmo quadro virado.
+    """
+
+    def __new__(cls, frames, mirrored=None):
+        anim = super().__new__(cls, frames)
+        if mirrored is None:
+            mirrored = [pygame.transform.flip(frame, True, False) for frame in anim]
+        anim.mirrored = tuple(mirrored)
+        return anim
+
+    def facing(self, flip):
+        """Devolve os frames espelhados se `flip`, senão os originais."""
+        return self.mirrored if flip else self
+
+
+class AssetCache:
+    """
+    Registro de animações compartilhado pelo processo inteiro.
+
+    Cada método devolve uma `Animation` (tupla de `pygame.Surface`) — tupla
+    de propósito, pra ninguém dar `append`/`pop` sem querer numa lista que
+    é de todo mundo.
+    """
+
+    def __init__(self, pack_path=DEFAULT_PACK_PATH):
+        self._entries = {}   # chave → Animation (ou tupla p/ imagens soltas)
+        self._sources = {}   # chave → arquivos de origem (usado pelo bake)
+        self._images = {}    # caminho → Surface convertida (sheet inteiro)
+        self._decoded = {}   # caminho → Surface crua, decodificada pelo AssetLoader
+        self.hits = 0
+        self.misses = 0
+        self.pack_hits = 0
+
+        self.pack_path = pack_path
+        self._pack = None
+        self._pack_checked = False
+        self.atlas = None
+
+    # ------------------------------------------------------------------
+    # carregamento bruto
+    # ------------------------------------------------------------------
+    def _decode(self, path):
+        """PNG cru: usa o que o `AssetLoader` já decodificou, senão lê do disco."""
+        surface = self._decoded.pop(path, None)
+        if surface is None:
+            surface = pygame.image.load(path)
+        return surface
+
+    def _load_image(self, path):
+        """Decodifica o PNG só uma vez (ex.: `Attacks.png` do Knight tem 2 linhas)."""
+        image = self._images.get(path)
+        if image is None:
+            image = self._decode(path).convert_alpha()
+            self._images[path] = image
+        return image
+
+    def add_decoded(self, path, surface):
+        """
+        Guarda um PNG já decodificado fora da thread principal.
+
+        Só a conversão pro formato da tela (`convert`/`convert_alpha`)
+        fica pra thread principal, quando o frame for montado.
+        """
+        self._decoded[path] = surface
+
+    def is_baked(self, path):
+        """`True` se o pack baked tem `path` em dia (aí nem precisa decodificar)."""
+        pack = self.get_pack()
+        return pack is not None and pack.covers(path)
+
+    def get_pack(self):
+        """Abre o pack na primeira necessidade (só uma tentativa por processo)."""
+        if not self._pack_checked:
+            self._pack_checked = True
+            if self.pack_path:
+                self._pack = AssetPack.open(self.pack_path)
+        return self._pack
+
+    def _get(self, key, build, sources, mirror=True):
+        """
+        Devolve o registro de `key` ou constrói no primeiro pedido.
+
+        Ordem de tentativa: cache em memória → pack baked → `build()`.
+        """
+        frames = self._entries.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+        self.misses += 1
+
+        pack = self.get_pack()
+        raw = pack.frames(key) if pack else None
+        if raw is not None:
+            self.pack_hits += 1
+        else:
+            raw = build()
+
+        frames = Animation(raw) if mirror else tuple(raw)
+        self._entries[key] = frames
+        self._sources[key] = tuple(sources)
+        return frames
+
+    # ------------------------------------------------------------------
+    # layouts de sprite-sheet
+    # ------------------------------------------------------------------
+    def sheet(self, path, num_frames, scale=2):
+        """
+        Sprite-sheet horizontal com `num_frames` quadros (Player, Skeleton).
+
+        Returns
+        -------
+        Animation
+            Frames já escalonados por `scale` (+ espelhados).
+        """
+        def build():
+            sheet = self._load_image(path)
+            frame_width = sheet.get_width() // num_frames
+            height = sheet.get_height()
+            return [
+                pygame.transform.scale(
+                    sheet.subsurface(i * frame_width, 0, frame_width, height),
+                    (frame_width * scale, height * scale),
+                )
+                for i in range(num_frames)
+            ]
+
+        return self._get(("sheet", path, num_frames, scale), build, [path])
+
+    def grid(self, path, frame_size, num_frames, cols, row=0, scale=2):
+        """
+        Sheet em grade fixa (KnightBoss, NightBorne).
+
+        Parameters
+        ----------
+        path : str
+            Caminho do sheet.
+        frame_size : tuple[int, int]
+            Largura e altura de cada quadro no sheet original.
+        num_frames : int
+            Total de quadros a extrair.
+        cols : int
+            Quantas colunas a grade possui.
+        row : int, opcional
+            Linha inicial (0 = topo).
+        scale : int, opcional
+            Fator de escala dos quadros.
+        """
+        def build():
+            sheet = self._load_image(path)
+            width, height = frame_size
+            frames = []
+            for i in range(num_frames):
+                x = (i % cols) * width
+                y = (row + i // cols) * height
+                frame = sheet.subsurface((x, y, width, height))
+                frames.append(pygame.transform.scale(frame, (width * scale, height * scale)))
+            return frames
+
+        key = ("grid", path, frame_size, num_frames, cols, row, scale)
+        return self._get(key, build, [path])
+
+    def folder(self, folder_path, scale=1.0):
+        """
+        Um PNG por quadro dentro de `folder_path` (Bringer of Death).
+
+        A ordem é a de `sorted(os.listdir())`, igual ao carregamento antigo.
+        """
+        files = [
+            os.path.join(folder_path, filename)
+            for filename in sorted(os.listdir(folder_path))
+            if filename.endswith(".png")
+        ]
+
+        def build():
+            frames = []
+            for path in files:
+                image = self._decode(path).convert_alpha()
+                if scale != 1.0:
+                    new_size = (
+                        int(image.get_width() * scale),
+                        int(image.get_height() * scale),
+                    )
+                    image = pygame.transform.scale(image, new_size)
+                frames.append(image)
+            return frames
+
+        return self._get(("folder", folder_path, scale), build, files)
+
+    def image(self, path, size=None, alpha=False):
+        """
+        Imagem solta (fundos de sala, tela inicial, lore), escalada pra `size`.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do PNG.
+        size : tuple[int, int], opcional
+            Tamanho final; `None` mantém o original.
+        alpha : bool, opcional
+            `True` usa `convert_alpha` (foregrounds), senão `convert`.
+
+        Returns
+        -------
+        pygame.Surface
+            Surface pronta pra blit (sem versão espelhada).
+        """
+        def build():
+            img = self._decode(path)
+            img = img.convert_alpha() if alpha else img.convert()
+            if size is not None and img.get_size() != size:  # o loader já pode ter escalado
+                img = pygame.transform.scale(img, size)
+            return [img]
+
+        key = ("image", path, size, alpha)
+        return self._get(key, build, [path], mirror=False)[0]
+
+    def release_image(self, path, size=None, alpha=False):
+        """Esquece uma imagem de `image()` (usado pelo streaming de salas)."""
+        key = ("image", path, size, alpha)
+        self._entries.pop(key, None)
+        self._sources.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # atlas
+    # ------------------------------------------------------------------
+    def build_atlas(self, atlas=None):
+        """
+        Empacota os frames de todas as animações montadas até agora num atlas.
+
+        As `Animation` do cache passam a ter `AtlasFrame` no lugar das
+        Surfaces (as duas direções), e os sheets inteiros são soltos. Só
+        entidades montadas *depois* pegam os frames novos — chame no
+        carregamento, antes de criar a partida. Animações pedidas depois
+        disso continuam como Surfaces comuns (e desenham igual).
+
+        Parameters
+        ----------
+        atlas : TextureAtlas, opcional
+            Atlas de destino (padrão = um novo).
+
+        Returns
+        -------
+        TextureAtlas
+        """
+        atlas = atlas or TextureAtlas()
+        keys = [
+            key for key, frames in self._entries.items()
+            if isinstance(frames, Animation) and frames and type(frames[0]) is not AtlasFrame
+        ]
+        surfaces = []
+        for key in keys:
+            surfaces.extend(self._entries[key])
+            surfaces.extend(self._entries[key].mirrored)
+        packed = iter(atlas.pack(surfaces))
+        for key in keys:
+            n = len(self._entries[key])
+            frames = [next(packed) for _ in range(n)]
+            mirrored = [next(packed) for _ in range(n)]
+            self._entries[key] = Animation(frames, mirrored)
+        self._images.clear()
+        self.atlas = atlas
+        return atlas
+
+    def items(self):
+        """Itera (chave, arquivos de origem, frames) de tudo que já foi montado."""
+        for key, frames in self._entries.items():
+            yield key, self._sources[key], frames
+
+    # ------------------------------------------------------------------
+    # estatísticas
+    # ------------------------------------------------------------------
+    def bytes_held(self):
+        """Total aproximado de bytes de pixel mantidos pelo cache (frames + sheets)."""
+        surfaces = list(self._images.values())
+        for frames in self._entries.values():
+            surfaces.extend(frames)
+            surfaces.extend(getattr(frames, "mirrored", ()))
+        total = sum(
+            s.get_bytesize() * s.get_width() * s.get_height()
+            for s in surfaces if type(s) is not AtlasFrame
+        )
+        return total + (self.atlas.bytes_held() if self.atlas else 0)
+
+    def stats(self):
+        """
+        Retorna contadores do cache.
+
+        Returns
+        -------
+        dict
+            `hits`, `misses`, `pack_hits` (misses servidos pelo pack baked),
+            `entries` e `bytes` (pixels dos frames em memória).
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "pack_hits": self.pack_hits,
+            "entries": len(self._entries),
+            "bytes": self.bytes_held(),
+        }
+
+    def clear(self):
+        """Esvazia o cache e zera os contadores."""
+        self._entries.clear()
+        self._sources.clear()
+        self._images.clear()
+        self._decoded.clear()
+        self.atlas = None
+        self.hits = 0
+        self.misses = 0
+        self.pack_hits = 0
+
+
+# instância única, compartilhada por todas as entidades
+asset_cache = AssetCache()
@@ -0,0 +1,118 @@
+"""
+Carregador de assets em segundo plano (**AssetLoader**) do Hollow Mooni.
+
+Decodificar PNG é a parte cara do start, e não precisa da janela: então
+as threads do loader só leem e decodificam os arquivos (`pygame.image.load`
+sem `convert`), e a thread principal, frame a frame, entrega o resultado
+pro `asset_cache`. A conversão pro formato da tela (`convert_alpha`)
+continua acontecendo na thread principal, quando a entidade é montada.
+
+Uso típico (no main):
+    loader = AssetLoader()
+    loader.request_many(paths)
+    while not loader.done:
+        loader.poll()
+        desenha_barra(loader.progress)
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from core.asset_cache import asset_cache
+
+
+class AssetLoader:
+    """
+    Fila de decodificação de imagens fora da thread principal.
+
+    Parâmetros
+    ----------
+    workers : int, opcional
+        Quantas threads decodificam em paralelo (padrão = 2).
+    cache : AssetCache, opcional
+        Pra onde vão as imagens prontas (padrão = `asset_cache` global).
+    """
+
+    def __init__(self, workers=2, cache=asset_cache):
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self._pending = []   # (caminho, future)
+        self.total = 0
+        self.loaded = 0
+
+    # ------------------------------------------------------------------
+    # pedidos
+    # ------------------------------------------------------------------
+    def _decode(self, path, size):
+        """Roda na thread do loader: decodifica e escala (ou pula, se o pack já tiver)."""
+        if self.cache.is_baked(path):
+            return None
+        surface = pygame.image.load(path)
+        if size is not None and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    def request(self, path, size=None):
+        """
+        Agenda a decodificação de `path`.
+
+        Parameters
+        ----------
+        path : str
+            PNG a decodificar.
+        size : tuple[int, int], opcional
+            Se informado, a thread já entrega a imagem escalada (fundos de sala).
+        """
+        self.cache.get_pack()  # abre o pack aqui, na thread principal
+        self._pending.append((path, self._executor.submit(self._decode, path, size)))
+        self.total += 1
+
+    def request_many(self, paths, size=None):
+        """Agenda vários caminhos de uma vez (duplicados são ignorados)."""
+        seen = set()
+        for path in paths:
+            if path not in seen:
+                seen.add(path)
+                self.request(path, size)
+
+    # ------------------------------------------------------------------
+    # consumo (thread principal)
+    # ------------------------------------------------------------------
+    def poll(self, budget_ms=4):
+        """
+        Entrega pro cache o que já ficou pronto, sem passar de `budget_ms`.
+
+        Erros de leitura sobem aqui mesmo, na thread principal, igual
+        aconteceria com o `pygame.image.load` direto.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        still_pending = []
+        for path, future in self._pending:
+            if future.done() and time.perf_counter() < deadline:
+                surface = future.result()
+                if surface is not None:
+                    self.cache.add_decoded(path, surface)
+                self.loaded += 1
+            else:
+                still_pending.append((path, future))
+        self._pending = still_pending
+
+    def is_pending(self, path):
+        """`True` se `path` ainda não foi entregue pro cache."""
+        return any(pending == path for pending, _ in self._pending)
+
+    @property
+    def done(self):
+        """`True` quando tudo que foi pedido já chegou no cache."""
+        return not self._pending
+
+    @property
+    def progress(self):
+        """Fração (0.0–1.0) dos arquivos já entregues."""
+        return self.loaded / self.total if self.total else 1.0
+
+    def shutdown(self):
+        """Encerra as threads (não espera o que ainda estiver na fila)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,172 @@
+"""
+Pacote de assets pré-processados (**AssetPack**) do Hollow Mooni.
+
+O `tools/bake_assets.py` monta todas as animações e fundos do jogo
+(já cortados e escalonados) e grava os pixels crus num único arquivo
+binário com índice. Em runtime o arquivo é aberto com `mmap` e cada
+frame vira Surface direto do buffer — zero decodificação de PNG.
+
+Formato do arquivo
+------------------
+    b"HMPK" | versão (u32) | tamanho do índice (u32) | índice JSON | pixels
+
+O índice guarda, pra cada chave do `AssetCache`, os arquivos de origem
+e a posição/tamanho/formato de cada frame no blob de pixels, além do
+SHA-1 de cada arquivo de origem. Se algum PNG mudou depois do bake, o
+hash não bate e aquela entrada cai de volta pro carregamento normal.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+MAGIC = b"HMPK"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+DEFAULT_PACK_PATH = "assets/baked.pack"
+
+
+def file_hash(path):
+    """SHA-1 do conteúdo de `path` (usado pra detectar pack desatualizado)."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def key_to_str(key):
+    """Serializa uma chave do `AssetCache` (tupla de str/int/float) pro índice."""
+    return repr(key)
+
+
+class AssetPack:
+    """
+    Pack aberto via `mmap`, somente leitura.
+
+    Parâmetros
+    ----------
+    path : str
+        Caminho do arquivo gerado pelo bake.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: pack inválido ou de outra versão")
+
+        start = HEADER.size
+        index = json.loads(bytes(self._mmap[start:start + index_len]).decode("utf-8"))
+        self.entries = index["entries"]
+        self.hashes = index["hashes"]
+        self.blob_offset = start + index_len
+
+        self._fresh = {}  # caminho → hash atual confere com o do bake?
+        self.stale = 0
+
+    @classmethod
+    def open(cls, path=DEFAULT_PACK_PATH):
+        """Abre o pack se ele existir e for válido; senão devolve `None`."""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+    # ------------------------------------------------------------------
+    # leitura
+    # ------------------------------------------------------------------
+    def _source_is_fresh(self, path):
+        fresh = self._fresh.get(path)
+        if fresh is None:
+            try:
+                fresh = file_hash(path) == self.hashes.get(path)
+            except OSError:
+                fresh = False
+            self._fresh[path] = fresh
+        return fresh
+
+    def covers(self, path):
+        """`True` se `path` foi baked e continua com o mesmo conteúdo."""
+        return path in self.hashes and self._source_is_fresh(path)
+
+    def frames(self, key):
+        """
+        Devolve os frames baked de `key`, ou `None` se faltar/estiver velho.
+
+        Returns
+        -------
+        list[pygame.Surface] | None
+            Surfaces já convertidas pro formato da tela.
+        """
+        entry = self.entries.get(key_to_str(key))
+        if entry is None:
+            return None
+        if not all(self._source_is_fresh(src) for src in entry["sources"]):
+            self.stale += 1
+            return None
+
+        view = memoryview(self._mmap)
+        frames = []
+        for offset, width, height, fmt in entry["frames"]:
+            start = self.blob_offset + offset
+            size = width * height * len(fmt)
+            surface = pygame.image.frombuffer(view[start:start + size], (width, height), fmt)
+            frames.append(surface.convert_alpha() if fmt == "RGBA" else surface.convert())
+        return frames
+
+    def close(self):
+        """Fecha o `mmap` e o arquivo."""
+        self._mmap.close()
+        self._file.close()
+
+    # ------------------------------------------------------------------
+    # escrita (usada pelo bake)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def write(path, entries):
+        """
+        Grava um pack novo.
+
+        Parameters
+        ----------
+        path : str
+            Arquivo de saída.
+        entries : iterable[tuple[tuple, list[str], Sequence[pygame.Surface]]]
+            Trios (chave do cache, arquivos de origem, frames).
+        """
+        index = {"entries": {}, "hashes": {}}
+        blobs = []
+        offset = 0
+        for key, sources, frames in entries:
+            records = []
+            for frame in frames:
+                fmt = "RGBA" if frame.get_flags() & pygame.SRCALPHA else "RGB"
+                data = pygame.image.tobytes(frame, fmt)
+                records.append([offset, frame.get_width(), frame.get_height(), fmt])
+                blobs.append(data)
+                offset += len(data)
+            index["entries"][key_to_str(key)] = {"sources": list(sources), "frames": records}
+            for src in sources:
+                if src not in index["hashes"]:
+                    index["hashes"][src] = file_hash(src)
+
+        raw_index = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(raw_index)))
+            f.write(raw_index)
+            for data in blobs:
+                f.write(data)
+        os.replace(tmp_path, path)
+        return offset
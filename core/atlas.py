@@ -0,0 +1,169 @@
+"""
+Atlas de texturas (**TextureAtlas**) das animações do Hollow Mooni.
+
+Cada frame do `asset_cache` era uma Surface própria, do tamanho da
+célula do sprite-sheet — e a maior parte dessas células é transparente
+(o quadro do Mooni tem 288×288 px, mas o desenho ocupa ~3% disso). Todo
+`blit` ainda assim mistura a célula inteira.
+
+O atlas corta cada frame (as duas direções) no retângulo que tem pixel
+visível e empacota os recortes em poucas páginas grandes (prateleiras,
+mais altos primeiro). No lugar da Surface, o cache passa a entregar um
+`AtlasFrame`: mesmo tamanho lógico (então `get_rect`, colisão e âncoras
+não mudam), mais a página, o retângulo dentro dela e o deslocamento do
+recorte. O desenho vira itens `(página, destino, área)` e cada camada
+da tela sai num único `Surface.blits` (ver `blit_item`).
+
+Uso típico (no carregamento, depois de montar as entidades uma vez):
+    asset_cache.build_atlas()
+    ...
+    screen.blits([enemy.blit_item(alpha) for enemy in enemies])
+"""
+
+import pygame
+
+PAGE_SIZE = (1024, 1024)
+
+
+class AtlasFrame:
+    """
+    Frame de animação guardado numa página do atlas.
+
+    Imita a parte da API de `pygame.Surface` que a lógica usa
+    (`get_size`, `get_width`, `get_height`, `get_rect`); pra desenhar,
+    use `blit_item`.
+
+    Parâmetros
+    ----------
+    page : pygame.Surface
+        Página do atlas onde está o recorte.
+    area : pygame.Rect
+        Recorte dentro da página.
+    offset : tuple[int, int]
+        Posição do recorte dentro do frame original.
+    size : tuple[int, int]
+        Tamanho do frame original (células do sprite-sheet).
+    """
+
+    __slots__ = ("page", "area", "offset_x", "offset_y", "width", "height")
+
+    def __init__(self, page, area, offset, size):
+        self.page = page
+        self.area = area
+        self.offset_x, self.offset_y = offset
+        self.width, self.height = size
+
+    def get_size(self):
+        return (self.width, self.height)
+
+    def get_width(self):
+        return self.width
+
+    def get_height(self):
+        return self.height
+
+    def get_rect(self, **kwargs):
+        """`Rect` do tamanho do frame original, posicionado como em `Surface.get_rect`."""
+        rect = pygame.Rect(0, 0, self.width, self.height)
+        for attr, value in kwargs.items():
+            setattr(rect, attr, value)
+        return rect
+
+
+def blit_item(image, pos):
+    """
+    Item de `Surface.blits` que desenha `image` com o canto em `pos`.
+
+    Parameters
+    ----------
+    image : AtlasFrame | pygame.Surface
+        Frame do atlas ou Surface comum (frames montados fora do atlas).
+    pos : pygame.Rect | tuple[int, int]
+        Canto superior esquerdo do frame original.
+    """
+    if type(image) is AtlasFrame:
+        x, y = pos[0], pos[1]
+        return (image.page, (x + image.offset_x, y + image.offset_y), image.area)
+    return (image, pos)
+
+
+class TextureAtlas:
+    """
+    Páginas de frames recortados, empacotados em prateleiras.
+
+    Parâmetros
+    ----------
+    page_size : tuple[int, int], opcional
+        Tamanho de cada página (precisa caber o maior recorte).
+    """
+
+    def __init__(self, page_size=PAGE_SIZE):
+        self.page_size = page_size
+        self.pages = []
+        self.frames = 0
+        self.source_pixels = 0   # pixels dos frames originais
+        self.packed_pixels = 0   # pixels dos recortes nas páginas
+
+    def _new_page(self):
+        page = pygame.Surface(self.page_size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        return page
+
+    def pack(self, surfaces):
+        """
+        Empacota `surfaces` e devolve um `AtlasFrame` pra cada uma (mesma ordem).
+
+        Surfaces repetidas viram o mesmo `AtlasFrame`.
+        """
+        unique = list({id(s): s for s in surfaces}.values())
+        trims = {id(s): s.get_bounding_rect() for s in unique}
+        unique.sort(key=lambda s: (trims[id(s)].height, trims[id(s)].width), reverse=True)
+
+        page_w, page_h = self.page_size
+        packed = {}
+        page = None
+        x = y = shelf_h = 0
+        for surface in unique:
+            trim = trims[id(surface)]
+            if trim.width > page_w or trim.height > page_h:
+                raise ValueError(f"frame de {trim.size} não cabe na página {self.page_size}")
+            if x + trim.width > page_w:          # prateleira cheia: sobe a próxima
+                x, y, shelf_h = 0, y + shelf_h, 0
+            if page is None or y + trim.height > page_h:
+                page = self._new_page()
+                x = y = shelf_h = 0
+            area = pygame.Rect(x, y, trim.width, trim.height)
+            # página zerada + MAX = cópia exata (um blit normal misturaria o alpha)
+            page.blit(surface, area, trim, special_flags=pygame.BLEND_RGBA_MAX)
+            packed[id(surface)] = AtlasFrame(page, area, trim.topleft, surface.get_size())
+            x += trim.width
+            shelf_h = max(shelf_h, trim.height)
+            self.frames += 1
+            self.source_pixels += surface.get_width() * surface.get_height()
+            self.packed_pixels += trim.width * trim.height
+        return [packed[id(s)] for s in surfaces]
+
+    def bytes_held(self):
+        """Bytes de pixel das páginas."""
+        return sum(p.get_bytesize() * p.get_width() * p.get_height() for p in self.pages)
+
+    def stats(self):
+        """
+        Retorna contadores do atlas.
+
+        Returns
+        -------
+        dict
+            `pages`, `frames`, `source_pixels` (frames originais),
+            `packed_pixels` (recortes) e `bytes` (páginas).
+        """
+        return {
+            "pages": len(self.pages),
+            "frames": self.frames,
+            "source_pixels": self.source_pixels,
+            "packed_pixels": self.packed_pixels,
+            "bytes": self.bytes_held(),
+        }
@@ -1,23 +1,34 @@
 """
 Módulo que define o inimigo **Bringer of Death**.
 
-Ele persegue o player, ataca corpo a corpo se chegar perto e,
-caso contrário, lança um feitiço à distância. Usa animações
+Ele persegue o player, ataca corpo a corpo se chegar perto (hitbox de
+`hitbox_data`, resolvido pelo `core.combat`) e, caso contrário, lança
+um feitiço à distância. Usa animações
 carregadas de subpastas em `assets/enemies/bringer/`.
 
 Fluxo básico dentro do jogo:
 ----------------------------
 1. `update()` calcula lógica de movimento/estado.  
-2. `animate()` avança quadros, dispara ataque/dano ou feitiço.  
+2. `animate()` avança quadros e dispara o feitiço; o golpe vira hitbox.  
 3. `draw()` renderiza o frame atual no `surface` recebido.
 """
 
 import pygame
 import os
+from core.animation import HOLD, Animated, Animator, compile_clips
+from core.asset_cache import asset_cache
+from core.atlas import blit_item
+from core.clock import game_clock
+from core.combat import ENEMY, Hitbox, compile_hitboxes
+from core.event_log import event_log
+from core.pool import sprite_pools
 from core.spell_effect import SpellEffect
+from core.timing import FIXED_DT, interpolate
 
+combat_log = event_log.channel("combat")
 
-class BringerOfDeathEnemy(pygame.sprite.Sprite):
+
+class BringerOfDeathEnemy(Animated, pygame.sprite.Sprite):
     """
     Inimigo “Bringer of Death”.
 
@@ -29,43 +40,73 @@ class BringerOfDeathEnemy(pygame.sprite.Sprite):
         Fator de escala para as sprites (padrão = 1.0).
     """
 
+    base_path = "assets/enemies/bringer"
+
+    # estado → subpasta com um PNG por quadro
+    animation_folders = {
+        "idle": "Idle",
+        "walk": "Walk",
+        "attack": "Attack",
+        "hurt": "Hurt",
+        "death": "Death",
+        "cast": "Cast",
+        "spell": "Spell",
+    }
+
+    # clipes (ver `core.animation`): o feitiço sai no quadro 5
+    animation_fps = 21  # quadros/s
+    clip_data = {
+        "cast": {"end": "idle", "events": {5: "cast"}},
+        "attack": {"end": "idle"},
+        "hurt": {"fps": 4.2, "end": "idle"},
+        "death": {"fps": 4.2, "end": HOLD},  # some `corpse_ms` depois de morrer
+    }
+    corpse_ms = 1000
+
+    # golpe (ver `core.combat`): o rastro da foice nos quadros 5–7, do lado
+    # pra onde ele olha (o corpo fica atrás do centro do quadro)
+    hitbox_data = {
+        "attack": {"frames": (5, 7), "anchor": "midbottom", "rect": (-20, -56, 90, 56)},
+    }
+
     def __init__(self, pos, scale=1.0):
         super().__init__()
+        self.scale = None
+        self.reset(pos, scale)
+
+    def reset(self, pos, scale=1.0):
+        """
+        Volta ao estado de spawn em `pos` (reuso pelo `sprite_pools`).
 
-        self.speed = 1
+        As animações só são carregadas de novo se a escala mudar.
+        """
+        self.speed = 60  # px/s
         self.max_health = 100
         self.health = self.max_health
-        self.damage = 15
+        self.attack_damage = {"attack": 15}  # dano por golpe de `hitbox_data`
         self.attack_cooldown = 1500  # ms entre ataques
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = game_clock.get_ticks()
         self.facing_right = True
-        self.has_cast_spell = False
-        self.has_attacked = False
-        self.scale = scale
-        self.recently_hit = False
-
-        base_path = "assets/enemies/bringer"
-
-        # Carrega todas as animações em um dicionário
-        self.animations = {
-            "idle": self.load_animation_from_folder(os.path.join(base_path, "Idle")),
-            "walk": self.load_animation_from_folder(os.path.join(base_path, "Walk")),
-            "attack": self.load_animation_from_folder(os.path.join(base_path, "Attack")),
-            "hurt": self.load_animation_from_folder(os.path.join(base_path, "Hurt")),
-            "death": self.load_animation_from_folder(os.path.join(base_path, "Death")),
-            "cast": self.load_animation_from_folder(os.path.join(base_path, "Cast")),
-            "spell": self.load_animation_from_folder(os.path.join(base_path, "Spell")),
-        }
-
-        self.state = "idle"
-        self.frame_index = 0
-        self.animation_speed = 0.35
-        self.death_animation_speed = 0.07
-        self.hurt_animation_speed = 0.07
-        self.image = self.animations[self.state][int(self.frame_index)]
+
+        if scale != self.scale:
+            self.scale = scale
+            # Carrega todas as animações em um dicionário
+            self.animations = {
+                state: self.load_animation_from_folder(os.path.join(self.base_path, folder))
+                for state, folder in self.animation_folders.items()
+            }
+            self.anim = Animator(
+                compile_clips(self.animations, self.clip_data, self.animation_fps), "idle"
+            )
+            self.hitbox = Hitbox(self, compile_hitboxes(self.anim.clips, self.hitbox_data), ENEMY)
+
+        self.anim.reset("idle")
+        self.hitbox.reset()
+        self.image = self.animations["idle"][0]
 
         ajuste_altura = 40  # centraliza o pé da sprite com o chão
         self.rect = self.image.get_rect(midbottom=(pos[0], pos[1] - ajuste_altura))
+        self.prev_anchor = None  # midbottom do tick anterior (interpolação)
 
         self.death_timer = None
 
@@ -79,27 +120,17 @@ class BringerOfDeathEnemy(pygame.sprite.Sprite):
 
         Retorna
         -------
-        list[pygame.Surface]
-            Quadros sequenciais já redimensionados (se `scale` ≠ 1.0).
+        tuple[pygame.Surface]
+            Quadros sequenciais já redimensionados (se `scale` ≠ 1.0),
+            compartilhados via `asset_cache`.
         """
-        frames = []
-        for filename in sorted(os.listdir(folder_path)):
-            if filename.endswith(".png"):
-                image = pygame.image.load(os.path.join(folder_path, filename)).convert_alpha()
-                if self.scale != 1.0:
-                    new_size = (
-                        int(image.get_width() * self.scale),
-                        int(image.get_height() * self.scale),
-                    )
-                    image = pygame.transform.scale(image, new_size)
-                frames.append(image)
-        return frames
+        return asset_cache.folder(folder_path, self.scale)
 
     # ---------------------------------------------------------------------
     # Loop principal do inimigo
     # ---------------------------------------------------------------------
 
-    def update(self, player, spell_group):
+    def update(self, player, spell_group, dt=FIXED_DT):
         """
         Atualiza estado, movimento e decide se ataca/casta.
 
@@ -109,6 +140,8 @@ class BringerOfDeathEnemy(pygame.sprite.Sprite):
             Instância do jogador (usada para distância e colisão).
         spell_group : pygame.sprite.Group
             Grupo onde novos feitiços serão inseridos.
+        dt : float, opcional
+            Duração do tick em segundos.
         """
         if self.health > 0 and self.state not in ["cast", "attack", "hurt", "death"]:
             distance = player.rect.centerx - self.rect.centerx
@@ -117,41 +150,37 @@ class BringerOfDeathEnemy(pygame.sprite.Sprite):
 
             # Sempre anda em direção ao player
             self.state = "walk"
-            self.rect.x += direction * self.speed
+            self.rect.x += direction * self.speed * dt
 
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
 
             if abs(distance) < 100:
                 # Ataque corpo a corpo
                 if now - self.last_attack_time > self.attack_cooldown:
                     self.state = "attack"
-                    self.frame_index = 0
-                    self.has_attacked = False
+                    self.anim.restart()
                     self.last_attack_time = now
             else:
                 # Lança feitiço à distância
                 if now - self.last_attack_time > self.attack_cooldown:
                     self.state = "cast"
-                    self.frame_index = 0
-                    self.has_cast_spell = False
+                    self.anim.restart()
                     self.last_attack_time = now
 
-        self.animate(player, spell_group)
+        self.animate(player, spell_group, dt)
+        # golpe ativo neste quadro? (o `Game` resolve o dano no fim do tick)
+        self.hitbox.sync(self.anim, self.rect, self.facing_right)
 
     # ---------------------------------------------------------------------
     # Ações
     # ---------------------------------------------------------------------
 
-    def attack(self, player):
-        """Causa dano direto ao player."""
-        player.take_damage(self.damage)
-
     def cast_spell(self, player, spell_group):
         """Instancia um feitiço direcionado ao player."""
         spell_pos = (player.rect.centerx, player.rect.top - 20)
-        spell = SpellEffect(spell_pos, self.animations["spell"])
+        spell = sprite_pools.acquire(SpellEffect, spell_pos, self.animations["spell"])
         spell_group.add(spell)
-        print("Bringer lançou feitiço no player!")  # debug maroto
+        combat_log.info("cast", "bringer")
 
     def take_damage(self, amount):
         """
@@ -162,75 +191,44 @@ class BringerOfDeathEnemy(pygame.sprite.Sprite):
         amount : int
             Quantidade de dano.
         """
+        if self.state == "death":
+            return  # já morto: não reinicia o timer de morte
         self.health -= amount
-        print(f"Bringer HP: {self.health}")  # feedback rápido no console
+        combat_log.info("hit", "bringer", amount, self.health)
         if self.health <= 0:
             self.state = "death"
-            self.frame_index = 0
-            self.death_timer = pygame.time.get_ticks()
+            self.anim.restart()
+            self.death_timer = game_clock.get_ticks()
         else:
             if self.state != "hurt":
                 self.state = "hurt"
-                self.frame_index = 0
+                self.anim.restart()
 
     # ---------------------------------------------------------------------
     # Animação e renderização
     # ---------------------------------------------------------------------
 
-    def animate(self, player, spell_group):
+    def animate(self, player, spell_group, dt=FIXED_DT):
         """
-        Controla avanço de quadros e transições de estado.
+        Avança um tick do clipe atual e reage aos eventos dele (feitiço).
 
-        Chamado a cada frame pelo `update()` do jogo.
+        Chamado a cada tick pelo `update()` do jogo; os fins de clipe
+        (volta pro idle, morte parada no último quadro) estão em `clip_data`.
         """
-        frames = self.animations[self.state]
-
-        # Velocidades diferentes pra cada estado
-        if self.state == "death":
-            self.frame_index += self.death_animation_speed
-        elif self.state == "hurt":
-            self.frame_index += self.hurt_animation_speed
-        else:
-            self.frame_index += self.animation_speed
-
-        # Lógica específica de cada estado
-        if self.state == "cast":
-            if not self.has_cast_spell and int(self.frame_index) == 5:
-                self.cast_spell(player, spell_group)
-                self.has_cast_spell = True
-            if self.frame_index >= len(frames):
-                self.frame_index = 0
-                self.state = "idle"
-
-        elif self.state == "attack":
-            if not self.has_attacked and int(self.frame_index) == 5:
-                self.attack(player)
-                self.has_attacked = True
-            if self.frame_index >= len(frames):
-                self.frame_index = 0
-                self.state = "idle"
-                self.has_attacked = False
-
-        elif self.state == "hurt":
-            if self.frame_index >= len(frames):
-                self.frame_index = 0
-                self.state = "idle"
-
-        elif self.state == "death":
-            if pygame.time.get_ticks() - self.death_timer > 1000:
-                self.kill()
-
-        else:  # idle, walk...
-            if self.frame_index >= len(frames):
-                self.frame_index = 0
-
-        # Seleciona o frame e aplica flip se necessário
-        image = frames[int(self.frame_index)]
-        if self.facing_right:
-            image = pygame.transform.flip(image, True, False)
-
-        self.image = image
-
-    def draw(self, surface):
-        """Desenha o frame atual na tela."""
-        surface.blit(self.image, self.rect)
+        anim = self.anim
+        event = anim.advance(dt)
+        if event == "cast":
+            self.cast_spell(player, spell_group)
+        elif anim.state == "death" and game_clock.get_ticks() - self.death_timer > self.corpse_ms:
+            self.kill()
+
+        # Seleciona o frame (a arte original olha pra esquerda)
+        self.image = self.animations[anim.state].facing(self.facing_right)[anim.frame]
+
+    def draw(self, surface, alpha=1.0):
+        """Desenha o frame atual (interpolado por `alpha`) e devolve o `Rect` afetado."""
+        return surface.blit(*self.blit_item(alpha))
+
+    def blit_item(self, alpha=1.0):
+        """Item `(imagem, destino[, área])` deste frame pro `Surface.blits` da camada."""
+        return blit_item(self.image, interpolate(self.rect, self.prev_anchor, alpha))
@@ -0,0 +1,104 @@
+"""
+Relógio de jogo (**GameClock**) do Hollow Mooni.
+
+Cooldowns, invulnerabilidade e timers de morte leem o tempo daqui em vez
+de `pygame.time.get_ticks()`. Esse relógio só anda quando a simulação
+avança um tick (`Game.update`), então uma partida headless rodando a
+centenas de vezes o tempo real tem exatamente os mesmos cooldowns que
+uma partida na tela.
+
+Ele também decide quantos ticks cada frame da tela roda (`ticks`):
+pausado, nenhum (só os passos manuais pedidos com `step`); com
+`time_scale`, mais ou menos ticks por segundo real — o jogo acelera ou
+desacelera sem mudar o `dt` de cada tick.
+
+Uso típico (dentro das entidades):
+    from core.clock import game_clock
+    now = game_clock.get_ticks()
+
+No loop principal:
+    for dt in game_clock.ticks(timestep, frame_time):
+        game.update(keys, dt)
+"""
+
+MIN_TIME_SCALE = 0.125
+MAX_TIME_SCALE = 16.0
+
+
+class GameClock:
+    """
+    Tempo de jogo em milissegundos, avançado tick a tick.
+
+    Parâmetros
+    ----------
+    time_scale : float, opcional
+        Multiplicador global do tempo de jogo por segundo real.
+    """
+
+    def __init__(self, time_scale=1.0):
+        self.time_ms = 0.0
+        self.time_scale = time_scale
+        self.paused = False
+        self._pending_steps = 0
+
+    def advance(self, dt):
+        """Soma `dt` segundos de simulação."""
+        self.time_ms += dt * 1000
+
+    def get_ticks(self):
+        """Milissegundos de jogo desde o início (mesmo formato de `pygame.time.get_ticks`)."""
+        return int(self.time_ms)
+
+    # ------------------------------------------------------------------
+    # pausa, velocidade e passo a passo
+    # ------------------------------------------------------------------
+    def pause(self):
+        """Congela o jogo: `ticks()` só entrega os passos pedidos com `step()`."""
+        self.paused = True
+
+    def resume(self):
+        """Volta a andar com o tempo real (descarta passos pendentes)."""
+        self.paused = False
+        self._pending_steps = 0
+
+    def toggle_pause(self):
+        """Pausa ou retoma (tecla P)."""
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def step(self, ticks=1):
+        """Pede `ticks` ticks manuais, rodados no próximo frame (só com o jogo pausado)."""
+        if self.paused:
+            self._pending_steps += ticks
+
+    def set_time_scale(self, time_scale):
+        """Muda a velocidade do jogo, limitada a [`MIN_TIME_SCALE`, `MAX_TIME_SCALE`]."""
+        self.time_scale = min(MAX_TIME_SCALE, max(MIN_TIME_SCALE, time_scale))
+
+    def ticks(self, timestep, frame_time, time_scale=1.0):
+        """
+        Gera o `dt` de cada tick a simular neste frame.
+
+        Parameters
+        ----------
+        timestep : FixedTimestep
+            Acumulador de tempo real → ticks fixos do loop.
+        frame_time : float
+            Tempo real desde o último frame, em segundos.
+        time_scale : float, opcional
+            Multiplicador extra deste frame (ex.: sala mais rápida),
+            aplicado junto com o `self.time_scale`.
+        """
+        if self.paused:
+            steps, self._pending_steps = self._pending_steps, 0
+            for _ in range(steps):
+                timestep.ticks += 1
+                yield timestep.dt
+            return
+        yield from timestep.advance(frame_time, time_scale * self.time_scale)
+
+
+# instância única lida pelas entidades
+game_clock = GameClock()
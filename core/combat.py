@@ -0,0 +1,282 @@
+"""
+Hitboxes de ataque por animação e o resolvedor de combate (**combat**).
+
+Antes cada golpe era código solto: o `check_player_attack` testava
+`8 <= frame <= 12` pro smash e `frame == 6` pro thrust e montava um
+`pygame.Rect` novo a cada tick; o `KnightBoss` guardava hitboxes em
+`attack_data` e reposicionava no `update_hitbox_position`; o feitiço
+testava o próprio retângulo contra o player no `update`.
+
+Aqui os golpes são **dados**: cada classe declara `hitbox_data`, estado
+→ fase(s) do golpe, com os quadros em que ele acerta, o ponto do `rect`
+da entidade usado de âncora e o retângulo relativo a ela (olhando pra
+direita; pra esquerda é espelhado):
+
+    hitbox_data = {
+        "smash": {"frames": (8, 12), "anchor": "midtop", "rect": (0, 20, 96, 80)},
+        "thrust": {"frames": (6, 6), "anchor": "center", "rect": (0, -5, 100, 10)},
+    }
+
+Ao carregar, isso vira uma tabela por clipe (`HitboxTrack`) com o
+retângulo de cada quadro já calculado pros dois lados. Cada entidade tem
+um `Hitbox` só, cujo `rect` é reposicionado no lugar (`Rect.update`)
+nos ticks em que o golpe está ativo; nesses ticks ele se inscreve no
+resolvedor. O dano de cada golpe vem de `entidade.attack_damage[estado]`
+(ajustável por instância, ex.: `tools.balance_sim`).
+
+O resolvedor (`combat`) processa, uma vez por tick, só os hitboxes
+inscritos: golpes inimigos (sprites e lote, `batch.strike`) contra o
+player; golpes do player contra os inimigos-sprite, o lote e o boss.
+Cada golpe acerta cada alvo uma vez (`Hitbox.struck`).
+
+Custo: sem golpe ativo, quase nada. Cada golpe do player varre os
+inimigos-sprite (`colliderect` numa compreensão, em C: ~0,05 µs por
+alvo) e o lote (`batch.hit`), então o custo é golpes ativos × alvos da
+sala; só o teste fino e o dano (`_strike`) ficam restritos a quem
+encosta. Ver `benchmarks/combat.py`.
+
+Uso típico:
+    self.hitbox = Hitbox(self, compile_hitboxes(clips, self.hitbox_data), PLAYER)
+    ...
+    self.hitbox.sync(self.anim, self.rect, self.facing_right)  # 1x por tick
+    ...
+    combat.resolve(player, enemies, boss, batch)   # 1x por tick, no Game
+"""
+
+import pygame
+
+PLAYER = "player"   # time do player: acerta inimigos e boss
+ENEMY = "enemy"     # time dos inimigos: acerta o player
+
+
+# ------------------------------------------------------------------
+# tabelas
+# ------------------------------------------------------------------
+class HitboxTrack:
+    """
+    Hitboxes de um clipe por quadro e lado.
+
+    `right[quadro]` / `left[quadro]` = `(âncora, dx, dy, w, h)` (ou `None`
+    nos quadros sem golpe): o hitbox é `(x + dx, y + dy, w, h)`, com
+    `(x, y) = getattr(rect, âncora)`.
+
+    Parâmetros
+    ----------
+    length : int
+        Número de quadros do clipe.
+    phases : Sequence[dict]
+        Fases do golpe: `rect` (dx, dy, w, h olhando pra direita),
+        `anchor` (atributo do `pygame.Rect`, padrão `"center"`) e
+        `frames` (primeiro, último; padrão = o clipe inteiro).
+    """
+
+    __slots__ = ("right", "left")
+
+    def __init__(self, length, phases):
+        right = [None] * length
+        left = [None] * length
+        for phase in phases:
+            dx, dy, w, h = phase["rect"]
+            anchor = phase.get("anchor", "center")
+            first, last = phase.get("frames", (0, length - 1))
+            for frame in range(first, min(last, length - 1) + 1):
+                right[frame] = (anchor, dx, dy, w, h)
+                left[frame] = (anchor, -dx - w, dy, w, h)  # espelhado em torno da âncora
+        self.right = tuple(right)
+        self.left = tuple(left)
+
+
+_track_sets = {}  # (id da declaração, nº de quadros por estado) → tabelas
+
+
+def compile_hitboxes(clips, hitbox_data):
+    """
+    Tabelas de hitbox de cada estado a partir dos clipes e da declaração da classe.
+
+    Compartilhadas por toda instância da classe, como os clipes.
+
+    Parameters
+    ----------
+    clips : dict[str, Clip]
+        Clipes da entidade (`core.animation.compile_clips`).
+    hitbox_data : dict[str, dict | list[dict]]
+        Estado → fase (ou lista de fases) do golpe; ver `HitboxTrack`.
+
+    Returns
+    -------
+    dict[str, HitboxTrack]
+    """
+    lengths = tuple((state, clips[state].length) for state in hitbox_data)
+    key = (id(hitbox_data), lengths)
+    tracks = _track_sets.get(key)
+    if tracks is None:
+        tracks = _track_sets[key] = {}
+        for state, length in lengths:
+            phases = hitbox_data[state]
+            if isinstance(phases, dict):
+                phases = (phases,)
+            tracks[state] = HitboxTrack(length, phases)
+    return tracks
+
+
+# ------------------------------------------------------------------
+# hitbox de uma entidade
+# ------------------------------------------------------------------
+class Hitbox:
+    """
+    Hitbox de ataque de uma entidade, reposicionado no lugar a cada tick.
+
+    Parâmetros
+    ----------
+    owner : object
+        Entidade atacante (`attack_damage[estado]` dá o dano).
+    tracks : dict[str, HitboxTrack]
+        Tabelas da entidade (`compile_hitboxes`).
+    team : str
+        `PLAYER` ou `ENEMY`.
+    resolver : CombatResolver, opcional
+        Onde o golpe se inscreve quando ativo (padrão = `combat`).
+
+    Atributos lidos pelo resolvedor: `rect`, `damage`, `team`, `struck`
+    (alvos já atingidos neste golpe) e `fresh` (primeiro tick do golpe).
+    """
+
+    __slots__ = ("owner", "tracks", "team", "resolver", "rect", "damage", "struck",
+                 "fresh", "_state", "_tick")
+
+    def __init__(self, owner, tracks, team, resolver=None):
+        self.owner = owner
+        self.tracks = tracks
+        self.team = team
+        self.resolver = resolver if resolver is not None else combat
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.damage = 0
+        self.struck = set()
+        self.reset()
+
+    def reset(self):
+        """Sem golpe em andamento (spawn / reuso pelo `sprite_pools`)."""
+        self.fresh = False
+        self._state = None
+        self._tick = 0
+
+    def sync(self, anim, rect, facing_right=True):
+        """
+        Posiciona o hitbox no quadro atual e, se o golpe estiver ativo,
+        inscreve no resolvedor deste tick.
+
+        Parameters
+        ----------
+        anim : Animator
+            Animação do dono (estado e quadro atuais).
+        rect : pygame.Rect
+            Retângulo do dono (as âncoras saem dele).
+        facing_right : bool, opcional
+            Lado pra onde o dono olha.
+
+        Returns
+        -------
+        bool
+            `True` se o golpe está ativo neste tick.
+        """
+        track = self.tracks.get(anim.state)
+        entry = None
+        if track is not None:
+            entry = (track.right if facing_right else track.left)[anim.frame]
+        if entry is None:
+            self._state = None
+            return False
+
+        anchor, dx, dy, w, h = entry
+        x, y = getattr(rect, anchor)
+        self.rect.update(x + dx, y + dy, w, h)
+
+        # golpe novo: outro estado, ou o mesmo recomeçado
+        state = anim.state
+        self.fresh = state != self._state or anim.tick < self._tick
+        if self.fresh:
+            self.struck.clear()
+            self.damage = self.owner.attack_damage[state]
+        self._state, self._tick = state, anim.tick
+        self.resolver.submit(self)
+        return True
+
+
+# ------------------------------------------------------------------
+# resolvedor
+# ------------------------------------------------------------------
+class CombatResolver:
+    """
+    Golpes ativos do tick e a passada única que aplica o dano.
+
+    Atributos: `hits` (acertos desde a criação) e `active_peak` (maior
+    número de golpes ativos num mesmo tick).
+    """
+
+    def __init__(self):
+        self._active = []
+        self.hits = 0
+        self.active_peak = 0
+
+    def submit(self, hitbox):
+        """Inscreve um golpe ativo neste tick (chamado pelo `Hitbox.sync`)."""
+        self._active.append(hitbox)
+
+    def clear(self):
+        """Descarta os golpes inscritos (troca de partida / reinício)."""
+        self._active.clear()
+
+    def resolve(self, player, enemies, boss=None, batch=None):
+        """
+        Aplica o dano de todos os golpes ativos do tick e esvazia a lista.
+
+        Deve ser chamada uma vez por tick, depois de todo mundo se mover
+        e animar.
+
+        Parameters
+        ----------
+        player : Player
+            Alvo dos golpes inimigos.
+        enemies : pygame.sprite.Group
+            Inimigos-sprite, alvos dos golpes do player.
+        boss : KnightBoss, opcional
+            Chefe, se presente na sala.
+        batch : EnemyBatch | EnemyWorld, opcional
+            Inimigos em lote: os golpes deles (`batch.strike`) vão contra
+            o player e eles também levam os golpes do player.
+        """
+        if batch is not None:
+            # golpes do lote primeiro, com as posições do fim do `update`
+            # (como os hitboxes-sprite, fixados no `sync`)
+            self.hits += batch.strike(player)
+        active = self._active
+        if not active:
+            return
+        self.active_peak = max(self.active_peak, len(active))
+        for hitbox in active:
+            if hitbox.team == ENEMY:
+                self._strike(hitbox, player)
+                continue
+
+            if batch is not None:
+                if hitbox.fresh:
+                    batch.reset_hits()  # golpe novo: todo mundo pode levar de novo
+                self.hits += batch.hit(hitbox.rect, hitbox.damage)
+            # filtro grosso em C (`colliderect` numa compreensão): o `_strike`
+            # só roda pra quem encosta
+            rect = hitbox.rect
+            for enemy in [enemy for enemy in enemies if rect.colliderect(enemy.rect)]:
+                self._strike(hitbox, enemy)
+            if boss:
+                self._strike(hitbox, boss)
+        active.clear()
+
+    def _strike(self, hitbox, target):
+        """Dano em `target` se o golpe encosta nele e ainda não o atingiu."""
+        if target not in hitbox.struck and hitbox.rect.colliderect(target.rect):
+            hitbox.struck.add(target)
+            target.take_damage(hitbox.damage)
+            self.hits += 1
+
+
+combat = CombatResolver()
@@ -0,0 +1,131 @@
+"""
+Renderer de retângulos sujos (**DirtyRectRenderer**) do Hollow Mooni.
+
+No modo normal o gameplay redesenha o fundo 1280×720 inteiro, o
+foreground, as entidades e dá `pygame.display.flip()` todo frame, mesmo
+com quase tudo parado. Com o renderer ligado, cada sprite, barra de HUD
+e texto desenhado registra o `Rect` que tocou; no frame seguinte só essas
+áreas são restauradas a partir do fundo cacheado e só elas (antigas +
+novas) vão pra tela com `pygame.display.update(rects)`.
+
+Qualquer troca de "cena" (sala nova, cenário que terminou de carregar,
+volta do menu) força um redesenho completo.
+
+O foreground tem alpha, então cada pixel restaurado precisa receber o
+fundo, os sprites de baixo e o foreground **uma vez só** — por isso as
+áreas restauradas são fundidas num conjunto de retângulos disjuntos.
+
+Fluxo por frame (no main):
+    renderer.begin_frame(cena)
+    room_manager.draw_room(screen, renderer.restore_rects([área do player]))
+    renderer.mark(player.draw(screen))
+    room_manager.draw_foreground(screen, renderer.dirty_rects())
+    ...
+    renderer.present()
+"""
+
+import pygame
+
+
+def merge_rects(rects):
+    """
+    Funde retângulos que se sobrepõem até sobrar um conjunto disjunto.
+
+    A união pode cobrir um pouco mais de área do que os originais, mas
+    nenhum pixel fica em dois retângulos (importante pro blit com alpha).
+    """
+    merged = [pygame.Rect(rect) for rect in rects if rect]
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            j = merged[i].collidelist(merged[i + 1:])
+            if j != -1:
+                merged[i].union_ip(merged.pop(i + 1 + j))
+                changed = True
+                break
+    return merged
+
+
+class DirtyRectRenderer:
+    """
+    Rastreia as áreas tocadas em cada frame e atualiza só elas.
+
+    Parâmetros
+    ----------
+    enabled : bool, opcional
+        Com `False` o renderer vira só um `display.flip()` (redesenho
+        completo todo frame, igual ao caminho antigo).
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.full_redraw = True
+        self._scene = None
+        self._previous = []   # rects tocados no frame anterior
+        self._current = []    # rects tocados neste frame
+        self._restored = []   # áreas (disjuntas) restauradas neste frame
+
+        self.frames = 0
+        self.full_frames = 0
+
+    # ------------------------------------------------------------------
+    def invalidate(self):
+        """Força redesenho completo no próximo frame (menu, transições)."""
+        self.full_redraw = True
+
+    def begin_frame(self, scene):
+        """
+        Começa um frame de gameplay.
+
+        Parameters
+        ----------
+        scene : hashable
+            Identifica o que está de fundo (ex.: sala + cenário carregado);
+            se mudar desde o último frame, o frame é redesenhado inteiro.
+        """
+        if scene != self._scene:
+            self._scene = scene
+            self.full_redraw = True
+        if not self.enabled:
+            self.full_redraw = True
+        self._current = []
+        self._restored = []
+
+    def mark(self, rect):
+        """Registra uma área desenhada neste frame (devolve o próprio `rect`)."""
+        if rect:
+            self._current.append(pygame.Rect(rect))
+        return rect
+
+    def restore_rects(self, under=()):
+        """
+        Áreas cujo fundo precisa ser restaurado (`None` = tela inteira).
+
+        Parameters
+        ----------
+        under : iterable[pygame.Rect], opcional
+            Onde vão ser desenhados os sprites que ficam *embaixo* do
+            foreground neste frame (ex.: o player); entram na restauração
+            pra receber o foreground uma vez só.
+        """
+        if self.full_redraw:
+            return None
+        self._restored = merge_rects(self._previous + list(under))
+        return self._restored
+
+    def dirty_rects(self):
+        """Áreas restauradas neste frame, pro foreground (`None` = tela inteira)."""
+        return None if self.full_redraw else self._restored
+
+    def present(self):
+        """Manda pra tela o que mudou e vira a página dos rects."""
+        self.frames += 1
+        if self.full_redraw:
+            self.full_frames += 1
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._restored + self._current)
+        self._previous = self._current
+        self._current = []
+        self.full_redraw = not self.enabled
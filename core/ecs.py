@@ -0,0 +1,610 @@
+"""
+Inimigos como entidades/componentes (**EnemyWorld**) do Hollow Mooni.
+
+`SkeletonEnemy`, `NightBorneEnemy` e `BringerOfDeathEnemy` repetem a
+mesma mecânica (vida, máquina de estados, avanço de quadro, virar pro
+lado do player, cooldown, `take_damage`), cada um num
+`pygame.sprite.Sprite` com `__dict__` próprio, dicionário de animações
+por instância e registro nos grupos. Aqui um inimigo é só uma linha em
+listas paralelas de componentes pequenos (`__slots__`):
+
+- `Body`: rect, imagem, âncora do tick anterior, direção e velocidade;
+- `Health`: vida, hurt, já levou este golpe, hora da morte;
+- `Brain`: último ataque, se está atacando e se o golpe já acertou;
+- `Animator` (`core.animation`): clipe e tick da animação.
+
+O que muda de um tipo pro outro virou dado (`ARCHETYPES`): alcance de
+visão e de golpe, âncora de spawn, nome da animação de andar, pra que
+lado a arte olha. Os números de combate, os frames, os clipes (com o
+quadro em que o feitiço sai) e os hitboxes dos golpes (`hitbox_data`)
+saem de uma instância modelo da classe original, como no `EnemyBatch`.
+
+As linhas ficam agrupadas por tipo (`_Table`) e cada sistema (IA,
+movimento, animação, desenho) percorre uma tabela inteira de uma vez,
+com os parâmetros do tipo em variáveis locais — nada de despacho de
+método por inimigo. O golpe do player não: cada tabela mantém os corpos
+indexados por coluna de `COLUMN_W` px do `centerx` (atualizado só
+quando alguém troca de coluna), e o `hit` testa só as colunas ao
+alcance do hitbox. Os golpes dos inimigos ativos no tick ficam numa fila
+por tabela, que o `CombatResolver` aplica no player pelo `strike`. O
+comportamento é o mesmo dos sprites: mesma ordem de operações, mesmos
+`Rect` inteiros.
+
+Não precisa de NumPy. O `KnightBoss` continua sprite (é um só).
+
+Uso típico (no `Game`, com `enemy_batch="ecs"`):
+    world = EnemyWorld(spells)
+    world.spawn("bringer", (x, 670))
+    world.update(player, dt)          # 1x por tick
+    world.strike(player)              # golpes dos inimigos (`CombatResolver`)
+    world.hit(hitbox.rect, 15)        # golpe do player (`CombatResolver`)
+    screen.blits(world.blit_items(alpha))
+"""
+
+import pygame
+
+from core.animation import END, Animator
+from core.atlas import blit_item
+from core.bringer import BringerOfDeathEnemy
+from core.clock import game_clock
+from core.combat import compile_hitboxes
+from core.event_log import event_log
+from core.nightborne import NightBorneEnemy
+from core.pool import sprite_pools
+from core.skeleton import SkeletonEnemy
+from core.spell_effect import SpellEffect
+from core.timing import FIXED_DT, interpolate
+
+combat_log = event_log.channel("combat")
+
+COLUMN_W = 128  # px por coluna do índice de golpes (~ largura de um inimigo)
+
+
+# ------------------------------------------------------------------
+# componentes
+# ------------------------------------------------------------------
+class Body:
+    """
+    Posição e aparência: `rect`, `image`, `prev_anchor`, `facing_right`,
+    `vx` (px/s), `column` (coluna no índice da tabela, ou `None`) e `row`
+    (os outros componentes da linha: `Health`, `Brain`, `Animator`).
+    """
+
+    __slots__ = ("rect", "image", "prev_anchor", "facing_right", "vx", "column", "row")
+
+
+class Health:
+    """Vida: `hp`, `hurt`, `recently_hit` e `death_time` (ms de jogo, ou `None`)."""
+
+    __slots__ = ("hp", "hurt", "recently_hit", "death_time")
+
+
+class Brain:
+    """Combate: `last_attack` (ms de jogo), `attacking` e `struck` (golpe atual já acertou)."""
+
+    __slots__ = ("last_attack", "attacking", "struck")
+
+
+# ------------------------------------------------------------------
+# tipos como dados
+# ------------------------------------------------------------------
+# ai: "melee" (persegue dentro da visão e bate ao encostar) ou
+#     "caster" (sempre anda; bate perto, lança feitiço longe)
+# walk: animação de andar | anchor/spawn_dy: como `pos` vira o rect
+# art_faces_left: frames espelhados quando olha pra direita
+# reanchor: rect acompanha o tamanho do frame (pé fixo no chão)
+ARCHETYPES = {
+    "skeleton": {
+        "cls": SkeletonEnemy,
+        "ai": "melee",
+        "walk": "walk",
+        "anchor": "topleft",
+        "vision_range": 900,
+        "melee_range": 40,
+        "art_faces_left": False,
+        "reanchor": True,
+    },
+    "nightborne": {
+        "cls": NightBorneEnemy,
+        "ai": "melee",
+        "walk": "run",
+        "anchor": "midbottom",
+        "vision_range": 400,
+        "melee_range": 50,
+        "art_faces_left": False,
+        "reanchor": True,
+    },
+    "bringer": {
+        "cls": BringerOfDeathEnemy,
+        "ai": "caster",
+        "walk": "walk",
+        "anchor": "midbottom",
+        "spawn_dy": -40,
+        "melee_range": 100,
+        "art_faces_left": True,
+        "reanchor": False,
+    },
+}
+
+
+class _Kind:
+    """Parâmetros e frames de um tipo, tirados de uma instância modelo."""
+
+    def __init__(self, name, spec):
+        template = spec["cls"]((0, 0))
+        self.name = name
+        self.cls = spec["cls"]
+        self.ai = spec["ai"]
+        self.walk = spec["walk"]
+        self.anchor = spec["anchor"]
+        self.spawn_dy = spec.get("spawn_dy", 0)
+        self.vision_range = spec.get("vision_range")
+        self.melee_range = spec["melee_range"]
+        self.art_faces_left = spec["art_faces_left"]
+        self.reanchor = spec["reanchor"]
+        self.corpse_ms = getattr(template, "corpse_ms", None)  # None = some no fim da morte
+        self.clips = template.anim.clips
+        self.tracks = compile_hitboxes(self.clips, spec["cls"].hitbox_data)
+
+        self.animations = dict(template.animations)
+        self.idle_image = self.animations["idle"][0]
+        # estado → (frames olhando pra esquerda, pra direita, tamanho de cada quadro)
+        self.views = {
+            state: (
+                frames.facing(not self.art_faces_left),
+                frames.facing(self.art_faces_left),
+                tuple(image.get_size() for image in frames),
+            )
+            for state, frames in self.animations.items()
+        }
+        # maior meia-largura de rect do tipo: alcance extra das colunas no `hit`
+        self.reach = max(w for _, _, sizes in self.views.values() for w, _ in sizes) // 2 + 1
+        self.speed = template.speed
+        self.health = template.health
+        self.attack_damage = dict(template.attack_damage)
+        self.attack_cooldown = template.attack_cooldown
+
+
+class _Table:
+    """Linhas de um tipo: uma lista por componente, mesma ordem."""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.bodies = []
+        self.healths = []
+        self.brains = []
+        self.anims = []
+        self.dead = []     # índices a remover no fim do tick
+        self.swings = []   # golpes ativos do tick: (rect, dano, Brain), pro `strike`
+        self._free = []    # componentes de linhas removidas, reaproveitados no spawn
+        self.columns = {}  # centerx // COLUMN_W → corpos (índice do `hit`)
+
+    def __len__(self):
+        return len(self.bodies)
+
+    def rows(self):
+        return zip(self.bodies, self.healths, self.brains, self.anims)
+
+    def add(self):
+        if self._free:
+            row = self._free.pop()
+        else:
+            row = (Body(), Health(), Brain(), Animator(self.kind.clips, "idle"))
+            row[0].column = None
+            row[0].row = row[1:]
+        body, health, brain, anim = row
+        self.bodies.append(body)
+        self.healths.append(health)
+        self.brains.append(brain)
+        self.anims.append(anim)
+        return row
+
+    def place(self, body):
+        """Põe `body` na coluna do `centerx` atual (spawn / depois de andar)."""
+        column = body.rect.centerx // COLUMN_W
+        if column == body.column:
+            return
+        if body.column is not None:
+            self._unplace(body)
+        bucket = self.columns.get(column)
+        if bucket is None:
+            self.columns[column] = [body]
+        else:
+            bucket.append(body)
+        body.column = column
+
+    def _unplace(self, body):
+        bucket = self.columns[body.column]
+        bucket.remove(body)
+        if not bucket:
+            del self.columns[body.column]
+        body.column = None
+
+    def near(self, rect):
+        """Corpos nas colunas ao alcance de `rect` (candidatos, sem teste fino)."""
+        reach, columns = self.kind.reach, self.columns
+        for column in range((rect.left - reach) // COLUMN_W, (rect.right + reach) // COLUMN_W + 1):
+            bucket = columns.get(column)
+            if bucket:
+                yield from bucket
+
+    def compact(self):
+        """Tira as linhas de `dead` mantendo a ordem das outras."""
+        if not self.dead:
+            return
+        doomed = set(self.dead)
+        self.dead.clear()
+        for i in doomed:
+            self._unplace(self.bodies[i])
+        columns = (self.bodies, self.healths, self.brains, self.anims)
+        self._free.extend(
+            row for i, row in enumerate(zip(*columns)) if i in doomed
+        )
+        for column in columns:
+            column[:] = [item for i, item in enumerate(column) if i not in doomed]
+
+    def clear(self):
+        for body in self.bodies:
+            body.column = None
+        self.columns.clear()
+        self._free.extend(self.rows())
+        for column in (self.bodies, self.healths, self.brains, self.anims):
+            column.clear()
+        self.dead.clear()
+        self.swings.clear()
+
+
+# ------------------------------------------------------------------
+# sistemas
+# ------------------------------------------------------------------
+def melee_ai(table, player, now):
+    """Mesmas regras de `SkeletonEnemy.update`: decide o estado e começa o ataque."""
+    kind = table.kind
+    px = player.rect.centerx
+    vision, melee = kind.vision_range, kind.melee_range
+    speed, cooldown, walk = kind.speed, kind.attack_cooldown, kind.walk
+    for body, health, brain, anim in table.rows():
+        body.vx = 0
+        if health.hp <= 0:
+            anim.play("death")
+        elif health.hurt:
+            anim.play("hurt")
+        elif brain.attacking:
+            anim.play("attack")
+        else:
+            distance = px - body.rect.centerx
+            if abs(distance) < vision:
+                anim.play(walk)
+                direction = 1 if distance > 0 else -1
+                body.facing_right = direction > 0
+                body.vx = direction * speed
+                if abs(distance) < melee and now - brain.last_attack > cooldown:
+                    brain.attacking = True
+                    brain.last_attack = now
+                    anim.restart()  # o golpe começa do quadro 0
+            else:
+                anim.play("idle")
+
+
+def caster_ai(table, player, now):
+    """Mesmas regras de `BringerOfDeathEnemy.update`: anda sempre, bate perto, casta longe."""
+    kind = table.kind
+    px = player.rect.centerx
+    melee, speed, cooldown, walk = kind.melee_range, kind.speed, kind.attack_cooldown, kind.walk
+    busy = ("cast", "attack", "hurt", "death")
+    for body, health, brain, anim in table.rows():
+        body.vx = 0
+        if health.hp <= 0 or anim.state in busy:
+            continue
+        distance = px - body.rect.centerx
+        direction = 1 if distance > 0 else -1
+        body.facing_right = direction > 0
+        anim.play(walk)
+        body.vx = direction * speed
+        if now - brain.last_attack > cooldown:
+            anim.play("attack" if abs(distance) < melee else "cast")
+            anim.restart()
+            brain.last_attack = now
+
+
+def movement(table, dt):
+    """Anda `vx * dt` (o `Rect` trunca igual ao `rect.x +=` dos sprites) e atualiza o índice."""
+    for body in table.bodies:
+        if body.vx:
+            rect = body.rect
+            rect.x += body.vx * dt
+            if rect.centerx // COLUMN_W != body.column:
+                table.place(body)
+
+
+def queue_swing(table, body, brain, anim):
+    """
+    Põe na fila do `strike` o golpe ativo no quadro atual (`hitbox_data`).
+
+    Mesmas contas do `Hitbox.sync`; fora de um quadro de golpe o `struck`
+    é liberado pro próximo.
+    """
+    track = table.kind.tracks.get(anim.state)
+    entry = None
+    if track is not None:
+        entry = (track.right if body.facing_right else track.left)[anim.frame]
+    if entry is None:
+        brain.struck = False
+    elif not brain.struck:
+        anchor, dx, dy, w, h = entry
+        x, y = getattr(body.rect, anchor)
+        table.swings.append(((x + dx, y + dy, w, h), table.kind.attack_damage[anim.state], brain))
+
+
+def melee_animation(table, player, spells, now, dt):
+    """Avança os clipes; fim de ataque/hurt libera, fim da morte remove."""
+    kind = table.kind
+    views, reanchor = kind.views, kind.reanchor
+    for i, (body, health, brain, anim) in enumerate(table.rows()):
+        if anim.advance(dt) == END:
+            state = anim.state
+            if state == "attack":
+                brain.attacking = False
+            elif state == "hurt":
+                health.hurt = False
+            elif state == "death":
+                table.dead.append(i)
+        left, right, sizes = views[anim.state]
+        frame = anim.frame
+        body.image = (right if body.facing_right else left)[frame]
+        if reanchor:  # pé fixo no chão: o rect acompanha o tamanho do frame
+            w, h = sizes[frame]
+            rect = body.rect
+            if rect.w != w or rect.h != h:
+                midbottom = (rect.centerx, rect.bottom)
+                rect.size = (w, h)
+                rect.midbottom = midbottom
+        queue_swing(table, body, brain, anim)
+
+
+def caster_animation(table, player, spells, now, dt):
+    """Avança os clipes; reage ao evento do feitiço, o corpo some após `corpse_ms`."""
+    kind = table.kind
+    views, animations = kind.views, kind.animations
+    corpse_ms = kind.corpse_ms
+    for i, (body, health, brain, anim) in enumerate(table.rows()):
+        event = anim.advance(dt)
+        if event == "cast":
+            spell_pos = (player.rect.centerx, player.rect.top - 20)
+            spells.add(sprite_pools.acquire(SpellEffect, spell_pos, animations["spell"]))
+            combat_log.info("cast", kind.name)
+        elif anim.state == "death" and now - health.death_time > corpse_ms:
+            table.dead.append(i)
+        left, right, _ = views[anim.state]
+        body.image = (right if body.facing_right else left)[anim.frame]
+        queue_swing(table, body, brain, anim)
+
+
+def melee_damage(kind, health, brain, anim, amount, now):
+    """`SkeletonEnemy.take_damage`."""
+    health.hp -= amount
+    combat_log.info("hit", kind.name, amount, health.hp)
+    if health.hp <= 0:
+        anim.play("death")
+    else:
+        health.hurt = True
+        anim.restart()
+
+
+def caster_damage(kind, health, brain, anim, amount, now):
+    """`BringerOfDeathEnemy.take_damage` (morto não leva dano de novo)."""
+    if anim.state == "death":
+        return
+    health.hp -= amount
+    combat_log.info("hit", kind.name, amount, health.hp)
+    if health.hp <= 0:
+        anim.play("death")
+        anim.restart()
+        health.death_time = now
+    elif anim.state != "hurt":
+        anim.play("hurt")
+        anim.restart()
+
+
+# ai → (decisão, animação, dano recebido)
+BEHAVIORS = {
+    "melee": (melee_ai, melee_animation, melee_damage),
+    "caster": (caster_ai, caster_animation, caster_damage),
+}
+
+
+# ------------------------------------------------------------------
+# mundo
+# ------------------------------------------------------------------
+class EnemyWorld:
+    """
+    Inimigos comuns (esqueleto, NightBorne, Bringer) em tabelas de componentes.
+
+    Mesma interface do `EnemyBatch` (`supports`, `spawn`, `update`, `strike`,
+    `hit`, `reset_hits`, `centers`, `clear`, `blit_items`, `draw`), então o `Game`
+    e o `WaveManager` usam qualquer um dos dois.
+
+    Parâmetros
+    ----------
+    spells : pygame.sprite.Group, opcional
+        Grupo onde os feitiços dos Bringers entram (padrão = um grupo novo).
+    archetypes : dict, opcional
+        Tipos suportados (padrão = `ARCHETYPES`).
+    """
+
+    def __init__(self, spells=None, archetypes=ARCHETYPES):
+        self.spells = spells if spells is not None else pygame.sprite.Group()
+        self._specs = archetypes
+        self._kind_cls = {spec["cls"]: name for name, spec in archetypes.items()}
+        self.tables = {}   # nome → _Table (criada no 1º spawn do tipo)
+
+    def _table(self, name):
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = _Table(_Kind(name, self._specs[name]))
+        return table
+
+    def __len__(self):
+        """Inimigos em campo (contam pra terminar a onda)."""
+        return sum(len(table) for table in self.tables.values())
+
+    def centers(self):
+        """`centerx` de cada inimigo em campo."""
+        return [body.rect.centerx for table in self.tables.values() for body in table.bodies]
+
+    def supports(self, enemy_class):
+        """`True` se `enemy_class` é um dos tipos (subclasses, como as escaladas, ficam sprite)."""
+        return enemy_class in self._kind_cls
+
+    # ------------------------------------------------------------------
+    # spawn / limpeza
+    # ------------------------------------------------------------------
+    def spawn(self, kind, pos, facing_right=False):
+        """
+        Adiciona um inimigo na mesma posição em que a classe original nasceria.
+
+        Parameters
+        ----------
+        kind : str | type
+            Nome do tipo (`"skeleton"`, `"nightborne"`, `"bringer"`) ou a classe.
+        pos : tuple[int, int]
+            Mesmo `pos` passado pro construtor da classe original.
+        facing_right : bool, opcional
+            Direção inicial.
+
+        Returns
+        -------
+        Body
+            Componente de corpo da entidade nova.
+        """
+        if isinstance(kind, type):
+            kind = self._kind_cls[kind]
+        table = self._table(kind)
+        spec = table.kind
+        body, health, brain, anim = table.add()
+
+        image = spec.idle_image
+        x, y = pos[0], pos[1] + spec.spawn_dy
+        if spec.anchor == "topleft":
+            body.rect = image.get_rect(topleft=(x, y))
+        else:
+            body.rect = image.get_rect(midbottom=(x, y))
+        body.image = image
+        body.prev_anchor = None
+        body.facing_right = facing_right
+        body.vx = 0
+
+        health.hp = spec.health
+        health.hurt = health.recently_hit = False
+        health.death_time = None
+
+        brain.last_attack = game_clock.get_ticks()
+        brain.attacking = brain.struck = False
+
+        anim.reset("idle")
+        table.place(body)
+        return body
+
+    def clear(self):
+        """Remove todo mundo (troca de sala / reinício)."""
+        for table in self.tables.values():
+            table.clear()
+
+    # ------------------------------------------------------------------
+    # simulação
+    # ------------------------------------------------------------------
+    def update(self, player, dt=FIXED_DT):
+        """
+        Um tick de todos os tipos: IA → movimento → animação → remoção dos mortos.
+
+        Os golpes ativos no fim do tick ficam na fila pro `strike`.
+
+        Parameters
+        ----------
+        player : Player
+            Alvo (posição).
+        dt : float, opcional
+            Duração do tick em segundos.
+        """
+        now = game_clock.get_ticks()
+        for table in self.tables.values():
+            table.swings.clear()
+            if not table.bodies:
+                continue
+            for body in table.bodies:
+                body.prev_anchor = body.rect.midbottom
+            decide, animate, _ = BEHAVIORS[table.kind.ai]
+            decide(table, player, now)
+            movement(table, dt)
+            animate(table, player, self.spells, now, dt)
+            table.compact()
+
+    def strike(self, player):
+        """
+        Aplica no player os golpes da fila do tick (`hitbox_data` de cada tipo).
+
+        Chamado pelo `CombatResolver` uma vez por tick, depois do `update`;
+        cada golpe acerta uma vez só, como `Hitbox.struck`.
+
+        Returns
+        -------
+        int
+            Quantos golpes acertaram.
+        """
+        target = player.rect
+        hits = 0
+        for table in self.tables.values():
+            for rect, damage, brain in table.swings:
+                if target.colliderect(rect):
+                    brain.struck = True
+                    player.take_damage(damage)
+                    hits += 1
+            table.swings.clear()
+        return hits
+
+    def hit(self, rect, damage):
+        """
+        Aplica o dano de um golpe do player em quem o `rect` encostar.
+
+        Chamado pelo `CombatResolver` com o `Hitbox` ativo do tick; cada
+        inimigo leva o mesmo golpe uma vez só (até o `reset_hits` do
+        próximo). Só os corpos das colunas ao alcance do `rect` são testados.
+
+        Returns
+        -------
+        int
+            Quantos inimigos foram atingidos.
+        """
+        now = game_clock.get_ticks()
+        hits = 0
+        for table in self.tables.values():
+            take_damage = BEHAVIORS[table.kind.ai][2]
+            kind = table.kind
+            for body in table.near(rect):
+                health, brain, anim = body.row
+                if not health.recently_hit and rect.colliderect(body.rect):
+                    take_damage(kind, health, brain, anim, damage, now)
+                    health.recently_hit = True
+                    hits += 1
+        return hits
+
+    def reset_hits(self):
+        """Libera todo mundo pra levar dano de novo (golpe novo: `Hitbox.fresh`)."""
+        for table in self.tables.values():
+            for health in table.healths:
+                health.recently_hit = False
+
+    # ------------------------------------------------------------------
+    # desenho
+    # ------------------------------------------------------------------
+    def draw(self, surface, alpha=1.0):
+        """Desenha todo mundo num `blits` e devolve as áreas desenhadas."""
+        return surface.blits(self.blit_items(alpha))
+
+    def blit_items(self, alpha=1.0):
+        """Itens do `Surface.blits` (um por inimigo), pra juntar na camada dos inimigos."""
+        return [
+            blit_item(body.image, interpolate(body.rect, body.prev_anchor, alpha))
+            for table in self.tables.values()
+            for body in table.bodies
+        ]
@@ -0,0 +1,509 @@
+"""
+Backend em lote (**EnemyBatch**) pra ondas enormes de inimigos corpo-a-corpo.
+
+`SkeletonEnemy.update` e `NightBorneEnemy.update` fazem, objeto por
+objeto em Python, a mesma coisa: distância até o player, checagem de
+visão, passo na direção dele, alcance pra começar o golpe e cooldown.
+Aqui cada um desses dados vira uma coluna NumPy (posição, vida, estado,
+quadro, último ataque, direção…) e a onda inteira é decidida com um
+punhado de operações vetorizadas por tick. Nenhum Sprite existe por
+inimigo: os frames só são escolhidos na hora do `draw`.
+
+O golpe de cada um é o `hitbox_data` da classe original, virado tabela
+por (tipo, quadro); o `CombatResolver` chama `strike(player)` uma vez
+por tick, como faz com os `Hitbox` dos sprites.
+
+O comportamento é o mesmo dos sprites (mesmos números, mesmas
+transições de estado); os valores de cada tipo saem de uma instância
+modelo da classe original.
+
+NumPy é opcional: sem ele o jogo usa os sprites de sempre.
+
+Uso típico:
+    batch = EnemyBatch()
+    batch.spawn("skeleton", (x, 560))
+    batch.update(player, dt)          # 1x por tick
+    batch.strike(player)              # golpes do lote (pelo `combat`)
+    batch.hit(hitbox, 15)             # ataque do player (pelo `combat`)
+    rects = batch.draw(screen, alpha)
+"""
+
+try:
+    import numpy as np
+except ImportError:  # backend opcional
+    np = None
+
+from core.atlas import blit_item
+from core.clock import game_clock
+from core.combat import compile_hitboxes
+from core.event_log import INFO, event_log
+from core.nightborne import NightBorneEnemy
+from core.skeleton import SkeletonEnemy
+from core.timing import FIXED_DT
+
+combat_log = event_log.channel("combat")
+
+# códigos de estado (coluna `state`)
+IDLE, WALK, ATTACK, HURT, DEATH = range(5)
+N_STATES = 5
+
+# tipo → classe original, como ela nasce e números que ficam fixos no `update` dela
+ARCHETYPES = {
+    "skeleton": {
+        "cls": SkeletonEnemy,
+        "states": ("idle", "walk", "attack", "hurt", "death"),
+        "anchor": "topleft",
+        "vision_range": 900,
+        "melee_range": 40,
+    },
+    "nightborne": {
+        "cls": NightBorneEnemy,
+        "states": ("idle", "run", "attack", "hurt", "death"),
+        "anchor": "midbottom",
+        "vision_range": 400,
+        "melee_range": 50,
+    },
+}
+
+
+def available():
+    """`True` se o NumPy estiver instalado (backend utilizável)."""
+    return np is not None
+
+
+class _Kind:
+    """Parâmetros e frames de um tipo de inimigo, tirados de uma instância modelo."""
+
+    def __init__(self, name, spec):
+        template = spec["cls"]((0, 0))
+        self.name = name
+        self.cls = spec["cls"]
+        self.anchor = spec["anchor"]
+        self.frames = [template.animations[state] for state in spec["states"]]
+        self.size = template.image.get_size()
+        self.speed = template.speed
+        self.health = template.health
+        self.damage = template.attack_damage["attack"]
+        # golpe por quadro do clipe de ataque (direita, esquerda)
+        track = compile_hitboxes(template.anim.clips, spec["cls"].hitbox_data)["attack"]
+        for entry in track.right:
+            if entry is not None and entry[0] != "midbottom":
+                # o lote só guarda o `midbottom` (o rect muda de tamanho por quadro)
+                raise ValueError(f"{name}: hitbox do lote precisa de âncora 'midbottom'")
+        self.swing = (track.right, track.left)
+        self.attack_cooldown = template.attack_cooldown
+        self.animation_speed = template.animation_fps
+        self.vision_range = spec["vision_range"]
+        self.melee_range = spec["melee_range"]
+
+
+class EnemyBatch:
+    """
+    Struct-of-arrays de inimigos corpo-a-corpo (esqueleto e NightBorne).
+
+    Parâmetros
+    ----------
+    capacity : int, opcional
+        Linhas pré-alocadas; cresce sozinho (dobrando) se precisar.
+    archetypes : dict, opcional
+        Tipos suportados (padrão = `ARCHETYPES`).
+    """
+
+    def __init__(self, capacity=256, archetypes=ARCHETYPES):
+        if np is None:
+            raise ImportError("EnemyBatch precisa do NumPy (pip install numpy)")
+
+        self._specs = archetypes
+        self.kinds = []          # _Kind, na ordem dos códigos da coluna `kind`
+        self._kind_index = {}    # nome → código
+        self._kind_cls = {}      # classe original → nome
+        for name, spec in archetypes.items():
+            self._kind_cls[spec["cls"]] = name
+
+        self.count = 0           # linhas em uso (vivas ou não)
+        self._swings = np.zeros(0, np.intp)  # linhas com golpe pro `strike`
+        self._alloc(capacity)
+
+    # ------------------------------------------------------------------
+    # armazenamento
+    # ------------------------------------------------------------------
+    def _alloc(self, capacity):
+        self.capacity = capacity
+        self.kind = np.zeros(capacity, np.int8)
+        self.x = np.zeros(capacity, np.float64)          # centerx
+        self.prev_x = np.zeros(capacity, np.float64)     # centerx do tick anterior
+        self.bottom = np.zeros(capacity, np.int32)
+        self.health = np.zeros(capacity, np.int32)
+        self.state = np.zeros(capacity, np.int8)
+        self.frame = np.zeros(capacity, np.float64)
+        self.last_attack = np.zeros(capacity, np.float64)  # ms no `game_clock`
+        self.facing_right = np.zeros(capacity, bool)
+        self.attacking = np.zeros(capacity, bool)
+        self.hurt = np.zeros(capacity, bool)
+        self.recently_hit = np.zeros(capacity, bool)
+        self.struck = np.zeros(capacity, bool)     # golpe atual já acertou o player
+        self.alive = np.zeros(capacity, bool)
+
+    def _grow(self):
+        columns = {
+            name: getattr(self, name)
+            for name in ("kind", "x", "prev_x", "bottom", "health", "state", "frame",
+                         "last_attack", "facing_right", "attacking", "hurt",
+                         "recently_hit", "struck", "alive")
+        }
+        self._alloc(self.capacity * 2)
+        for name, old in columns.items():
+            getattr(self, name)[:len(old)] = old
+
+    def _kind_code(self, name):
+        code = self._kind_index.get(name)
+        if code is None:
+            code = len(self.kinds)
+            self.kinds.append(_Kind(name, self._specs[name]))
+            self._kind_index[name] = code
+            self._refresh_params()
+        return code
+
+    def _refresh_params(self):
+        """Tabelas por tipo (indexadas pela coluna `kind`)."""
+        kinds = self.kinds
+        self._speed = np.array([k.speed for k in kinds], np.float64)
+        self._damage = np.array([k.damage for k in kinds], np.int32)
+        self._cooldown = np.array([k.attack_cooldown for k in kinds], np.float64)
+        self._anim_speed = np.array([k.animation_speed for k in kinds], np.float64)
+        self._vision = np.array([k.vision_range for k in kinds], np.float64)
+        self._melee = np.array([k.melee_range for k in kinds], np.float64)
+        self._half_w = np.array([k.size[0] / 2 for k in kinds], np.float64)
+        self._height = np.array([k.size[1] for k in kinds], np.int32)
+        # nº de frames de cada (tipo, estado)
+        self._n_frames = np.array([[len(f) for f in k.frames] for k in kinds], np.int32)
+        # golpe por (tipo, quadro do ataque): ativo, dx (direita/esquerda), dy, w, h
+        length = max(len(k.swing[0]) for k in kinds)
+        self._swing_on = np.zeros((len(kinds), length), bool)
+        swing = np.zeros((5, len(kinds), length), np.int32)
+        for code, k in enumerate(kinds):
+            for frame, (right, left) in enumerate(zip(*k.swing)):
+                if right is not None:
+                    self._swing_on[code, frame] = True
+                    swing[:, code, frame] = (right[1], left[1], right[2], right[3], right[4])
+        self._swing_dx_right, self._swing_dx_left, self._swing_dy, self._swing_w, self._swing_h = swing
+        self._build_cells()
+
+    def _build_cells(self):
+        """
+        Tabela de desenho por célula (tipo, estado, espelhado, quadro).
+
+        Cada célula guarda o índice da fonte do `blits` (Surface ou página
+        do atlas, com a área) e o deslocamento do canto em relação a
+        `(centerx, bottom)`, então o `blit_items` só indexa arrays.
+        """
+        width = int(self._n_frames.max())
+        n_cells = len(self.kinds) * N_STATES * 2 * width
+        self._cell_width = width
+        self._cell_image = np.zeros(n_cells, np.intp)
+        self._cell_dx = np.zeros(n_cells, np.intp)
+        self._cell_dy = np.zeros(n_cells, np.intp)
+        self._sources = []
+        self._areas = []
+        for code, k in enumerate(self.kinds):
+            for state, frames in enumerate(k.frames):
+                for flip in (0, 1):
+                    for frame, image in enumerate(frames.facing(flip)):
+                        cell = ((code * N_STATES + state) * 2 + flip) * width + frame
+                        w, h = image.get_size()
+                        source, (x, y), *area = blit_item(image, (-(w // 2), -h))
+                        self._cell_image[cell] = len(self._sources)
+                        self._cell_dx[cell] = x
+                        self._cell_dy[cell] = y
+                        self._sources.append(source)
+                        self._areas.append(area[0] if area else None)
+
+    def __len__(self):
+        """Inimigos ainda vivos (contam pra terminar a onda)."""
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    def centers(self):
+        """`centerx` de cada inimigo vivo (array NumPy)."""
+        n = self.count
+        return self.x[:n][self.alive[:n]]
+
+    def supports(self, enemy_class):
+        """`True` se `enemy_class` tem versão em lote."""
+        return enemy_class in self._kind_cls
+
+    # ------------------------------------------------------------------
+    # spawn / limpeza
+    # ------------------------------------------------------------------
+    def spawn(self, kind, pos, facing_right=False):
+        """
+        Adiciona um inimigo na mesma posição em que a classe original nasceria.
+
+        Parameters
+        ----------
+        kind : str | type
+            Nome do tipo (`"skeleton"`, `"nightborne"`) ou a própria classe.
+        pos : tuple[int, int]
+            Mesmo `pos` passado pro construtor da classe original.
+        facing_right : bool, opcional
+            Direção inicial.
+
+        Returns
+        -------
+        int
+            Índice da linha.
+        """
+        if isinstance(kind, type):
+            kind = self._kind_cls[kind]
+        code = self._kind_code(kind)
+        spec = self.kinds[code]
+        if self.count == self.capacity:
+            self._grow()
+
+        w, h = spec.size
+        if spec.anchor == "topleft":
+            centerx, bottom = pos[0] + w // 2, pos[1] + h
+        else:
+            centerx, bottom = pos
+
+        i = self.count
+        self.count += 1
+        self.kind[i] = code
+        self.x[i] = self.prev_x[i] = centerx
+        self.bottom[i] = bottom
+        self.health[i] = spec.health
+        self.state[i] = IDLE
+        self.frame[i] = 0
+        self.last_attack[i] = game_clock.get_ticks()
+        self.facing_right[i] = facing_right
+        self.attacking[i] = self.hurt[i] = self.recently_hit[i] = self.struck[i] = False
+        self.alive[i] = True
+        return i
+
+    def clear(self):
+        """Remove todo mundo (troca de sala / reinício)."""
+        self.count = 0
+        self.alive[:] = False
+        self._swings = self._swings[:0]
+
+    def compact(self):
+        """Descarta as linhas de quem já morreu (chamado sozinho pelo `update`)."""
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        if len(keep) == n:
+            return
+        for name in ("kind", "x", "prev_x", "bottom", "health", "state", "frame",
+                     "last_attack", "facing_right", "attacking", "hurt",
+                     "recently_hit", "struck", "alive"):
+            column = getattr(self, name)
+            column[:len(keep)] = column[keep]
+        self.alive[len(keep):n] = False
+        self.count = len(keep)
+
+    # ------------------------------------------------------------------
+    # simulação
+    # ------------------------------------------------------------------
+    def update(self, player, dt=FIXED_DT):
+        """
+        Um tick da onda inteira: mesmas regras de `SkeletonEnemy.update`.
+
+        Os golpes ativos no fim do tick ficam guardados pro `strike`.
+
+        Parameters
+        ----------
+        player : Player
+            Alvo (posição).
+        dt : float, opcional
+            Duração do tick em segundos.
+        """
+        n = self.count
+        if n == 0:
+            return
+        kind = self.kind[:n]
+        x = self.x[:n]
+        state = self.state[:n]
+        alive = self.alive[:n]
+        self.prev_x[:n] = x
+
+        # ----- decisão de estado -----
+        dead = self.health[:n] <= 0
+        hurt = ~dead & self.hurt[:n]
+        attacking = ~dead & ~hurt & self.attacking[:n]
+        free = alive & ~dead & ~hurt & ~attacking
+
+        distance = player.rect.centerx - x
+        chase = free & (np.abs(distance) < self._vision[kind])
+        state[dead] = DEATH
+        state[hurt] = HURT
+        state[attacking] = ATTACK
+        state[free] = IDLE
+        state[chase] = WALK
+
+        # ----- perseguição -----
+        direction = np.where(distance > 0, 1.0, -1.0)
+        self.facing_right[:n][chase] = direction[chase] > 0
+        x[chase] += direction[chase] * self._speed[kind[chase]] * dt
+
+        # ----- ataque (alcance + cooldown) -----
+        frame = self.frame[:n]
+        now = game_clock.get_ticks()
+        strike = chase & (np.abs(distance) < self._melee[kind])
+        strike &= now - self.last_attack[:n] > self._cooldown[kind]
+        if strike.any():
+            self.attacking[:n][strike] = True
+            self.last_attack[:n][strike] = now
+            frame[strike] = 0  # o golpe começa do quadro 0 (`Animator.restart`)
+
+        # ----- animação -----
+        frame[alive] += self._anim_speed[kind[alive]] * dt
+        wrapped = alive & (frame >= self._n_frames[kind, state])
+        frame[wrapped] = 0
+        self.attacking[:n][wrapped & (state == ATTACK)] = False
+        self.hurt[:n][wrapped & (state == HURT)] = False
+        finished = wrapped & (state == DEATH)
+        if finished.any():
+            alive[finished] = False
+            if np.count_nonzero(alive) < n // 2:
+                self.compact()
+
+        self._find_swings()
+
+    def _find_swings(self):
+        """Linhas num quadro de golpe ativo que ainda não acertaram o player."""
+        n = self.count
+        on = self._swing_on
+        swinging = self.alive[:n] & (self.state[:n] == ATTACK)
+        rows = np.flatnonzero(swinging)
+        frame = np.minimum(self.frame[rows].astype(np.intp), on.shape[1] - 1)
+        swinging[rows] = on[self.kind[rows], frame]
+        struck = self.struck[:n]
+        struck[~swinging] = False  # fora do golpe: o próximo acerta de novo
+        self._swings = np.flatnonzero(swinging & ~struck)
+
+    def strike(self, player):
+        """
+        Aplica no player os golpes ativos do lote (`hitbox_data` de cada tipo).
+
+        Chamado pelo `CombatResolver` uma vez por tick, depois do `update`;
+        cada golpe acerta uma vez só, como `Hitbox.struck`.
+
+        Returns
+        -------
+        int
+            Quantos golpes acertaram.
+        """
+        rows = self._swings
+        if not len(rows):
+            return 0
+        kind = self.kind[rows]
+        frame = self.frame[rows].astype(np.intp)
+        dx = np.where(self.facing_right[rows],
+                      self._swing_dx_right[kind, frame], self._swing_dx_left[kind, frame])
+        # âncora `midbottom`: o mesmo `centerx` inteiro do rect do sprite
+        half_w = self._half_w[kind]
+        left = np.floor(self.x[rows] - half_w) + half_w.astype(np.intp) + dx
+        top = self.bottom[rows] + self._swing_dy[kind, frame]
+        target = player.rect
+        hits = (
+            (left < target.right) & (left + self._swing_w[kind, frame] > target.left)
+            & (top < target.bottom) & (top + self._swing_h[kind, frame] > target.top)
+        )
+        if not hits.any():
+            return 0
+        self.struck[rows[hits]] = True
+        self._swings = rows[~hits]
+        for damage in self._damage[kind[hits]].tolist():
+            player.take_damage(damage)
+        return int(np.count_nonzero(hits))
+
+    def _rects(self):
+        """Colunas (left, top, right, bottom) dos rects de todo mundo em uso."""
+        n = self.count
+        kind = self.kind[:n]
+        half_w = self._half_w[kind]
+        left = np.floor(self.x[:n] - half_w)
+        bottom = self.bottom[:n]
+        return left, bottom - self._height[kind], left + 2 * half_w, bottom
+
+    def hit(self, rect, damage):
+        """
+        Aplica o dano de um golpe do player em quem o `rect` encostar.
+
+        Chamado pelo `CombatResolver` com o `Hitbox` ativo do tick; cada
+        inimigo leva o mesmo golpe uma vez só (até o `reset_hits` do
+        próximo).
+
+        Returns
+        -------
+        int
+            Quantos inimigos foram atingidos.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        left, top, right, bottom = self._rects()
+        hits = (
+            self.alive[:n] & ~self.recently_hit[:n]
+            & (left < rect.right) & (right > rect.left)
+            & (top < rect.bottom) & (bottom > rect.top)
+        )
+        if not hits.any():
+            return 0
+        health = self.health[:n]
+        health[hits] -= damage
+        self.recently_hit[:n][hits] = True
+        if combat_log.level <= INFO:  # canal desligado: nem monta os registros
+            for i in hits.nonzero()[0]:
+                combat_log.info("hit", self.kinds[self.kind[i]].name, damage, int(health[i]))
+        killed = hits & (health <= 0)
+        hurt = hits & ~killed
+        self.state[:n][killed] = DEATH
+        self.hurt[:n][hurt] = True
+        self.frame[:n][hurt] = 0
+        return int(np.count_nonzero(hits))
+
+    def reset_hits(self):
+        """Libera todo mundo pra levar dano de novo (golpe novo: `Hitbox.fresh`)."""
+        self.recently_hit[:self.count] = False
+
+    # ------------------------------------------------------------------
+    # desenho
+    # ------------------------------------------------------------------
+    def draw(self, surface, alpha=1.0):
+        """
+        Escolhe o frame de cada inimigo vivo e desenha todos num `blits`.
+
+        Parameters
+        ----------
+        surface : pygame.Surface
+            Tela de destino.
+        alpha : float, opcional
+            Interpolação entre o tick anterior e o atual.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            Áreas desenhadas.
+        """
+        return surface.blits(self.blit_items(alpha))
+
+    def blit_items(self, alpha=1.0):
+        """Itens do `Surface.blits` (um por inimigo vivo), pra juntar na camada dos inimigos."""
+        n = self.count
+        if n == 0:
+            return []
+        live = np.flatnonzero(self.alive[:n])
+        kind = self.kind[live].astype(np.intp)
+        state = self.state[live].astype(np.intp)
+        frame = self.frame[live].astype(np.intp) % self._n_frames[kind, state]
+        flip = ~self.facing_right[live]  # a arte olha pra esquerda
+        cell = ((kind * N_STATES + state) * 2 + flip) * self._cell_width + frame
+        x = self.prev_x[live] + (self.x[live] - self.prev_x[live]) * alpha
+        left = x.astype(np.intp) + self._cell_dx[cell]
+        top = self.bottom[live] + self._cell_dy[cell]
+        # fontes e áreas por índice, montagem dos itens toda em C (`map`/`zip`)
+        image = self._cell_image[cell].tolist()
+        return list(zip(
+            map(self._sources.__getitem__, image),
+            zip(left.tolist(), top.tolist()),
+            map(self._areas.__getitem__, image),
+        ))
@@ -0,0 +1,359 @@
+"""
+Log de eventos estruturado em buffer circular (**EventLog**) do Hollow Mooni.
+
+As entidades davam `print` a cada golpe levado, a cada feitiço e a cada
+onda. Com ondas grandes isso são dezenas de escritas síncronas no stdout
+por tick — aparece no tempo de frame, e trava quando o stdout é um pipe
+lento (o `tools.balance_sim` chegava a redirecionar pra `/dev/null`).
+
+Aqui cada evento vira um registro compacto, `(ms de jogo, canal, nível,
+evento, dados)`, guardado num buffer circular em memória (uma tupla por
+evento, nada formatado na hora). Quem escreve no disco é uma thread de
+fundo, de tempos em tempos (`open_export`, JSON Lines). Se ela ficar pra
+trás a ponto de o buffer dar a volta, os mais antigos se perdem e entram
+na contagem `dropped` — o jogo nunca espera.
+
+Cada canal (`"combat"`, `"waves"`, `"music"`…) tem o seu nível. Abaixo
+do nível, os métodos do canal (`debug`/`info`/`warn`) são trocados por
+uma função vazia: desligado, um evento custa uma chamada que não faz
+nada. Laços que montam dados antes de registrar podem checar
+`canal.level` antes.
+
+Os mesmos registros alimentam o log de combate na tela (`draw_overlay`,
+tecla F4 no `main.py`): as últimas linhas dos canais escolhidos, com o
+texto de cada evento vindo de `EVENT_TEXT`.
+
+Uso típico:
+    from core.event_log import event_log
+    combat_log = event_log.channel("combat")
+    combat_log.info("hit", "skeleton", amount, self.health)
+    event_log.set_level(OFF, "combat")        # canal desligado: custo ~zero
+    event_log.open_export("events.jsonl")     # thread grava em disco
+    event_log.recent("combat", 6)             # últimos registros do canal
+
+Um escritor só: os eventos são registrados pela thread principal.
+"""
+
+import json
+import threading
+from functools import partial
+
+import pygame
+
+from core.clock import game_clock
+from core.text_renderer import text_renderer
+
+DEBUG, INFO, WARN, OFF = 10, 20, 30, 100
+LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARN: "warn"}
+
+DEFAULT_CAPACITY = 4096         # registros no buffer (potência de 2)
+FLUSH_INTERVAL_S = 0.5          # a thread de exportação acorda 2x por segundo
+OVERLAY_LINES = 6
+OVERLAY_FONT_SIZE = 20
+
+# (canal, evento) → texto do log na tela; `{0}`, `{1}`… são os dados do evento
+EVENT_TEXT = {
+    ("combat", "hit"): "{0} levou {1} de dano (vida {2})",
+    ("combat", "cast"): "{0} lançou um feitiço",
+    ("waves", "start"): "Iniciando Wave {0}",
+    ("waves", "clear"): "Wave {0} concluida!",
+    ("waves", "done"): "Todas as waves concluidas!",
+    ("music", "slow_op"): "frame {0}: {1} levou {2:.1f} ms",
+    ("music", "decode_failed"): "música {0} não decodificou: {1}",
+}
+
+
+def _drop(event, *data):
+    """Método de canal abaixo do nível: não faz nada."""
+
+
+class Channel:
+    """
+    Canal de eventos com nível próprio.
+
+    `debug`, `info` e `warn` recebem `(evento, *dados)`; os que ficam
+    abaixo de `level` são a função vazia `_drop`.
+
+    Parâmetros
+    ----------
+    log : EventLog
+        Log onde os registros entram.
+    name : str
+        Nome do canal (vai em cada registro).
+    level : int
+        Nível mínimo registrado (`OFF` desliga o canal).
+    """
+
+    __slots__ = ("log", "name", "level", "debug", "info", "warn")
+
+    def __init__(self, log, name, level):
+        self.log = log
+        self.name = name
+        self.set_level(level)
+
+    def set_level(self, level):
+        """Troca o nível (e os métodos de cada nível: registram ou não fazem nada)."""
+        self.level = level
+        emit = self.log.emit
+        self.debug = partial(emit, self.name, DEBUG) if DEBUG >= level else _drop
+        self.info = partial(emit, self.name, INFO) if INFO >= level else _drop
+        self.warn = partial(emit, self.name, WARN) if WARN >= level else _drop
+
+
+class EventLog:
+    """
+    Buffer circular de eventos, exportação em background e log na tela.
+
+    Parâmetros
+    ----------
+    capacity : int, opcional
+        Registros guardados (arredondado pra potência de 2).
+    level : int, opcional
+        Nível dos canais que não tiveram um escolhido (`set_level`).
+    clock : GameClock, opcional
+        Relógio do carimbo de cada registro (padrão = `game_clock`).
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, level=INFO, clock=game_clock):
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.capacity = size
+        self.clock = clock
+        self._mask = size - 1
+        self._buffer = [None] * size
+        self._head = 0                 # registros escritos desde o começo
+        self._level = level
+        self._channels = {}            # nome → Channel
+
+        self._export = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._flushed = 0              # `_head` até onde a exportação já gravou
+        self.dropped = 0               # sobrescritos antes de ir pro disco
+
+        self.show_overlay = False
+        self.overlay_channels = ("combat", "waves")
+        self._overlay = None
+        self._overlay_head = -1        # `_head` da última conferência do painel
+        self._overlay_for = None       # `overlay_channels` com que o painel foi montado
+
+    # ------------------------------------------------------------------
+    # registro
+    # ------------------------------------------------------------------
+    def channel(self, name):
+        """Canal `name` (criado no nível padrão na primeira vez)."""
+        channel = self._channels.get(name)
+        if channel is None:
+            channel = self._channels[name] = Channel(self, name, self._level)
+        return channel
+
+    def set_level(self, level, name=None):
+        """
+        Nível de um canal, ou de todos (`name=None`, vale também pros criados depois).
+
+        Parameters
+        ----------
+        level : int
+            `DEBUG`, `INFO`, `WARN` ou `OFF`.
+        name : str, opcional
+            Canal; sem ele, todos.
+        """
+        if name is not None:
+            self.channel(name).set_level(level)
+            return
+        self._level = level
+        for channel in self._channels.values():
+            channel.set_level(level)
+
+    def levels(self):
+        """Nível atual de cada canal (pra restaurar depois de um `set_level`)."""
+        return {name: channel.level for name, channel in self._channels.items()}
+
+    def emit(self, channel, level, event, *data):
+        """Grava um registro no buffer (normalmente chamado pelos métodos do `Channel`)."""
+        head = self._head
+        self._buffer[head & self._mask] = (self.clock.get_ticks(), channel, level, event, data)
+        self._head = head + 1
+
+    def __len__(self):
+        """Registros ainda no buffer."""
+        return min(self._head, self.capacity)
+
+    def recent(self, channels=None, n=OVERLAY_LINES):
+        """
+        Últimos registros, do mais antigo pro mais novo.
+
+        Parameters
+        ----------
+        channels : str | Sequence[str], opcional
+            Só desses canais (padrão = todos).
+        n : int, opcional
+            Quantos, no máximo.
+
+        Returns
+        -------
+        list[tuple]
+            `(ms de jogo, canal, nível, evento, dados)`.
+        """
+        if isinstance(channels, str):
+            channels = (channels,)
+        found = []
+        buffer, mask, head = self._buffer, self._mask, self._head
+        for i in range(head - 1, max(head - self.capacity, 0) - 1, -1):
+            record = buffer[i & mask]
+            if channels is None or record[1] in channels:
+                found.append(record)
+                if len(found) == n:
+                    break
+        found.reverse()
+        return found
+
+    def clear(self):
+        """Esvazia o buffer (a exportação aberta continua do ponto atual)."""
+        self._buffer = [None] * self.capacity
+        self._head = self._flushed = 0
+        self._overlay_head = -1
+
+    # ------------------------------------------------------------------
+    # texto
+    # ------------------------------------------------------------------
+    @staticmethod
+    def format(record):
+        """Linha legível de um registro (`EVENT_TEXT`, ou `evento dados…`)."""
+        _, channel, _, event, data = record
+        text = EVENT_TEXT.get((channel, event))
+        if text is None:
+            return " ".join((event, *map(str, data)))
+        return text.format(*data)
+
+    # ------------------------------------------------------------------
+    # exportação
+    # ------------------------------------------------------------------
+    def open_export(self, path, interval=FLUSH_INTERVAL_S):
+        """
+        Começa a gravar os registros novos em `path` (JSON Lines), numa thread.
+
+        Uma linha por registro: `{"t": ms, "channel": ..., "level": ...,
+        "event": ..., "data": [...]}`.
+        """
+        self.close_export()
+        self._export = open(path, "w", encoding="utf-8")
+        self._flushed = self._head
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._flush_loop, args=(interval,), name="event-log", daemon=True
+        )
+        self._thread.start()
+
+    def close_export(self):
+        """Para a thread, grava o que faltava e fecha o arquivo."""
+        if self._export is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._flush()
+        self._export.close()
+        self._export = None
+
+    def _flush_loop(self, interval):
+        """Roda na thread de exportação."""
+        while not self._stop.wait(interval):
+            self._flush()
+
+    def _flush(self):
+        """Grava `[_flushed, _head)`; o que o buffer já sobrescreveu vira `dropped`."""
+        head = self._head
+        start = max(self._flushed, head - self.capacity)
+        buffer, mask = self._buffer, self._mask
+        records = [buffer[i & mask] for i in range(start, head)]
+        # o escritor não para: o que ele alcançou durante a cópia pode ter vindo trocado
+        lost = max(self._head - self.capacity - start, 0)
+        self.dropped += start - self._flushed + lost
+        self._flushed = head
+        if lost:
+            records = records[lost:]
+        if records:
+            self._export.write("".join(
+                json.dumps({"t": t, "channel": channel, "level": LEVEL_NAMES.get(level, level),
+                            "event": event, "data": data}, default=str) + "\n"
+                for t, channel, level, event, data in records
+            ))
+            self._export.flush()
+
+    def stats(self):
+        """Registros escritos, ainda no buffer e perdidos antes da exportação."""
+        return {"emitted": self._head, "buffered": len(self), "dropped": self.dropped}
+
+    # ------------------------------------------------------------------
+    # log na tela
+    # ------------------------------------------------------------------
+    def toggle(self):
+        """Liga/desliga o log de combate na tela (tecla F4)."""
+        self.show_overlay = not self.show_overlay
+
+    def draw_overlay(self, surface, pos=None):
+        """
+        Desenha as últimas `OVERLAY_LINES` linhas dos `overlay_channels`.
+
+        O painel só é remontado quando entra registro novo num desses
+        canais (eventos de `music`, por exemplo, não contam).
+
+        Parameters
+        ----------
+        pos : tuple[int, int], opcional
+            Canto superior esquerdo (padrão = canto inferior esquerdo da tela).
+
+        Returns
+        -------
+        pygame.Rect | None
+            Área ocupada pelo painel (`None` desligado ou sem eventos).
+        """
+        if not self.show_overlay:
+            return None
+        head = self._head
+        if head != self._overlay_head or self.overlay_channels != self._overlay_for:
+            if self._overlay_stale(head):
+                self._overlay = self._render_overlay()
+                self._overlay_for = self.overlay_channels
+            self._overlay_head = head
+        if self._overlay is None:
+            return None
+        if pos is None:
+            pos = (10, surface.get_height() - self._overlay.get_height() - 10)
+        return surface.blit(self._overlay, pos)
+
+    def _overlay_stale(self, head):
+        """`True` se algum registro desde a última conferência é dos `overlay_channels`."""
+        start = self._overlay_head
+        if start < 0 or head - start > self.capacity or self.overlay_channels != self._overlay_for:
+            return True  # buffer limpo, sobrescrito ou canais trocados: monta de novo
+        channels, buffer, mask = self.overlay_channels, self._buffer, self._mask
+        return any(buffer[i & mask][1] in channels for i in range(head - 1, start - 1, -1))
+
+    def _render_overlay(self):
+        """Painel semitransparente com uma linha por evento (mais novo embaixo)."""
+        records = self.recent(self.overlay_channels, OVERLAY_LINES)
+        if not records:
+            return None
+        font = text_renderer.font(None, OVERLAY_FONT_SIZE)
+        lines = [
+            font.render(f"{record[0] / 1000:7.2f}s  {self.format(record)}", True,
+                        (255, 200, 120) if record[1] == "combat" else (200, 220, 255))
+            for record in records
+        ]
+        line_height = font.get_linesize()
+        pad = 6
+        panel = pygame.Surface(
+            (max(line.get_width() for line in lines) + pad * 2, line_height * len(lines) + pad * 2),
+            pygame.SRCALPHA,
+        )
+        panel.fill((0, 0, 0, 150))
+        for i, line in enumerate(lines):
+            panel.blit(line, (pad, pad + i * line_height))
+        return panel
+
+
+# instância única usada pelo jogo
+event_log = EventLog()
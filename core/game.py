@@ -0,0 +1,370 @@
+"""
+Estado e lógica do gameplay (**Game**) do Hollow Mooni, sem tela.
+
+Tudo que o antigo `while running:` do `main.py` fazia por tick — mover o
+player, combate, ondas, troca de sala, diálogo e luta do boss, reinício —
+mora aqui, num objeto importável. O `Game` não desenha nem lê teclado:
+quem chama passa o estado das teclas a cada `update()`, e o `main.py`
+só desenha o que estiver em `game`.
+
+Isso permite rodar o jogo headless (ver `core.headless`), com entrada
+roteirizada e o mais rápido que a CPU aguentar.
+
+Uso típico:
+    game = Game(1280, 720)
+    while game.running:
+        game.update(pygame.key.get_pressed(), FIXED_DT)
+"""
+
+import random
+
+import pygame
+
+from core.bringer import BringerOfDeathEnemy
+from core.clock import game_clock
+from core.combat import combat
+from core.ecs import EnemyWorld
+from core.enemy_batch import EnemyBatch
+from core.knight_boss import KnightBoss
+from core.player import Player
+from core.pool import sprite_pools
+from core.profiler import profiler
+from core.room_manager import RoomManager
+from core.timing import FIXED_DT
+from core.wave_manager import WaveManager, load_waves
+
+BOSS_Y_OFFSET = -125            # deixa os pés do boss nivelados com o player
+PLAYER_CENTER_OFFSET = 50       # metade da largura do player (~) para sala 0
+DIALOGUE_LINE_MS = 4500         # tempo de jogo por fala do boss (3 s reais com a sala a 1.5×)
+
+WAVE_FILE = "assets/waves/passarela.json"
+WAVE_DEFINITIONS = load_waves(WAVE_FILE)
+
+ENEMY_BACKENDS = (None, "numpy", "ecs")  # `Game(enemy_batch=...)`; o índice vai no replay
+
+BOSS_DIALOGUE = [
+    "Então é você mais um a perecer para essa maldição...",
+    "Eu era o melhor amigo do rei... minha missão era salvá-lo...",
+    "Mas eu falhei... e falharei novamente agora que mais um inocente cairá",
+    "Mas você... eu reconheço...",
+    "Meu rei... mesmo em outra forma...",
+    "Por favor... salve-nos desta maldição... e me conceda seu perdão...",
+]
+
+
+# =============== JOGO ==============================
+class Game:
+    """
+    Estado completo de uma partida e o passo de simulação.
+
+    Parâmetros
+    ----------
+    screen_width : int
+        Largura da área de jogo (px).
+    screen_height : int
+        Altura da área de jogo (px).
+    wave_definitions : list, opcional
+        Ondas da passarela (padrão = `WAVE_DEFINITIONS`, lidas de `WAVE_FILE`).
+    load_scenery : bool, opcional
+        `False` não carrega fundos de sala (modo headless: nada é desenhado).
+    clock : GameClock, opcional
+        Relógio avançado a cada tick (padrão = `game_clock`, o mesmo que
+        as entidades leem).
+    enemy_batch : bool | str, opcional
+        Backend dos inimigos comuns em vez de um Sprite por inimigo:
+        `"numpy"` (ou `True`) = esqueletos e NightBornes no `EnemyBatch`;
+        `"ecs"` = esqueletos, NightBornes e Bringers no `EnemyWorld`
+        (`core.ecs`). Ver `ENEMY_BACKENDS`.
+    seed : int, opcional
+        Semente do `rng` da partida (sorteio de ataques do boss). Sem ela
+        uma semente aleatória é escolhida e fica em `self.seed`, pra
+        gravação/replay (ver `core.replay`).
+    """
+
+    def __init__(self, screen_width, screen_height, wave_definitions=WAVE_DEFINITIONS,
+                 load_scenery=True, clock=game_clock, enemy_batch=False, seed=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.wave_definitions = wave_definitions
+
+        self.room_manager = RoomManager(screen_width, screen_height, load_scenery=load_scenery)
+        self.all_enemies = pygame.sprite.Group()
+        self.spells = pygame.sprite.Group()
+        self.enemy_backend = "numpy" if enemy_batch is True else (enemy_batch or None)
+        if self.enemy_backend not in ENEMY_BACKENDS:
+            raise ValueError(f"backend de inimigos desconhecido: {enemy_batch!r}")
+        if self.enemy_backend == "ecs":
+            self.enemy_batch = EnemyWorld(self.spells)
+        elif self.enemy_backend == "numpy":
+            self.enemy_batch = EnemyBatch()
+        else:
+            self.enemy_batch = None
+
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+
+        self.clock = clock
+        self.start_ms = clock.time_ms
+        self.ticks = 0
+        self.running = True  # vira `False` quando o jogador encerra após vencer
+        self.restarts = 0    # mortes seguidas de R (o player volta vivo no mesmo tick)
+
+        self._reset()
+
+    # ------------------------------------------------------------------
+    # montagem / reinício
+    # ------------------------------------------------------------------
+    def _reset(self):
+        """Volta pra porta do castelo com player novo e sem inimigos."""
+        self.room_manager.current_room = 0
+        self.ground_level = self.room_manager.get_ground_level()
+
+        self.player = Player((0, 0))
+        self.player.rect.bottom = self.ground_level
+        self.position_player_for_room(0)
+        self.player.attack_damage = {"smash": 15, "thrust": 10}
+
+        self.wave_manager = None
+        self.wave_metrics = None  # `WaveManager.metrics()` da passarela, ao sair dela
+        self.waves_completed = False
+        self._clear_enemies()
+        self.spells.empty()
+        combat.clear()
+
+        self.boss = None
+        self.boss_group = None
+        self.boss_intro_time = None
+        self.current_dialogue_index = 0
+        self.dialogue_start_time = None
+
+        self.show_castle_prompt = False
+        self.show_patio_prompt = False
+
+    def restart(self):
+        """Reinicia a partida (mesma coisa que apertar R depois de morrer)."""
+        self.restarts += 1
+        self._reset()
+
+    def _clear_enemies(self):
+        self.all_enemies.empty()
+        if self.enemy_batch is not None:
+            self.enemy_batch.clear()
+
+    def position_player_for_room(self, room_id):
+        """
+        Posiciona o jogador na coordenada X correta ao entrar em cada sala.
+
+        Parâmetros
+        ----------
+        room_id : int
+            ID numérico da sala (0, 1, 2…).
+        """
+        if room_id == 0:
+            self.player.rect.centerx = self.screen_width // 2 - PLAYER_CENTER_OFFSET
+        else:                      # salas 1 e 2
+            self.player.rect.left = 50
+
+    def _spawn_boss(self):
+        """Monta o boss rezando (passivo) e começa o diálogo."""
+        boss = KnightBoss(
+            (self.screen_width // 2 - 100, self.ground_level - 100), self.ground_level,
+            rng=self.rng,
+        )
+        boss.rect.bottom = self.ground_level
+        boss.rect.y += BOSS_Y_OFFSET  # alinhamento vertical
+        boss.state = "pray"
+        boss.passive = True
+        boss.anim.seek(boss.pray_frame)
+        self.boss = boss
+        self.boss_group = pygame.sprite.GroupSingle(boss)
+        self.boss_intro_time = self.time_ms
+        self.dialogue_start_time = self.time_ms
+        self.current_dialogue_index = 0
+
+    # ------------------------------------------------------------------
+    # consultas
+    # ------------------------------------------------------------------
+    @property
+    def time_ms(self):
+        """Tempo de jogo (ms) no relógio compartilhado."""
+        return self.clock.time_ms
+
+    @property
+    def elapsed_ms(self):
+        """Tempo de jogo (ms) desde que esta partida foi criada."""
+        return self.clock.time_ms - self.start_ms
+
+    @property
+    def current_room(self):
+        """Índice da sala atual."""
+        return self.room_manager.current_room
+
+    @property
+    def dialogue_line(self):
+        """Fala do boss na tela agora (`None` fora do diálogo)."""
+        if self.boss and self.boss.passive and self.current_dialogue_index < len(BOSS_DIALOGUE):
+            return BOSS_DIALOGUE[self.current_dialogue_index]
+        return None
+
+    @property
+    def enemy_count(self):
+        """Inimigos vivos na sala (sprites + lote)."""
+        batch = len(self.enemy_batch) if self.enemy_batch is not None else 0
+        return len(self.all_enemies) + batch
+
+    @property
+    def boss_defeated(self):
+        """`True` quando o boss morreu."""
+        return bool(self.boss and self.boss.hp <= 0 and self.boss.state == "death")
+
+    def sprites(self):
+        """Todas as entidades vivas na sala (player, inimigos, feitiços e boss)."""
+        sprites = [self.player, *self.all_enemies, *self.spells]
+        if self.boss:
+            sprites.append(self.boss)
+        return sprites
+
+    # ------------------------------------------------------------------
+    # simulação
+    # ------------------------------------------------------------------
+    def update(self, keys, dt=FIXED_DT):
+        """
+        Avança o gameplay em um tick fixo de `dt` segundos.
+
+        Não desenha nada: movimento, combate, ondas, troca de sala, diálogo
+        do boss e reinício ficam aqui.
+
+        Parameters
+        ----------
+        keys : Sequence[bool]
+            Estado do teclado (`pygame.key.get_pressed()` ou entrada roteirizada).
+        dt : float, opcional
+            Duração do tick em segundos.
+        """
+        self.ticks += 1
+        self.clock.advance(dt)
+        sprite_pools.reclaim()  # quem morreu / saiu de cena volta pros pools
+        room_manager = self.room_manager
+        player = self.player
+        self.ground_level = room_manager.get_ground_level()
+
+        # guarda a posição anterior pra interpolar o desenho
+        for sprite in self.sprites():
+            sprite.prev_anchor = sprite.rect.midbottom
+
+        # Flags para prompts
+        self.show_castle_prompt = False
+        self.show_patio_prompt = False
+
+        # ----- Permitir movimento? -----
+        if room_manager.current_room == 0:
+            player_can_move = False
+        elif room_manager.current_room == 2 and self.boss and self.boss.passive:
+            player_can_move = False
+        else:
+            player_can_move = True
+
+        if player_can_move:
+            with profiler.scope("player.update"):
+                player.update(keys, self.ground_level, self.screen_width, dt)
+
+        with profiler.scope("waves"):
+            self._update_waves(keys)
+
+        # ----- Porta do castelo (0→1) -----
+        if room_manager.current_room == 0:
+            self.show_castle_prompt = True
+            if keys[pygame.K_e]:
+                room_manager.next_room()
+                player.rect.bottom = room_manager.get_ground_level()
+                self.position_player_for_room(room_manager.current_room)
+                player.prev_anchor = None  # teleporte: sem interpolação
+
+        # ----- Inimigos e feitiços -----
+        with profiler.scope("enemies.update"):
+            for enemy in self.all_enemies:
+                if isinstance(enemy, BringerOfDeathEnemy):
+                    enemy.update(player, self.spells, dt)
+                else:
+                    enemy.update(player, dt)
+
+            if self.enemy_batch is not None:
+                self.enemy_batch.update(player, dt)
+
+        with profiler.scope("spells.update"):
+            for sp in self.spells:
+                sp.update(player, dt)
+
+        with profiler.scope("boss.update"):
+            self._update_boss(keys, dt)
+
+        # ----- Combate: golpes ativos do tick (player, boss, feitiços) numa passada só -----
+        with profiler.scope("combat"):
+            combat.resolve(player, self.all_enemies, self.boss, self.enemy_batch)
+
+        # ----- Reinício (tecla R) -----
+        if not player.alive and keys[pygame.K_r]:
+            self.restart()
+
+    def _update_waves(self, keys):
+        """Spawna/encerra ondas na passarela e leva pro pátio do boss no fim."""
+        room_manager = self.room_manager
+
+        if room_manager.current_room == 1 and self.wave_manager is None:
+            self.wave_manager = WaveManager(
+                self.wave_definitions, self.all_enemies, self.screen_width,
+                self.ground_level, room_manager, batch=self.enemy_batch, clock=self.clock
+            )
+            self.wave_manager.start_next_wave()
+
+        wave_manager = self.wave_manager
+        if wave_manager:
+            if self.enemy_count > 0 or wave_manager.wave_in_progress:
+                wave_manager.update()
+            if (
+                not wave_manager.wave_in_progress
+                and self.enemy_count == 0
+                and wave_manager.current_wave <= len(self.wave_definitions)
+            ):
+                wave_manager.start_next_wave()
+
+        # ----- Mensagem pós-waves (sala 1) -----
+        if (
+            wave_manager
+            and wave_manager.current_wave > len(self.wave_definitions)
+            and self.enemy_count == 0
+        ):
+            self.show_patio_prompt = True
+            if keys[pygame.K_e]:
+                room_manager.next_room()
+                self.ground_level = room_manager.get_ground_level()
+                self.player.rect.bottom = self.ground_level
+                self.position_player_for_room(room_manager.current_room)
+                self.player.prev_anchor = None  # teleporte: sem interpolação
+                self.player.health = self.player.max_health
+                self.wave_metrics = wave_manager.metrics()
+                self.wave_manager = None
+                self._clear_enemies()
+
+                if room_manager.current_room == 2:
+                    self._spawn_boss()
+
+    def _update_boss(self, keys, dt):
+        """Diálogo (boss passivo) e depois a luta na sala do boss."""
+        boss = self.boss
+        if self.room_manager.current_room != 2 or not boss:
+            return
+
+        if boss.passive:
+            boss.animate(dt)  # passivo: trava no quadro 3 do "pray"
+            if self.current_dialogue_index < len(BOSS_DIALOGUE):
+                if self.time_ms - self.dialogue_start_time > DIALOGUE_LINE_MS:
+                    self.current_dialogue_index += 1
+                    self.dialogue_start_time = self.time_ms
+            else:
+                boss.passive, boss.state = False, "idle"
+        else:
+            self.boss_group.update(self.player, dt)
+
+        if self.boss_defeated and keys[pygame.K_e]:
+            self.running = False
@@ -0,0 +1,114 @@
+"""
+Modo de simulação headless do Hollow Mooni.
+
+Roda o `Game` sem janela nem som de verdade (drivers `dummy` do SDL),
+sem desenhar nada e sem esperar o relógio: cada tick é só lógica, então
+uma luta inteira leva o tempo que a CPU levar pra calcular. Serve pra
+balanceamento e teste de regressão em máquina de CI sem placa de vídeo.
+
+A entrada vem de um roteiro (`policy`) em vez do teclado:
+
+    from core.headless import init_headless, run, KeyState
+    init_headless()
+    result = run(lambda game: KeyState({pygame.K_e}), max_ticks=600)
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402  (precisa vir depois das variáveis de ambiente)
+
+from core.timing import FIXED_DT  # noqa: E402
+
+
+def init_headless():
+    """
+    Inicializa o Pygame com drivers `dummy` e uma janela fake 1×1.
+
+    A janela só existe porque `convert_alpha` precisa de um formato de
+    tela pros sprites; nada é mostrado.
+    """
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+class KeyState:
+    """
+    Estado de teclado roteirizado, no formato de `pygame.key.get_pressed()`.
+
+    Parâmetros
+    ----------
+    pressed : iterable[int], opcional
+        Códigos `pygame.K_*` apertados neste tick.
+    """
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+NO_KEYS = KeyState()
+
+
+def run(policy, max_ticks, game=None, dt=FIXED_DT, stop=None):
+    """
+    Roda uma partida headless até `max_ticks` ou até o jogo terminar.
+
+    Parameters
+    ----------
+    policy : Callable[[Game], KeyState]
+        Chamado a cada tick com o jogo; devolve as teclas apertadas.
+    max_ticks : int
+        Limite de ticks simulados.
+    game : Game, opcional
+        Partida já montada (padrão = uma nova, sem cenários).
+    dt : float, opcional
+        Duração de cada tick em segundos.
+    stop : Callable[[Game], bool], opcional
+        Condição extra de parada, testada depois de cada tick.
+
+    Returns
+    -------
+    dict
+        Resumo da partida no fim (ver `summary`).
+    """
+    from core.game import Game  # importa entidades só depois do `init_headless`
+
+    if game is None:
+        game = Game(1280, 720, load_scenery=False)
+
+    for _ in range(max_ticks):
+        game.update(policy(game), dt)
+        if not game.running or (stop is not None and stop(game)):
+            break
+
+    return summary(game)
+
+
+def summary(game):
+    """
+    Resumo do estado de uma partida (o mesmo dict devolvido por `run`).
+
+    Returns
+    -------
+    dict
+        `ticks`, `game_time_s`, `room`, `player_health`, `player_alive`,
+        `boss_hp` (`None` sem boss), `boss_defeated` e `restarts`.
+    """
+    return {
+        "ticks": game.ticks,
+        "game_time_s": game.elapsed_ms / 1000,
+        "room": game.current_room,
+        "player_health": game.player.health,
+        "player_alive": game.player.alive,
+        "boss_hp": game.boss.hp if game.boss else None,
+        "boss_defeated": game.boss_defeated,
+        "restarts": game.restarts,
+    }
@@ -0,0 +1,268 @@
+"""
+Trilha sonora assíncrona (**MusicPlayer**) do Hollow Mooni.
+
+`pygame.mixer.music.load` abre o mp3 e monta o decodificador na thread
+principal, e trocar de música no meio do jogo (sala nova, boss) travaria
+o frame que pediu a troca. Aqui cada faixa é decodificada inteira numa
+thread de fundo (`pygame.mixer.Sound` solta a GIL enquanto decodifica) e
+fica pronta na memória; tocar, trocar e fazer crossfade são só chamadas
+de canal (`Channel.play(fade_ms=...)` / `Channel.fadeout`), que não
+esperam nada.
+
+A faixa da próxima sala é pedida com `prefetch` assim que o player entra
+na atual (ver `RoomManager`), então a troca já encontra o áudio pronto.
+Toda operação no mixer feita na thread principal é cronometrada; as que
+passam de `SLOW_OP_MS` ficam registradas com o número do frame em
+`slow_ops` e no canal `music` do `event_log`. Uma faixa que não
+decodifica (arquivo ausente ou corrompido) também vai pro canal e o
+pedido é descartado: a música atual segue tocando.
+
+Uso típico (no main):
+    from core.music import music_player
+    music_player.play("assets/sounds/backgroundprinci.mp3")  # não bloqueia
+    ...
+    music_player.update()   # 1x por frame: começa o que ficou pronto
+"""
+
+import collections
+import contextlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from core.event_log import event_log
+from core.sound_bank import reserve_channels, sound_bank
+
+DEFAULT_FADE_MS = 1200     # duração do crossfade entre faixas
+DEFAULT_VOLUME = 0.5
+SLOW_OP_MS = 1.0           # operação de música acima disso = frame registrado
+MAX_TRACKS = 3             # faixas decodificadas mantidas na memória (~14 MB/min cada)
+
+music_log = event_log.channel("music")
+
+
+def _fade_out(channel, fade_ms):
+    if fade_ms:
+        channel.fadeout(fade_ms)
+    else:
+        channel.stop()
+
+
+class MusicPlayer:
+    """
+    Faixas decodificadas em background e tocadas em dois canais (crossfade).
+
+    Parâmetros
+    ----------
+    first_channel : int, opcional
+        Primeiro dos dois canais do mixer usados pela música (padrão =
+        logo depois dos canais reservados do `sound_bank`).
+    volume : float, opcional
+        Volume da música (0.0–1.0).
+    max_tracks : int, opcional
+        Quantas faixas decodificadas ficam na memória; as mais antigas
+        (que não estão tocando) saem primeiro.
+    slow_ms : float, opcional
+        Limite (ms) a partir do qual uma operação entra em `slow_ops`.
+    """
+
+    def __init__(self, first_channel=None, volume=DEFAULT_VOLUME, max_tracks=MAX_TRACKS,
+                 slow_ms=SLOW_OP_MS):
+        self.first_channel = sound_bank.n_channels if first_channel is None else first_channel
+        self.volume = volume
+        self.max_tracks = max_tracks
+        self.slow_ms = slow_ms
+        self.enabled = True
+
+        self._executor = None
+        self._tracks = {}     # caminho → Sound (ordem = uso, mais antigo primeiro)
+        self._pending = {}    # caminho → future da decodificação
+        self._channels = None
+        self._active = 0      # índice do canal com a faixa atual
+        self._wanted = None   # (caminho, fade_ms) esperando a decodificação
+        self.current = None   # caminho da faixa tocando (ou indo tocar)
+
+        self.frame = 0
+        self.decoded = 0
+        self.crossfades = 0
+        self.slow_ops = collections.deque(maxlen=64)  # (frame, operação, ms)
+
+    # ------------------------------------------------------------------
+    # medição
+    # ------------------------------------------------------------------
+    @contextlib.contextmanager
+    def _timed(self, op):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            if ms > self.slow_ms:
+                self.slow_ops.append((self.frame, op, ms))
+                music_log.warn("slow_op", self.frame, op, ms)
+
+    def _ready(self):
+        return self.enabled and pygame.mixer.get_init() is not None
+
+    def _ensure_channels(self):
+        if self._channels is None:
+            reserve_channels(self.first_channel + 2)
+            self._channels = [pygame.mixer.Channel(self.first_channel + i) for i in range(2)]
+        return self._channels
+
+    # ------------------------------------------------------------------
+    # decodificação em background
+    # ------------------------------------------------------------------
+    def prefetch(self, path):
+        """Agenda a decodificação de `path` (não bloqueia; repetido é ignorado)."""
+        if not self._ready() or path is None or path in self._tracks or path in self._pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+        self._pending[path] = self._executor.submit(pygame.mixer.Sound, path)
+
+    def is_ready(self, path):
+        """`True` se a faixa já está decodificada."""
+        return path in self._tracks
+
+    def _collect(self):
+        """Move as decodificações terminadas pra `_tracks` (as que falharam são descartadas)."""
+        for path, future in list(self._pending.items()):
+            if future.done():
+                del self._pending[path]
+                try:
+                    sound = future.result()
+                except (pygame.error, OSError) as error:
+                    music_log.warn("decode_failed", path, error)
+                    self._drop(path)
+                    continue
+                self._tracks[path] = sound
+                self.decoded += 1
+        while len(self._tracks) > self.max_tracks:
+            oldest = next((p for p in self._tracks if p != self.current), None)
+            if oldest is None:
+                break
+            del self._tracks[oldest]
+
+    def _drop(self, path):
+        """Esquece o pedido de `path` (decodificação falhou); quem está tocando segue."""
+        if self._wanted is not None and self._wanted[0] == path:
+            self._wanted = None
+        if self.current == path:
+            self.current = self._playing_path()
+
+    def _playing_path(self):
+        """Caminho da faixa no canal ativo (ou `None`)."""
+        if self._channels is None:
+            return None
+        sound = self._channels[self._active].get_sound()
+        return next((p for p, s in self._tracks.items() if s is sound), None)
+
+    # ------------------------------------------------------------------
+    # tocar
+    # ------------------------------------------------------------------
+    def play(self, path, fade_ms=DEFAULT_FADE_MS):
+        """
+        Troca a música pra `path` com crossfade (em loop).
+
+        Se a faixa ainda não foi decodificada, ela é pedida agora e começa
+        no primeiro `update()` depois de ficar pronta; a faixa anterior
+        continua tocando até lá. Pedir a faixa que já toca não faz nada.
+
+        Parameters
+        ----------
+        path : str
+            Arquivo de áudio.
+        fade_ms : int, opcional
+            Duração do crossfade (0 = troca seca).
+        """
+        if not self._ready() or path is None or path == self.current:
+            return
+        self.current = path
+        self._wanted = (path, fade_ms)
+        self.prefetch(path)
+        self._start_wanted()
+
+    def _start_wanted(self):
+        path, fade_ms = self._wanted
+        sound = self._tracks.get(path)
+        if sound is None:
+            return
+        self._wanted = None
+        self._tracks[path] = self._tracks.pop(path)  # mais recente no fim
+
+        with self._timed(f"crossfade {path}"):
+            channels = self._ensure_channels()
+            old = channels[self._active]
+            self._active ^= 1
+            new = channels[self._active]
+            if old.get_busy():
+                _fade_out(old, fade_ms)
+                self.crossfades += 1
+            new.set_volume(self.volume)
+            new.play(sound, loops=-1, fade_ms=fade_ms)
+
+    def stop(self, fade_ms=DEFAULT_FADE_MS):
+        """Some com a música (fade out)."""
+        self.current = self._wanted = None
+        if self._channels is None:
+            return
+        with self._timed("stop"):
+            for channel in self._channels:
+                _fade_out(channel, fade_ms)
+
+    def set_volume(self, volume):
+        """Muda o volume da música (0.0–1.0)."""
+        self.volume = volume
+        if self._channels is not None:
+            self._channels[self._active].set_volume(volume)
+
+    def update(self):
+        """
+        Chamado 1x por frame: recolhe decodificações e começa a faixa pedida.
+
+        Nunca espera a thread de decodificação.
+        """
+        self.frame += 1
+        if not self._pending:
+            return
+        with self._timed("update"):
+            self._collect()
+            if self._wanted is not None:
+                self._start_wanted()
+
+    def shutdown(self):
+        """Para a música e encerra a thread de decodificação (fim do jogo)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+        if self._channels is not None:
+            for channel in self._channels:
+                channel.stop()
+
+    # ------------------------------------------------------------------
+    def stats(self):
+        """
+        Retorna contadores do player.
+
+        Returns
+        -------
+        dict
+            `current`, `tracks` (decodificadas na memória), `pending`,
+            `decoded`, `crossfades` e `slow_ops` (frames com operação
+            acima de `slow_ms`).
+        """
+        return {
+            "current": self.current,
+            "tracks": len(self._tracks),
+            "pending": len(self._pending),
+            "decoded": self.decoded,
+            "crossfades": self.crossfades,
+            "slow_ops": len(self.slow_ops),
+        }
+
+
+# instância única usada pelo jogo
+music_player = MusicPlayer()
@@ -1,6 +1,7 @@
 """
 Módulo do inimigo **NightBorne**  guerreiro sombrio que corre pra cima
-do player, desce a espadada e cai fora quando bate as botas.
+do player, desce a espadada (hitbox de `hitbox_data`, resolvido pelo
+`core.combat`) e cai fora quando bate as botas.
 
 Fluxo padrão dentro do jogo:
     nb = NightBorneEnemy((x, ground_y), "assets/enemies/nightborne.png")
@@ -11,8 +12,18 @@ Fluxo padrão dentro do jogo:
 
 import pygame
 
+from core.animation import END, Animated, Animator, compile_clips
+from core.asset_cache import asset_cache
+from core.atlas import blit_item
+from core.clock import game_clock
+from core.combat import ENEMY, Hitbox, compile_hitboxes
+from core.event_log import event_log
+from core.timing import FIXED_DT, interpolate
 
-class NightBorneEnemy(pygame.sprite.Sprite):
+combat_log = event_log.channel("combat")
+
+
+class NightBorneEnemy(Animated, pygame.sprite.Sprite):
     """
     Inimigo NightBorne: corre, ataca, toma dano e morre.
 
@@ -20,42 +31,69 @@ class NightBorneEnemy(pygame.sprite.Sprite):
     ----------
     pos : tuple[int, int]
         Posição inicial (x, y) onde o pé deve encostar no chão.
-    sprite_sheet_path : str
+    sprite_sheet_path : str, opcional
         Caminho para o sprite-sheet que contém todas as animações.
     """
 
-    def __init__(self, pos, sprite_sheet_path):
+    default_sheet = "assets/enemies/nightborne/NightBorne.png"
+
+    # estado → (linha do sheet, nº de frames)
+    animation_rows = {
+        "idle": (0, 9),
+        "run": (1, 6),
+        "attack": (2, 12),
+        "hurt": (3, 5),
+        "death": (4, 18),
+    }
+    animation_fps = 12  # quadros/s
+    clip_data = {}      # tudo em loop; o fim de attack/hurt/death é tratado no `animate`
+
+    # golpe (ver `core.combat`): o arco da espada nos quadros 9–10, à frente
+    hitbox_data = {
+        "attack": {"frames": (9, 10), "anchor": "midbottom", "rect": (0, -120, 76, 116)},
+    }
+
+    def __init__(self, pos, sprite_sheet_path=default_sheet):
         super().__init__()
 
-        self.sprite_sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
         self.frame_width = 80
         self.frame_height = 80
+        self.sprite_sheet_path = None
+        self.reset(pos, sprite_sheet_path)
 
-        # dicionário de animações (linha → nº de frames)
-        self.animations = {
-            "idle": self.load_animation(0, 9),
-            "run": self.load_animation(1, 6),
-            "attack": self.load_animation(2, 12),
-            "hurt": self.load_animation(3, 5),
-            "death": self.load_animation(4, 18),
-        }
+    def reset(self, pos, sprite_sheet_path=default_sheet):
+        """
+        Volta ao estado de spawn em `pos` (reuso pelo `sprite_pools`).
+
+        As animações só são recortadas de novo se o sheet mudar.
+        """
+        if sprite_sheet_path != self.sprite_sheet_path:
+            self.sprite_sheet_path = sprite_sheet_path
+            # dicionário de animações (linha → nº de frames)
+            self.animations = {
+                state: self.load_animation(row, num_frames)
+                for state, (row, num_frames) in self.animation_rows.items()
+            }
+            self.anim = Animator(
+                compile_clips(self.animations, self.clip_data, self.animation_fps), "idle"
+            )
+            self.hitbox = Hitbox(self, compile_hitboxes(self.anim.clips, self.hitbox_data), ENEMY)
 
-        self.state = "idle"
-        self.frame_index = 0
-        self.animation_speed = 0.2
-        self.image = self.animations[self.state][int(self.frame_index)]
+        self.anim.reset("idle")
+        self.hitbox.reset()
+        self.image = self.animations["idle"][0]
 
         # ✅ midbottom pra alinhar certinho no chão
         self.rect = self.image.get_rect(midbottom=(pos[0], pos[1]))
+        self.prev_anchor = None  # midbottom do tick anterior (interpolação)
 
-        self.speed = 4
+        self.speed = 240  # px/s
         self.health = 100
-        self.damage = 20
+        self.attack_damage = {"attack": 20}  # dano por golpe de `hitbox_data`
         self.attack_cooldown = 1000
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = game_clock.get_ticks()
 
         self.facing_right = True
-        self.recently_hit = False
         self.attacking = False
         self.hurt = False
 
@@ -68,35 +106,32 @@ class NightBorneEnemy(pygame.sprite.Sprite):
 
         Retorna
         -------
-        list[pygame.Surface]
-            Frames redimensionados (2×) prontos pra usar.
+        tuple[pygame.Surface]
+            Frames redimensionados (2×) prontos pra usar, compartilhados
+            via `asset_cache`.
         """
-        frames = []
-        for i in range(num_frames):
-            frame = self.sprite_sheet.subsurface(
-                pygame.Rect(
-                    i * self.frame_width,
-                    row * self.frame_height,
-                    self.frame_width,
-                    self.frame_height,
-                )
-            )
-            # ✅ Escalona pra ficar do mesmo tamanho dos outros mobs
-            frame = pygame.transform.scale(frame, (self.frame_width * 2, self.frame_height * 2))
-            frames.append(frame)
-        return frames
+        # ✅ Escala 2× pra ficar do mesmo tamanho dos outros mobs
+        return asset_cache.grid(
+            self.sprite_sheet_path,
+            (self.frame_width, self.frame_height),
+            num_frames,
+            cols=num_frames,
+            row=row,
+        )
 
     # ------------------------------------------------------------------
     # loop de lógica
     # ------------------------------------------------------------------
-    def update(self, player):
+    def update(self, player, dt=FIXED_DT):
         """
         Decide estado (idle/run/attack…), move e chama animação.
 
         Parameters
         ----------
         player : Player
-            Referência ao jogador pra calcular distância e dano.
+            Referência ao jogador pra calcular a distância.
+        dt : float, opcional
+            Duração do tick em segundos.
         """
         if self.health <= 0:
             self.state = "death"
@@ -110,66 +145,63 @@ class NightBorneEnemy(pygame.sprite.Sprite):
                 self.state = "run"
                 direction = 1 if distance > 0 else -1
                 self.facing_right = direction > 0
-                self.rect.x += direction * self.speed
+                self.rect.x += direction * self.speed * dt
                 if abs(distance) < 50:
-                    now = pygame.time.get_ticks()
+                    now = game_clock.get_ticks()
                     if now - self.last_attack_time > self.attack_cooldown:
                         self.attacking = True
                         self.last_attack_time = now
-                        self.attack(player)
+                        self.anim.restart()  # o golpe começa do quadro 0
             else:
                 self.state = "idle"
 
-        self.animate()
+        self.animate(dt)
+        # golpe ativo neste quadro? (o `Game` resolve o dano no fim do tick)
+        self.hitbox.sync(self.anim, self.rect, self.facing_right)
 
     # ------------------------------------------------------------------
     # ações
     # ------------------------------------------------------------------
-    def attack(self, player):
-        """Aplica dano direto no player."""
-        player.take_damage(self.damage)
-
     def take_damage(self, amount):
         """Recebe dano e troca pra animação de machucado ou morte."""
         self.health -= amount
+        combat_log.info("hit", "nightborne", amount, self.health)
         if self.health <= 0:
             self.state = "death"
         else:
             self.hurt = True
-            self.frame_index = 0
+            self.anim.restart()
 
     # ------------------------------------------------------------------
     # animação e renderização
     # ------------------------------------------------------------------
-    def animate(self):
+    def animate(self, dt=FIXED_DT):
         """
         Avança frames da animação atual e trata transições
         (fim de ataque, fim de hurt, morte).
         """
-        frames = self.animations[self.state]
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(frames):
-            self.frame_index = 0
-            if self.state == "attack":
+        anim = self.anim
+        if anim.advance(dt) == END:
+            if anim.state == "attack":
                 self.attacking = False
-            if self.state == "hurt":
+            if anim.state == "hurt":
                 self.hurt = False
-            if self.state == "death":
+            if anim.state == "death":
                 self.kill()
 
-        image = frames[int(self.frame_index)]
-        if not self.facing_right:
-            image = pygame.transform.flip(image, True, False)
-
         # ✅ mantém midbottom pra não deslizar verticalmente
         bottom = self.rect.bottom
         centerx = self.rect.centerx
-        self.image = image
+        self.image = self.animations[anim.state].facing(not self.facing_right)[anim.frame]
         self.rect = self.image.get_rect(midbottom=(centerx, bottom))
 
         # ✅ se quiser um hitbox menor, descomenta:
         # self.rect.inflate_ip(-20, -20)
 
-    def draw(self, surface):
-        """Desenha o frame atual na tela."""
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0):
+        """Desenha o frame atual (interpolado por `alpha`) e devolve o `Rect` afetado."""
+        return surface.blit(*self.blit_item(alpha))
+
+    def blit_item(self, alpha=1.0):
+        """Item `(imagem, destino[, área])` deste frame pro `Surface.blits` da camada."""
+        return blit_item(self.image, interpolate(self.rect, self.prev_anchor, alpha))
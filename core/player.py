@@ -6,17 +6,31 @@ Funções principais:
 - Recebe input do teclado pra andar, pular e atacar.  
 - Gerencia física simples (gravidade e colisão com o chão).  
 - Controla animações e toca efeitos de som dos golpes.  
+- Declara os hitboxes dos golpes (`hitbox_data`, resolvidos pelo `core.combat`).  
+
+Velocidades e acelerações estão em unidades por segundo e `update`
+recebe o passo `dt` (s) do loop de passo fixo (`core.timing`).
 
 Uso típico no jogo:
     player = Player((x_inicial, y_inicial))
-    player.update(keys, ground_y, SCREEN_WIDTH)
-    player.draw(screen)
+    player.update(keys, ground_y, SCREEN_WIDTH, dt)
+    player.draw(screen, alpha)
 """
 
 import pygame
 import os  # ainda não usamos, mas deixo por consistência
 
-class Player(pygame.sprite.Sprite):
+from core.animation import Animated, Animator, compile_clips
+from core.asset_cache import asset_cache
+from core.atlas import blit_item
+from core.combat import PLAYER, Hitbox, compile_hitboxes
+from core.event_log import event_log
+from core.sound_bank import sound_bank
+from core.timing import FIXED_DT, interpolate
+
+combat_log = event_log.channel("combat")
+
+class Player(Animated, pygame.sprite.Sprite):
     """
     Classe que representa o personagem jogável Mooni.
 
@@ -26,42 +40,58 @@ class Player(pygame.sprite.Sprite):
         Posição inicial (topleft) no mapa.
     """
 
+    # sprite-sheets + nº de frames (no nível da classe pro loader/bake enxergarem)
+    animation_data = {
+        "idle": ("assets/player/Little Mooni-Idle.png", 8),
+        "run": ("assets/player/Little Mooni-Run.png", 8),
+        "smash": ("assets/player/Little Mooni-Smash.png", 17),
+        "thrust": ("assets/player/Little Mooni-Thrust.png", 13),
+        "heal": ("assets/player/Little Mooni-Heal.png", 18),
+        "death": ("assets/player/Little Mooni-Death.png", 29),
+    }
+
+    # clipes (ver `core.animation`): golpes voltam pro idle
+    animation_fps = 9  # quadros/s
+    clip_data = {
+        "smash": {"fps": 18, "end": "idle"},
+        "thrust": {"end": "idle"},
+        "heal": {"end": "idle"},
+    }
+
+    # golpes (ver `core.combat`): quadros em que acertam e retângulo relativo à âncora
+    hitbox_data = {
+        "smash": {"frames": (8, 12), "anchor": "midtop", "rect": (0, 20, 96, 80)},
+        "thrust": {"frames": (6, 6), "anchor": "center", "rect": (0, -5, 100, 10)},
+    }
+
+    # sons de ataque: arquivo, cópias simultâneas, cooldown (ms) — tocados pelo `sound_bank`
+    sound_data = {
+        "thrust": ("assets/sounds/thrust.mp3", 2, 150),
+        "smash": ("assets/sounds/smash.mp3", 2, 150),
+    }
+
     def __init__(self, pos):
         super().__init__()
 
-        # sons de ataque
-        self.sword_thrust_sound = pygame.mixer.Sound("assets/sounds/thrust.mp3")
-        self.sword_smash_sound = pygame.mixer.Sound("assets/sounds/smash.mp3")
-
-        # sprite-sheets + nº de frames
-        self.animation_data = {
-            "idle": ("assets/player/Little Mooni-Idle.png", 8),
-            "run": ("assets/player/Little Mooni-Run.png", 8),
-            "smash": ("assets/player/Little Mooni-Smash.png", 17),
-            "thrust": ("assets/player/Little Mooni-Thrust.png", 13),
-            "heal": ("assets/player/Little Mooni-Heal.png", 18),
-            "death": ("assets/player/Little Mooni-Death.png", 29),
-        }
-
         # dicionário final de animações
         self.animations = {
             key: self.load_animation(path, count)
             for key, (path, count) in self.animation_data.items()
         }
 
-        self.state = "idle"
-        self.frame_index = 0
-        self.animation_speed = 0.15
-        self.image = self.animations[self.state][self.frame_index]
+        self.anim = Animator(compile_clips(self.animations, self.clip_data, self.animation_fps), "idle")
+        self.hitbox = Hitbox(self, compile_hitboxes(self.anim.clips, self.hitbox_data), PLAYER)
+        self.image = self.animations["idle"][0]
 
         # ✅ usa primeira frame do idle pra setar rect
         self.rect = self.animations["idle"][0].get_rect(topleft=pos)
+        self.prev_anchor = None  # midbottom do tick anterior (interpolação)
 
-        # movimento / física
+        # movimento / física (px/s e px/s²)
         self.vel = pygame.math.Vector2(0, 0)
-        self.speed = 3
-        self.gravity = 1.5
-        self.jump_speed = -25
+        self.speed = 180
+        self.gravity = 5400
+        self.jump_speed = -1500
         self.on_ground = True
         self.facing_right = True
 
@@ -72,7 +102,7 @@ class Player(pygame.sprite.Sprite):
 
         self.ground_offset = 0  # gambi pra ajustar se precisar
 
-        # dano dos ataques
+        # dano dos ataques (por golpe de `hitbox_data`)
         self.attack_damage = {"smash": 15, "thrust": 10}
 
     # ------------------------------------------------------------------
@@ -80,25 +110,20 @@ class Player(pygame.sprite.Sprite):
         """
         Carrega `num_frames` de um sprite-sheet horizontal.
 
+        Os frames vêm do `asset_cache`, então reiniciar o jogo não
+        decodifica os sheets de novo.
+
         Returns
         -------
-        list[pygame.Surface]
+        tuple[pygame.Surface]
             Frames já escalonados (2×) p/ inserir no dicionário.
         """
-        sheet = pygame.image.load(sheet_path).convert_alpha()
-        frame_width = sheet.get_width() // num_frames
-        frames = [
-            pygame.transform.scale(
-                sheet.subsurface(i * frame_width, 0, frame_width, sheet.get_height()),
-                (frame_width * 2, sheet.get_height() * 2),
-            )
-            for i in range(num_frames)
-        ]
-        return frames
+        return asset_cache.sheet(sheet_path, num_frames)
 
     # ------------------------------------------------------------------
     def input(self, keys):
         """Processa teclas WASD/ESPAÇO/Q/R pra definir estado e velocidade."""
+        previous = self.state
         if keys[pygame.K_a]:
             self.vel.x = -self.speed
             self.state = "run"
@@ -112,13 +137,13 @@ class Player(pygame.sprite.Sprite):
             if self.on_ground:
                 self.state = "idle"
 
-        # ataques
+        # ataques (o som sai uma vez por golpe, não a cada tick com a tecla apertada)
         if keys[pygame.K_r]:
             self.state = "smash"
-            self.sword_smash_sound.play()
         if keys[pygame.K_q]:
             self.state = "thrust"
-            self.sword_thrust_sound.play()
+        if self.state != previous and self.state in ("smash", "thrust"):
+            sound_bank.play(self.state)
 
         # pulo
         if keys[pygame.K_SPACE] and self.on_ground:
@@ -126,43 +151,35 @@ class Player(pygame.sprite.Sprite):
             self.on_ground = False
 
     # ------------------------------------------------------------------
-    def apply_gravity(self, ground_level):
+    def apply_gravity(self, ground_level, dt=FIXED_DT):
         """Aplica gravidade e impede que Mooni atravesse o chão."""
-        self.vel.y += self.gravity
-        self.rect.y += self.vel.y
+        self.vel.y += self.gravity * dt
+        self.rect.y += self.vel.y * dt
         if self.rect.bottom >= ground_level - self.ground_offset:
             self.rect.bottom = ground_level - self.ground_offset
             self.on_ground = True
             self.vel.y = 0
 
     # ------------------------------------------------------------------
-    def animate(self):
-        """Avança frame da animação atual (velocidade extra no smash)."""
-        frames = self.animations[self.state]
-        speed = self.animation_speed * 2 if self.state == "smash" else self.animation_speed
-        self.frame_index += speed
-        if self.frame_index >= len(frames):
-            self.frame_index = 0
-            if self.state in ["smash", "thrust", "heal"]:
-                self.state = "idle"
-
-        image = frames[int(self.frame_index)]
-        if not self.facing_right:
-            image = pygame.transform.flip(image, True, False)
-        self.image = image
+    def animate(self, dt=FIXED_DT):
+        """Avança um tick do clipe atual (golpes terminam no idle, ver `clip_data`)."""
+        anim = self.anim
+        anim.advance(dt)
+        self.image = self.animations[anim.state].facing(not self.facing_right)[anim.frame]
 
     # ------------------------------------------------------------------
     def take_damage(self, amount):
         """Reduz HP e muda pro estado de morte se zerar."""
         self.health -= amount
+        combat_log.info("hit", "player", amount, self.health)
         if self.health <= 0:
             self.alive = False
             self.state = "death"
 
     # ------------------------------------------------------------------
-    def update(self, keys, ground_level, screen_width):
+    def update(self, keys, ground_level, screen_width, dt=FIXED_DT):
         """
-        Loop principal do player: movimento, física, animação e limites.
+        Um tick do player: movimento, física, animação e limites.
 
         Parameters
         ----------
@@ -172,24 +189,41 @@ class Player(pygame.sprite.Sprite):
             Y do chão pra colisão vertical.
         screen_width : int
             Limite horizontal da tela (0 à direita).
+        dt : float, opcional
+            Duração do tick em segundos.
         """
         if not self.alive:
             self.state = "death"
-            self.animate()
+            self.animate(dt)
             return
 
         self.input(keys)
-        self.animate()
+        self.animate(dt)
 
         # move horizontal
-        self.rect.x += self.vel.x
+        self.rect.x += self.vel.x * dt
         self.rect.left = max(self.rect.left, 0)
         self.rect.right = min(self.rect.right, screen_width)
 
         # aplica gravidade
-        self.apply_gravity(ground_level)
+        self.apply_gravity(ground_level, dt)
+
+        # golpe ativo neste quadro? (o `Game` resolve o dano no fim do tick)
+        self.hitbox.sync(self.anim, self.rect, self.facing_right)
 
     # ------------------------------------------------------------------
-    def draw(self, surface):
-        """Renderiza o frame atual na tela."""
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0):
+        """
+        Renderiza o frame atual na tela e devolve o `Rect` afetado.
+
+        `alpha` interpola a posição entre o tick anterior e o atual.
+        """
+        return surface.blit(*self.blit_item(alpha))
+
+    def blit_item(self, alpha=1.0):
+        """Item `(imagem, destino[, área])` deste frame pro `Surface.blits` da camada."""
+        return blit_item(self.image, interpolate(self.rect, self.prev_anchor, alpha))
+
+
+for _name, (_path, _max_concurrent, _cooldown_ms) in Player.sound_data.items():
+    sound_bank.register(_name, _path, max_concurrent=_max_concurrent, cooldown_ms=_cooldown_ms)
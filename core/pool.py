@@ -0,0 +1,139 @@
+"""
+Pools de sprites reutilizáveis (**SpritePools**) do Hollow Mooni.
+
+Antes, cada feitiço do Bringer e cada inimigo de cada onda era um objeto
+novo, jogado fora no `kill()` / `all_enemies.empty()`. Aqui cada classe
+tem uma pilha de instâncias livres: `acquire` devolve uma delas rearmada
+com `reset(...)` (mesmos argumentos do construtor) ou, se a pilha
+estiver vazia, cria uma nova. Quem sai de todos os grupos (`kill()`,
+`Group.empty()`) volta pra pilha no próximo `reclaim()`.
+
+Em regime — ondas e feitiços se repetindo — nenhum sprite novo é criado.
+
+Uso típico:
+    from core.pool import sprite_pools
+    spell = sprite_pools.acquire(SpellEffect, pos, frames)
+    spell_group.add(spell)
+    ...
+    sprite_pools.reclaim()   # 1x por tick
+"""
+
+
+class Pool:
+    """
+    Pilha de instâncias livres de uma classe de sprite.
+
+    Parâmetros
+    ----------
+    cls : type
+        Classe com `reset(*args, **kwargs)` aceitando os mesmos
+        argumentos do construtor.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self._free = []
+        self._live = []
+
+        self.created = 0      # instâncias construídas de verdade
+        self.reused = 0       # acquires atendidos pela pilha
+        self.high_water = 0   # máximo de instâncias em uso ao mesmo tempo
+
+    @property
+    def in_use(self):
+        """Instâncias entregues e ainda em algum grupo (até o próximo `reclaim`)."""
+        return len(self._live)
+
+    def acquire(self, *args, **kwargs):
+        """Instância pronta pro spawn (reaproveitada se houver uma livre)."""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self._live.append(obj)
+        self.high_water = max(self.high_water, len(self._live))
+        return obj
+
+    def release(self, obj):
+        """Devolve `obj` pra pilha (sai de todos os grupos)."""
+        obj.kill()
+        self._live.remove(obj)
+        self._free.append(obj)
+
+    def reclaim(self):
+        """Devolve pra pilha quem não está em nenhum grupo; retorna quantos."""
+        live = self._live
+        if all(obj.alive() for obj in live):
+            return 0
+        self._live = [obj for obj in live if obj.alive()]
+        freed = [obj for obj in live if not obj.alive()]
+        self._free.extend(freed)
+        return len(freed)
+
+    def stats(self):
+        """Contadores do pool (ver `SpritePools.stats`)."""
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "in_use": len(self._live),
+            "free": len(self._free),
+            "high_water": self.high_water,
+        }
+
+
+class SpritePools:
+    """
+    Um `Pool` por classe, criado na primeira vez que ela é pedida.
+
+    Parâmetros
+    ----------
+    enabled : bool, opcional
+        Com `False` todo `acquire` constrói uma instância nova (caminho
+        antigo; útil pra comparar em benchmark).
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._pools = {}
+
+    def pool(self, cls):
+        """`Pool` da classe `cls`."""
+        pool = self._pools.get(cls)
+        if pool is None:
+            pool = self._pools[cls] = Pool(cls)
+        return pool
+
+    def acquire(self, cls, *args, **kwargs):
+        """Atalho pra `pool(cls).acquire(...)`."""
+        pool = self.pool(cls)
+        if not self.enabled:
+            pool.created += 1
+            return cls(*args, **kwargs)
+        return pool.acquire(*args, **kwargs)
+
+    def reclaim(self):
+        """`reclaim()` em todos os pools; retorna quantos voltaram."""
+        return sum(pool.reclaim() for pool in self._pools.values())
+
+    def stats(self):
+        """
+        Contadores de cada pool.
+
+        Returns
+        -------
+        dict[str, dict]
+            Nome da classe → `created`, `reused`, `in_use`, `free` e
+            `high_water` (pico de instâncias vivas).
+        """
+        return {cls.__name__: pool.stats() for cls, pool in self._pools.items()}
+
+    def clear(self):
+        """Esquece todas as instâncias (livres e em uso) e zera os contadores."""
+        self._pools.clear()
+
+
+# instância única usada pelo jogo
+sprite_pools = SpritePools()
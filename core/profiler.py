@@ -0,0 +1,295 @@
+"""
+Profiler de frame por subsistema (**FrameProfiler**) do Hollow Mooni.
+
+Cada fase do loop (update do player, ataque, inimigos, feitiços, boss,
+desenho da sala, HUD, flip…) roda dentro de um timer com escopo:
+
+    with profiler.scope("enemies.update"):
+        ...
+
+No fim do frame os tempos acumulados de cada fase viram uma amostra. O
+profiler guarda as últimas `window` amostras por fase (média, p95 e p99
+no overlay do F3) e, se houver um arquivo de exportação aberto, grava
+cada frame nele pra análise offline:
+
+- `.csv`: uma linha por (frame, fase) — `frame,phase,ms`;
+- `.json` / `.jsonl`: uma linha JSON por frame — `{"frame": n, "ms": {fase: ms}}`.
+
+Desligado (o padrão), `scope()` devolve sempre o mesmo contexto vazio e
+`end_frame()` retorna logo no começo: o custo é uma chamada de método
+por fase.
+
+Uso típico (no main):
+    from core.profiler import profiler
+    profiler.open_export("profile.csv")   # ou F3 pro overlay
+    ...
+    profiler.end_frame()        # 1x por frame, depois do flip
+    profiler.draw_overlay(screen)
+"""
+
+import json
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+from core.text_renderer import text_renderer
+
+DEFAULT_WINDOW = 240          # amostras por fase (4 s a 60 FPS)
+OVERLAY_REFRESH_FRAMES = 15   # overlay recalculado 4x por segundo a 60 FPS
+OVERLAY_FONT_SIZE = 18
+
+
+class _NullScope:
+    """Contexto vazio usado com o profiler desligado."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """
+    Timer de uma fase; um objeto por nome, reaproveitado a cada frame.
+
+    Não é reentrante: a mesma fase não pode estar aberta duas vezes ao
+    mesmo tempo (fases diferentes podem se aninhar).
+    """
+
+    __slots__ = ("totals", "name", "start")
+
+    def __init__(self, totals, name):
+        self.totals = totals
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = perf_counter() - self.start
+        totals = self.totals
+        totals[self.name] = totals.get(self.name, 0.0) + elapsed
+        return False
+
+
+def percentile(sorted_values, fraction):
+    """Valor no percentil `fraction` (0–1) de uma lista já ordenada (nearest-rank)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """
+    Timers com escopo por fase, janelas móveis e exportação por frame.
+
+    Parâmetros
+    ----------
+    window : int, opcional
+        Quantos frames entram na média / p95 / p99 de cada fase.
+    enabled : bool, opcional
+        Começa medindo (`True`) ou desligado (`False`, custo desprezível).
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.show_overlay = False
+
+        self.frame = 0                 # frames medidos
+        self._totals = {}              # fase → segundos acumulados no frame atual
+        self._scopes = {}              # fase → _Scope reaproveitado
+        self._samples = {}             # fase → deque[ms] das últimas `window` amostras
+        self._frame_start = perf_counter()
+
+        self._export = None
+        self._export_csv = False
+        self._overlay = None
+        self._overlay_age = OVERLAY_REFRESH_FRAMES
+
+    # ------------------------------------------------------------------
+    # medição
+    # ------------------------------------------------------------------
+    def scope(self, name):
+        """
+        Contexto que soma o tempo gasto dentro dele na fase `name`.
+
+        Uma fase aberta várias vezes no mesmo frame (vários ticks de
+        simulação num frame atrasado, por exemplo) acumula os tempos.
+        """
+        if not self.enabled:
+            return _NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self._totals, name)
+        return scope
+
+    def end_frame(self):
+        """
+        Fecha o frame: guarda uma amostra por fase e grava na exportação.
+
+        O tempo total do frame (desde o `end_frame` anterior) vira a fase
+        `"frame"`.
+        """
+        now = perf_counter()
+        if not self.enabled:
+            self._frame_start = now
+            return
+
+        totals = self._totals
+        totals["frame"] = now - self._frame_start
+        self._frame_start = now
+        self.frame += 1
+
+        frame_ms = {name: seconds * 1000 for name, seconds in totals.items()}
+        totals.clear()
+        samples = self._samples
+        for name, ms in frame_ms.items():
+            history = samples.get(name)
+            if history is None:
+                history = samples[name] = deque(maxlen=self.window)
+            history.append(ms)
+
+        if self._export is not None:
+            self._write(frame_ms)
+
+    def summary(self):
+        """
+        Estatísticas da janela atual por fase.
+
+        Returns
+        -------
+        dict[str, dict]
+            Fase → `avg`, `p95`, `p99` e `max` (ms) e `samples`.
+        """
+        result = {}
+        for name, history in self._samples.items():
+            values = sorted(history)
+            result[name] = {
+                "avg": sum(values) / len(values),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "max": values[-1],
+                "samples": len(values),
+            }
+        return result
+
+    def reset(self):
+        """Descarta as amostras (a exportação aberta continua)."""
+        self._samples.clear()
+        self._totals.clear()
+        self.frame = 0
+        self._overlay_age = OVERLAY_REFRESH_FRAMES
+
+    def toggle(self):
+        """
+        Liga/desliga o overlay (tecla F3).
+
+        A medição fica ligada enquanto houver overlay na tela ou um
+        arquivo de exportação aberto.
+        """
+        self.show_overlay = not self.show_overlay
+        self.enabled = self.show_overlay or self._export is not None
+        if not self.enabled:
+            self._totals.clear()
+
+    # ------------------------------------------------------------------
+    # exportação
+    # ------------------------------------------------------------------
+    def open_export(self, path):
+        """
+        Começa a gravar cada frame em `path` (liga a medição).
+
+        A extensão escolhe o formato: `.csv` (`frame,phase,ms`) ou JSON
+        Lines (qualquer outra, ex.: `.jsonl`).
+        """
+        self.close_export()
+        self._export = open(path, "w", encoding="utf-8", newline="")
+        self._export_csv = path.lower().endswith(".csv")
+        if self._export_csv:
+            self._export.write("frame,phase,ms\n")
+        self.enabled = True
+
+    def close_export(self):
+        """Fecha o arquivo de exportação, se houver um aberto."""
+        if self._export is not None:
+            self._export.close()
+            self._export = None
+            self.enabled = self.show_overlay
+
+    def _write(self, frame_ms):
+        out = self._export
+        if self._export_csv:
+            frame = self.frame
+            out.write("".join(f"{frame},{name},{ms:.4f}\n" for name, ms in frame_ms.items()))
+        else:
+            out.write(json.dumps({"frame": self.frame, "ms": frame_ms}) + "\n")
+
+    # ------------------------------------------------------------------
+    # overlay
+    # ------------------------------------------------------------------
+    def draw_overlay(self, surface, pos=(10, 50)):
+        """
+        Desenha a tabela média / p95 / p99 por fase (se o overlay estiver ligado).
+
+        A tabela é remontada a cada `OVERLAY_REFRESH_FRAMES` frames, não a
+        cada frame: os números ficam legíveis e o overlay quase não pesa
+        na própria medição.
+
+        Returns
+        -------
+        pygame.Rect | None
+            Área ocupada pelo overlay (`None` com ele desligado).
+        """
+        if not self.show_overlay:
+            return None
+        self._overlay_age += 1
+        if self._overlay is None or self._overlay_age >= OVERLAY_REFRESH_FRAMES:
+            self._overlay = self._render_overlay()
+            self._overlay_age = 0
+        return surface.blit(self._overlay, pos)
+
+    def _render_overlay(self):
+        """Painel semitransparente com uma linha por fase (mais cara primeiro, `frame` no fim)."""
+        stats = self.summary()
+        names = sorted(stats, key=lambda name: (name == "frame", -stats[name]["avg"]))
+        rows = [(f"fase (ms, {self.window} frames)", "média", "p95", "p99")]
+        rows += [
+            (name, *(f"{stats[name][key]:.2f}" for key in ("avg", "p95", "p99")))
+            for name in names
+        ]
+
+        font = text_renderer.font(None, OVERLAY_FONT_SIZE)
+        cells = [[font.render(text, True, (255, 255, 255)) for text in row] for row in rows]
+        widths = [max(row[col].get_width() for row in cells) for col in range(4)]
+        line_height = font.get_linesize()
+        pad, gap = 6, 14
+
+        panel = pygame.Surface(
+            (sum(widths) + gap * 3 + pad * 2, line_height * len(cells) + pad * 2),
+            pygame.SRCALPHA,
+        )
+        panel.fill((0, 0, 0, 170))
+        for i, row in enumerate(cells):
+            y = pad + i * line_height
+            x = pad
+            for col, text in enumerate(row):
+                # nome alinhado à esquerda, números à direita da coluna
+                offset = 0 if col == 0 else widths[col] - text.get_width()
+                panel.blit(text, (x + offset, y))
+                x += widths[col] + gap
+        return panel
+
+
+# instância única usada pelo jogo
+profiler = FrameProfiler()
@@ -0,0 +1,302 @@
+"""
+Gravação e replay determinístico de partidas (**InputRecorder** / **Replay**).
+
+O `Game` só depende de três coisas de fora: as teclas de cada tick, o
+relógio de jogo (`game_clock`) e o sorteio de ataques do boss (`Game.rng`,
+semeado com `Game.seed`). O gravador guarda a semente, o tempo inicial do
+relógio e um snapshot das teclas por tick; o replay monta uma partida
+igual e devolve exatamente a mesma entrada — headless e sem esperar o
+relógio, então uma sessão ruim vira um caso de regressão/perf que roda
+em segundos:
+
+    $ python -m tools.replay sessao.hmr
+
+Formato do arquivo
+------------------
+    b"HMRP" | versão (u8) | semente (u64) | relógio inicial (f64) | dt (f64)
+    | largura, altura (u16) | backend de inimigos (u8) | nº de teclas (u8) | teclas (u32…)
+
+seguido de registros:
+
+- `máscara` (u8 < 0x80) + repetições (varint): a mesma combinação de
+  teclas (bit i = `keys[i]` do cabeçalho) por N ticks seguidos;
+- `0xFE` + dt (f64): os ticks seguintes usam outro `dt`;
+- `0xFD` + tick (u32) + CRC-32 do estado: checkpoint, conferido no replay
+  pra achar o primeiro tick em que a simulação divergiu.
+
+Uso típico (no main):
+    recorder = InputRecorder("sessao.hmr", game)
+    for dt in timestep.advance(frame_time):
+        recorder.record(keys, dt)
+        game.update(keys, dt)
+    recorder.close()
+"""
+
+import struct
+import zlib
+
+import pygame
+
+from core.clock import game_clock
+from core.pool import sprite_pools
+from core.timing import FIXED_DT
+
+MAGIC = b"HMRP"
+VERSION = 3
+HEADER = struct.Struct("<4sBQddHHBB")
+RECORDED_KEYS = (pygame.K_a, pygame.K_d, pygame.K_q, pygame.K_r, pygame.K_e, pygame.K_SPACE)
+CHECK_EVERY = 60                # ticks entre checkpoints (1 s de jogo)
+
+_DT = 0xFE
+_CHECKPOINT = 0xFD
+_F64 = struct.Struct("<d")
+_CHECK = struct.Struct("<II")
+
+
+class ReplayDivergence(Exception):
+    """O replay chegou num checkpoint com estado diferente do gravado."""
+
+    def __init__(self, tick, expected, actual):
+        super().__init__(
+            f"replay divergiu no tick {tick}: estado {actual:08x}, gravado {expected:08x}"
+        )
+        self.tick = tick
+        self.expected = expected
+        self.actual = actual
+
+
+def state_digest(game):
+    """
+    CRC-32 do estado simulado da partida (posições, vida, estados, relógio).
+
+    Dois `Game` com a mesma entrada desde o início têm o mesmo digest em
+    todo tick; é o que os checkpoints comparam.
+    """
+    player = game.player
+    state = [
+        game.ticks, game.clock.time_ms, game.current_room,
+        tuple(player.rect), player.health, player.state, player.anim.tick,
+    ]
+    for enemy in game.all_enemies:
+        state.append((type(enemy).__name__, tuple(enemy.rect), enemy.health, enemy.state))
+    if game.enemy_batch is not None:
+        state.append(tuple(map(float, game.enemy_batch.centers())))
+    for spell in game.spells:
+        state.append(tuple(spell.rect))
+    if game.boss:
+        boss = game.boss
+        state.append((tuple(boss.rect), boss.hp, boss.state, boss.anim.tick))
+    return zlib.crc32(repr(state).encode())
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.write(bytes(((value & 0x7F) | 0x80,)))
+        value >>= 7
+    out.write(bytes((value,)))
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# ------------------------------------------------------------------
+# gravação
+# ------------------------------------------------------------------
+class InputRecorder:
+    """
+    Grava a entrada de uma partida, tick a tick, num arquivo `.hmr`.
+
+    Tem que ser criado antes do primeiro `game.update()`: o cabeçalho
+    guarda a semente e o relógio do jogo nesse momento.
+
+    Parâmetros
+    ----------
+    path : str
+        Arquivo de saída.
+    game : Game
+        Partida gravada (ainda sem nenhum tick).
+    keys : tuple[int], opcional
+        Códigos `pygame.K_*` gravados (até 7; padrão = as teclas que o jogo lê).
+    check_every : int, opcional
+        Ticks entre checkpoints de estado (0 = sem checkpoints).
+    """
+
+    def __init__(self, path, game, keys=RECORDED_KEYS, check_every=CHECK_EVERY):
+        if len(keys) > 7:
+            raise ValueError("no máximo 7 teclas por máscara")
+        self.game = game
+        self.keys = tuple(keys)
+        self.check_every = check_every
+        self.ticks = 0
+
+        from core.game import ENEMY_BACKENDS
+
+        self._out = open(path, "wb")
+        self._out.write(HEADER.pack(
+            MAGIC, VERSION, game.seed, game.clock.time_ms, FIXED_DT,
+            game.screen_width, game.screen_height, ENEMY_BACKENDS.index(game.enemy_backend),
+            len(self.keys),
+        ))
+        self._out.write(struct.pack(f"<{len(self.keys)}I", *self.keys))
+        self._dt = FIXED_DT
+        self._mask = None
+        self._run = 0
+
+    def record(self, keys, dt):
+        """Registra as teclas do próximo tick (chamar logo antes de `game.update(keys, dt)`)."""
+        if self.check_every and self.ticks % self.check_every == 0:
+            self._checkpoint()
+        mask = 0
+        for bit, key in enumerate(self.keys):
+            if keys[key]:
+                mask |= 1 << bit
+        if dt != self._dt:
+            self._flush()
+            self._out.write(bytes((_DT,)) + _F64.pack(dt))
+            self._dt = dt
+        if mask != self._mask:
+            self._flush()
+            self._mask = mask
+        self._run += 1
+        self.ticks += 1
+
+    def _flush(self):
+        if self._run:
+            self._out.write(bytes((self._mask,)))
+            _write_varint(self._out, self._run)
+            self._run = 0
+
+    def _checkpoint(self):
+        self._flush()
+        self._out.write(bytes((_CHECKPOINT,)) + _CHECK.pack(self.ticks, state_digest(self.game)))
+
+    def close(self):
+        """Grava o que falta (com um checkpoint do estado final) e fecha o arquivo."""
+        if self._out.closed:
+            return
+        self._checkpoint()
+        self._out.close()
+
+
+# ------------------------------------------------------------------
+# replay
+# ------------------------------------------------------------------
+class Replay:
+    """
+    Sessão gravada por `InputRecorder`, carregada na memória.
+
+    Parâmetros
+    ----------
+    path : str
+        Arquivo `.hmr`.
+    """
+
+    def __init__(self, path):
+        from core.headless import KeyState  # o módulo liga os drivers `dummy`: só no replay
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        (magic, version, self.seed, self.start_ms, dt, self.screen_width,
+         self.screen_height, enemy_batch, n_keys) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: replay inválido ou de outra versão")
+        self.enemy_batch = enemy_batch  # índice em `core.game.ENEMY_BACKENDS`
+        pos = HEADER.size
+        self.keys = struct.unpack_from(f"<{n_keys}I", data, pos)
+        pos += 4 * n_keys
+
+        self.runs = []          # (KeyState, dt, repetições)
+        self.checkpoints = {}   # tick → CRC-32 do estado antes dele
+        states = {}             # máscara → KeyState (reaproveitado)
+        tick = 0
+        while pos < len(data):
+            tag = data[pos]
+            pos += 1
+            if tag == _DT:
+                (dt,) = _F64.unpack_from(data, pos)
+                pos += _F64.size
+            elif tag == _CHECKPOINT:
+                at, digest = _CHECK.unpack_from(data, pos)
+                pos += _CHECK.size
+                self.checkpoints[at] = digest
+            else:
+                run, pos = _read_varint(data, pos)
+                state = states.get(tag)
+                if state is None:
+                    state = states[tag] = KeyState(
+                        key for bit, key in enumerate(self.keys) if tag & (1 << bit)
+                    )
+                self.runs.append((state, dt, run))
+                tick += run
+        self.ticks = tick
+
+    def inputs(self):
+        """Gera `(keys, dt)` por tick, na ordem gravada."""
+        for state, dt, run in self.runs:
+            for _ in range(run):
+                yield state, dt
+
+    def new_game(self):
+        """
+        Partida nova no mesmo ponto de partida da gravação (semente e relógio).
+
+        Zera os pools de sprites pra que nenhuma instância de uma partida
+        anterior no mesmo processo entre na simulação.
+        """
+        from core.game import ENEMY_BACKENDS, Game  # entidades só depois do `init_headless`
+
+        sprite_pools.clear()
+        game_clock.time_ms = self.start_ms
+        return Game(
+            self.screen_width, self.screen_height, load_scenery=False,
+            clock=game_clock, enemy_batch=ENEMY_BACKENDS[self.enemy_batch], seed=self.seed,
+        )
+
+    def play(self, game=None, verify=True):
+        """
+        Roda a sessão inteira o mais rápido possível (headless).
+
+        Parameters
+        ----------
+        game : Game, opcional
+            Partida montada por `new_game()` (padrão = uma nova).
+        verify : bool, opcional
+            Confere cada checkpoint e levanta `ReplayDivergence` no primeiro
+            que não bater.
+
+        Returns
+        -------
+        dict
+            Resumo da partida no fim (ver `core.headless.summary`).
+        """
+        from core.headless import summary
+
+        if game is None:
+            game = self.new_game()
+        checkpoints = self.checkpoints if verify else {}
+
+        for tick, (keys, dt) in enumerate(self.inputs()):
+            expected = checkpoints.get(tick)
+            if expected is not None:
+                actual = state_digest(game)
+                if actual != expected:
+                    raise ReplayDivergence(tick, expected, actual)
+            game.update(keys, dt)
+            if not game.running:
+                break
+
+        expected = checkpoints.get(self.ticks)
+        if expected is not None and game.ticks == self.ticks:
+            actual = state_digest(game)
+            if actual != expected:
+                raise ReplayDivergence(self.ticks, expected, actual)
+        return summary(game)
@@ -3,20 +3,58 @@ Gerenciador de salas (**RoomManager**) do Hollow Mooni.
 
 Responsabilidades principais
 ----------------------------
-1. Carregar e escalar os fundos/foregrounds de cada sala.
+1. Carregar e escalar os fundos/foregrounds de cada sala **sob demanda**:
+   só a sala atual precisa estar na memória; a próxima é decodificada em
+   background (`AssetLoader`) enquanto o player está na atual, e salas
+   antigas são liberadas quando o total passa de `memory_budget`.
 2. Informar nível do chão, se o player pode se mover e se está colidindo
    com a “porta” de transição.
 3. Avançar para a próxima sala quando requisitado.
+4. Trocar a música (`music_player`) ao entrar numa sala e já pedir a
+   decodificação da faixa da próxima, pra troca não travar o frame.
 
 Fluxo típico de uso (no main):
     room_manager = RoomManager(SCREEN_WIDTH, SCREEN_HEIGHT)
     ground_y = room_manager.get_ground_level()
+    room_manager.update()          # 1x por frame: termina prefetch pendente
     room_manager.draw_room(screen)
     room_manager.draw_foreground(screen)
 """
 
 import pygame
 
+from core.asset_cache import asset_cache
+from core.asset_loader import AssetLoader
+from core.music import music_player
+
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024  # bytes de pixel dos cenários residentes
+THEME = "assets/sounds/backgroundprinci.mp3"
+
+# Cada dicionário é uma sala com suas propriedades (copiado por instância,
+# já que `waves_completed`/`movement` mudam durante o jogo)
+ROOMS = [
+    {
+        "background": "assets/background/tela1true.png",
+        "music": THEME,
+        "movement": True,
+        "ground_level": 800,
+    },
+    {
+        "background": "assets/background/background_passarela.png",
+        "foreground": "assets/background/frente_passarela.png",
+        "music": THEME,
+        "movement": False,  # travado até waves concluírem
+        "waves_completed": False,
+        "ground_level": 750,
+    },
+    {
+        "background": "assets/background/boss_arena.png",
+        "music": THEME,
+        "movement": True,
+        "ground_level": 650,
+    },
+]
+
 
 class RoomManager:
     """
@@ -28,73 +66,201 @@ class RoomManager:
         Largura da janela do jogo (px).
     screen_height : int
         Altura da janela do jogo (px).
+    memory_budget : int, opcional
+        Teto (bytes) de pixels de cenário mantidos na memória; salas já
+        visitadas são liberadas primeiro quando ele estoura.
+    rooms : list[dict], opcional
+        Definição das salas (padrão = `ROOMS`).
+    load_scenery : bool, opcional
+        `False` nunca carrega fundos/foregrounds (simulação headless: só
+        chão, movimento e porta importam).
+    music : MusicPlayer, opcional
+        Quem toca a faixa (`"music"`) de cada sala (padrão =
+        `music_player`; `None` = sem música, como com `load_scenery=False`).
     """
 
-    def __init__(self, screen_width, screen_height):
-        # Cada dicionário é uma sala com suas propriedades
-        self.rooms = [
-            {
-                "background": "assets/background/tela1true.png",
-                "movement": True,
-                "ground_level": 800,
-            },
-            {
-                "background": "assets/background/background_passarela.png",
-                "foreground": "assets/background/frente_passarela.png",
-                "movement": False,  # travado até waves concluírem
-                "waves_completed": False,
-                "ground_level": 750,
-            },
-            {
-                "background": "assets/background/boss_arena.png",
-                "movement": True,
-                "ground_level": 650,
-            },
-        ]
-
-        self.current_room = 0
+    def __init__(self, screen_width, screen_height, memory_budget=DEFAULT_MEMORY_BUDGET,
+                 rooms=ROOMS, load_scenery=True, music=music_player):
+        self.rooms = [dict(room) for room in rooms]
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.memory_budget = memory_budget
+        self.load_scenery = load_scenery
+        self.music = music if load_scenery else None
+
+        self.loader = AssetLoader(workers=1) if load_scenery else None
+        self._requested = set()  # salas com arquivos na fila do loader
 
-        # pré-carrega e escala todas as superfícies (bg/fg)
-        for room in self.rooms:
-            if "background" in room:
-                img = pygame.image.load(room["background"]).convert()
-                room["bg_surface"] = pygame.transform.scale(
-                    img, (screen_width, screen_height)
-                )
-            if "foreground" in room:
-                img = pygame.image.load(room["foreground"]).convert_alpha()
-                room["fg_surface"] = pygame.transform.scale(
-                    img, (screen_width, screen_height)
-                )
+        # a primeira sala é carregada na hora (é o primeiro frame do jogo);
+        # as demais só quando forem a próxima
+        self._current_room = 0
+        if load_scenery:
+            self._load_room(0)
+        self._enter_room()
 
         # “porta” imaginária no centro da tela (usada p/ colidir com o player)
         self.door_rect = pygame.Rect(
             screen_width // 2 - 50, screen_height // 2 + 50, 100, 200
         )
 
+    # ------------------------------------------------------------------
+    # streaming das salas
+    # ------------------------------------------------------------------
+    @property
+    def current_room(self):
+        """Índice da sala atual (trocar dispara prefetch/liberação)."""
+        return self._current_room
+
+    @current_room.setter
+    def current_room(self, room_id):
+        self._current_room = room_id
+        self._enter_room()
+
+    def _layers(self, room):
+        """Trios (chave no dict da sala, caminho, alpha) dos cenários da sala."""
+        layers = []
+        if "background" in room:
+            layers.append(("bg_surface", room["background"], False))
+        if "foreground" in room:
+            layers.append(("fg_surface", room["foreground"], True))
+        return layers
+
+    def is_loaded(self, room_id):
+        """`True` se os cenários da sala já estão prontos pra blit."""
+        room = self.rooms[room_id]
+        return all(key in room for key, _, _ in self._layers(room))
+
+    def _load_layer(self, room_id, key, path, alpha):
+        """Converte um cenário da sala (PNG já decodificado/escalado pelo loader)."""
+        size = (self.screen_width, self.screen_height)
+        self.rooms[room_id][key] = asset_cache.image(path, size, alpha=alpha)
+        if self.is_loaded(room_id):
+            self._requested.discard(room_id)
+
+    def _load_room(self, room_id):
+        """Carrega todos os cenários da sala na hora (bloqueante)."""
+        for key, path, alpha in self._layers(self.rooms[room_id]):
+            self._load_layer(room_id, key, path, alpha)
+
+    def _unload_room(self, room_id):
+        """Solta as Surfaces da sala (do dict e do `asset_cache`)."""
+        room = self.rooms[room_id]
+        size = (self.screen_width, self.screen_height)
+        for key, path, alpha in self._layers(room):
+            if room.pop(key, None) is not None:
+                asset_cache.release_image(path, size, alpha=alpha)
+
+    def _room_bytes(self, room_id):
+        room = self.rooms[room_id]
+        total = 0
+        for key, _, _ in self._layers(room):
+            surface = room.get(key)
+            if surface is not None:
+                total += surface.get_bytesize() * surface.get_width() * surface.get_height()
+        return total
+
+    def prefetch(self, room_id):
+        """Agenda a decodificação da sala em background (não bloqueia)."""
+        if not 0 <= room_id < len(self.rooms):
+            return
+        if room_id in self._requested or self.is_loaded(room_id):
+            return
+        self._requested.add(room_id)
+        size = (self.screen_width, self.screen_height)
+        self.loader.request_many((path for _, path, _ in self._layers(self.rooms[room_id])), size)
+
+    def _enter_room(self):
+        """Garante sala atual + próxima a caminho e libera as antigas se precisar."""
+        if not self.load_scenery:
+            return
+        self.prefetch(self._current_room)
+        self.prefetch(self._current_room + 1)
+        self._enforce_budget()
+        if self.music is not None:
+            self.music.play(self.rooms[self._current_room].get("music"))
+            if self._current_room + 1 < len(self.rooms):
+                self.music.prefetch(self.rooms[self._current_room + 1].get("music"))
+
+    def _enforce_budget(self):
+        """Libera salas (mais antigas primeiro) até caber em `memory_budget`."""
+        keep = {self._current_room, self._current_room + 1}
+        resident = [i for i in range(len(self.rooms)) if i not in keep and self._room_bytes(i)]
+        # salas já visitadas (atrás da atual) saem antes, das mais distantes pra perto
+        resident.sort(key=lambda i: (i > self._current_room, -abs(i - self._current_room)))
+        total = sum(self._room_bytes(i) for i in range(len(self.rooms)))
+        for room_id in resident:
+            if total <= self.memory_budget:
+                break
+            total -= self._room_bytes(room_id)
+            self._unload_room(room_id)
+
+    def update(self):
+        """
+        Chamado 1x por frame: entrega o que o loader já decodificou.
+
+        Converte no máximo um cenário por frame e nunca espera I/O — se a
+        sala atual ainda não chegou, `draw_room` pinta a cor de fundo até
+        ela ficar pronta.
+        """
+        if self.loader is None:
+            return
+        self.loader.poll()
+        for room_id in sorted(self._requested, key=lambda i: i != self._current_room):
+            room = self.rooms[room_id]
+            for key, path, alpha in self._layers(room):
+                if key not in room and not self.loader.is_pending(path):
+                    self._load_layer(room_id, key, path, alpha)
+                    self._enforce_budget()
+                    return
+
+    def resident_bytes(self):
+        """Total (bytes) de pixels de cenário carregados agora."""
+        return sum(self._room_bytes(i) for i in range(len(self.rooms)))
+
     # ------------------------------------------------------------------
     # trocas de sala e desenhar cenários
     # ------------------------------------------------------------------
     def next_room(self):
-        """Avança para a próxima sala, se existir."""
+        """Avança para a próxima sala, se existir (não espera o cenário carregar)."""
         if self.current_room < len(self.rooms) - 1:
             self.current_room += 1
 
-    def draw_room(self, surface):
-        """Desenha o fundo da sala atual."""
+    def draw_room(self, surface, rects=None):
+        """
+        Desenha o fundo da sala atual.
+
+        Parameters
+        ----------
+        surface : pygame.Surface
+            Tela de destino.
+        rects : list[pygame.Rect], opcional
+            Só restaura essas áreas (renderer de retângulos sujos);
+            `None` redesenha a tela inteira.
+        """
         room = self.rooms[self.current_room]
-        if "bg_surface" in room:
-            surface.blit(room["bg_surface"], (0, 0))
+        bg = room.get("bg_surface")
+        if rects is None:
+            if bg is not None:
+                surface.blit(bg, (0, 0))
+            else:
+                surface.fill(room.get("color", (0, 0, 0)))
+        elif bg is not None:
+            for rect in rects:
+                surface.blit(bg, rect, rect)
         else:
-            surface.fill(room.get("color", (0, 0, 0)))
+            for rect in rects:
+                surface.fill(room.get("color", (0, 0, 0)), rect)
 
-    def draw_foreground(self, surface):
-        """Desenha (se houver) o foreground da sala atual."""
-        room = self.rooms[self.current_room]
-        if "fg_surface" in room:
-            surface.blit(room["fg_surface"], (0, 0))
+    def draw_foreground(self, surface, rects=None):
+        """Desenha (se houver) o foreground da sala atual (só em `rects`, se passado)."""
+        fg = self.rooms[self.current_room].get("fg_surface")
+        if fg is None:
+            return
+        if rects is None:
+            surface.blit(fg, (0, 0))
+        else:
+            for rect in rects:
+                surface.blit(fg, rect, rect)
 
     # ------------------------------------------------------------------
     # utilidades
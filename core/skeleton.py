@@ -2,14 +2,25 @@
 Módulo que define o inimigo **SkeletonEnemy**.
 
 O esqueleto patrulha, persegue Mooni a longa distância, ataca quando
-chega perto, pode ser machucado (hurt) e, claro, morre quando o HP
+chega perto (o golpe é o hitbox de `hitbox_data`, resolvido pelo
+`core.combat`), pode ser machucado (hurt) e, claro, morre quando o HP
 zera.
 """
 
 import pygame
 
+from core.animation import END, Animated, Animator, compile_clips
+from core.asset_cache import asset_cache
+from core.atlas import blit_item
+from core.clock import game_clock
+from core.combat import ENEMY, Hitbox, compile_hitboxes
+from core.event_log import event_log
+from core.timing import FIXED_DT, interpolate
 
-class SkeletonEnemy(pygame.sprite.Sprite):
+combat_log = event_log.channel("combat")
+
+
+class SkeletonEnemy(Animated, pygame.sprite.Sprite):
     """
     Inimigo Esqueleto: IA simples de perseguição + ataque corpo-a-corpo.
 
@@ -19,41 +30,56 @@ class SkeletonEnemy(pygame.sprite.Sprite):
         Posição (x, y) onde o esqueleto nasce no mapa.
     """
 
+    # sprite-sheets + nº de quadros
+    animation_data = {
+        "idle": ("assets/enemies/skeleton/Skeleton Idle.png", 11),
+        "walk": ("assets/enemies/skeleton/Skeleton Walk.png", 13),
+        "attack": ("assets/enemies/skeleton/Skeleton Attack.png", 18),
+        "hurt": ("assets/enemies/skeleton/Skeleton Hit.png", 8),
+        "death": ("assets/enemies/skeleton/Skeleton Dead.png", 15),
+    }
+    animation_fps = 9  # quadros/s
+    clip_data = {}     # tudo em loop; o fim de attack/hurt/death é tratado no `animate`
+
+    # golpe (ver `core.combat`): a lança vai à frente nos quadros 7–10
+    hitbox_data = {
+        "attack": {"frames": (7, 10), "anchor": "midbottom", "rect": (0, -36, 44, 36)},
+    }
+
     def __init__(self, pos):
         super().__init__()
 
-        # sprite-sheets + nº de quadros
-        self.animation_data = {
-            "idle": ("assets/enemies/skeleton/Skeleton Idle.png", 11),
-            "walk": ("assets/enemies/skeleton/Skeleton Walk.png", 13),
-            "attack": ("assets/enemies/skeleton/Skeleton Attack.png", 18),
-            "hurt": ("assets/enemies/skeleton/Skeleton Hit.png", 8),
-            "death": ("assets/enemies/skeleton/Skeleton Dead.png", 15),
-        }
-
         # carrega cada animação em um dict
         self.animations = {
             key: self.load_animation(path, frames)
             for key, (path, frames) in self.animation_data.items()
         }
+        self.anim = Animator(compile_clips(self.animations, self.clip_data, self.animation_fps), "idle")
+        self.hitbox = Hitbox(self, compile_hitboxes(self.anim.clips, self.hitbox_data), ENEMY)
+        self.reset(pos)
+
+    def reset(self, pos):
+        """
+        Volta ao estado de spawn em `pos` (reuso pelo `sprite_pools`).
 
-        self.state = "idle"
-        self.frame_index = 0
-        self.animation_speed = 0.15
-        self.image = self.animations[self.state][self.frame_index]
+        Tudo menos as animações, que são as mesmas pra qualquer esqueleto.
+        """
+        self.anim.reset("idle")
+        self.hitbox.reset()
+        self.image = self.animations["idle"][0]
 
         self.rect = self.image.get_rect(topleft=pos)
+        self.prev_anchor = None  # midbottom do tick anterior (interpolação)
 
         # atributos de combate/movimento
-        self.speed = 4
+        self.speed = 240  # px/s
         self.vision_range = 900
         self.health = 30
-        self.damage = 5
+        self.attack_damage = {"attack": 5}  # dano por golpe de `hitbox_data`
         self.attack_cooldown = 1000
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = game_clock.get_ticks()
 
         self.facing_right = False
-        self.recently_hit = False
         self.attacking = False
         self.hurt = False  # ✅ flag de animação de dano
 
@@ -62,25 +88,18 @@ class SkeletonEnemy(pygame.sprite.Sprite):
     # ------------------------------------------------------------------
     def load_animation(self, sheet_path, num_frames):
         """
-        Retorna lista de frames (escala 2×) de um sprite-sheet horizontal.
+        Retorna tupla de frames (escala 2×) de um sprite-sheet horizontal.
+
+        Compartilhada via `asset_cache`: a wave inteira usa a mesma tupla.
         """
-        sheet = pygame.image.load(sheet_path).convert_alpha()
-        frame_width = sheet.get_width() // num_frames
-        frames = [
-            pygame.transform.scale(
-                sheet.subsurface(i * frame_width, 0, frame_width, sheet.get_height()),
-                (frame_width * 2, sheet.get_height() * 2),
-            )
-            for i in range(num_frames)
-        ]
-        return frames
+        return asset_cache.sheet(sheet_path, num_frames)
 
     # ------------------------------------------------------------------
     # lógica principal
     # ------------------------------------------------------------------
-    def update(self, player):
+    def update(self, player, dt=FIXED_DT):
         """
-        Decide estado (idle, walk, attack, etc.) e move o esqueleto.
+        Decide estado (idle, walk, attack, etc.) e move o esqueleto por `dt` segundos.
         """
         if self.health <= 0:
             self.state = "death"
@@ -94,65 +113,61 @@ class SkeletonEnemy(pygame.sprite.Sprite):
                 self.state = "walk"
                 direction = 1 if distance > 0 else -1
                 self.facing_right = direction > 0
-                self.rect.x += direction * self.speed
+                self.rect.x += direction * self.speed * dt
 
-                # se grudou no player → ataca
+                # se grudou no player → começa o golpe (do quadro 0)
                 if abs(distance) < 40:
-                    now = pygame.time.get_ticks()
+                    now = game_clock.get_ticks()
                     if now - self.last_attack_time > self.attack_cooldown:
                         self.attacking = True
                         self.last_attack_time = now
-                        self.attack(player)
+                        self.anim.restart()
             else:
                 if self.health > 0:
                     self.state = "idle"
 
-        self.animate()
+        self.animate(dt)
+        # golpe ativo neste quadro? (o `Game` resolve o dano no fim do tick)
+        self.hitbox.sync(self.anim, self.rect, self.facing_right)
 
     # ------------------------------------------------------------------
     # ações
     # ------------------------------------------------------------------
-    def attack(self, player):
-        """Aplica dano direto no player."""
-        player.take_damage(self.damage)
-
     def take_damage(self, amount):
         """Recebe dano e troca pra animação de hurt ou death."""
         self.health -= amount
-        print(f"Skeleton took {amount} damage! Remaining health: {self.health}")
+        combat_log.info("hit", "skeleton", amount, self.health)
         if self.health <= 0:
             self.state = "death"
         else:
             self.hurt = True
-            self.frame_index = 0  # ✅ reseta animação de hurt
+            self.anim.restart()  # ✅ reseta animação de hurt
 
     # ------------------------------------------------------------------
     # animação/frame control
     # ------------------------------------------------------------------
-    def animate(self):
+    def animate(self, dt=FIXED_DT):
         """
         Avança frames da animação atual e trata resets/hurt/death.
         """
-        frames = self.animations[self.state]
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(frames):
-            self.frame_index = 0
-            if self.state == "attack":
+        anim = self.anim
+        if anim.advance(dt) == END:
+            if anim.state == "attack":
                 self.attacking = False
-            if self.state == "hurt":
+            if anim.state == "hurt":
                 self.hurt = False
-            if self.state == "death":
+            if anim.state == "death":
                 self.kill()
 
-        image = frames[int(self.frame_index)]
-        if not self.facing_right:
-            image = pygame.transform.flip(image, True, False)
-
         bottom = self.rect.bottom
-        self.image = image
+        self.image = self.animations[anim.state].facing(not self.facing_right)[anim.frame]
         self.rect = self.image.get_rect(midbottom=(self.rect.centerx, bottom))
 
     # ------------------------------------------------------------------
-    def draw(self, surface):
-        """Renderiza o esqueleto na tela."""
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0):
+        """Renderiza o esqueleto (interpolado por `alpha`) e devolve o `Rect` afetado."""
+        return surface.blit(*self.blit_item(alpha))
+
+    def blit_item(self, alpha=1.0):
+        """Item `(imagem, destino[, área])` deste frame pro `Surface.blits` da camada."""
+        return blit_item(self.image, interpolate(self.rect, self.prev_anchor, alpha))
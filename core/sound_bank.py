@@ -0,0 +1,195 @@
+"""
+Banco de efeitos sonoros (**SoundBank**) do Hollow Mooni.
+
+Antes, cada `Player` novo (todo reinício) decodificava `thrust.mp3` e
+`smash.mp3` do disco, e o `Player.input` chamava `.play()` em todo tick
+com R/Q apertado — dezenas de cópias do mesmo som se sobrepondo e
+ocupando canais do mixer.
+
+Aqui cada efeito é registrado uma vez (nome → arquivo + limites) e
+decodificado uma vez só, no `preload()` da tela de carregamento ou no
+primeiro `play()`. Os efeitos tocam num conjunto fixo de canais
+reservados (a música e outros `Sound.play()` não disputam com eles), e
+cada efeito tem:
+
+- `max_concurrent`: quantas cópias podem soar ao mesmo tempo;
+- `cooldown_ms`: intervalo mínimo (tempo de jogo) entre dois disparos.
+
+Pedidos dentro do cooldown contam como *deduplicados*; acima do limite
+ou sem canal livre, como *descartados* (ver `stats()`).
+
+Uso típico:
+    from core.sound_bank import sound_bank
+    sound_bank.register("smash", "assets/sounds/smash.mp3", max_concurrent=2, cooldown_ms=150)
+    sound_bank.play("smash")
+"""
+
+import pygame
+
+from core.clock import game_clock
+
+DEFAULT_CHANNELS = 8  # canais reservados pros efeitos
+
+_reserved = 0
+
+
+def reserve_channels(count):
+    """
+    Garante os canais `0..count-1` do mixer existindo e reservados.
+
+    Reservados, eles nunca são escolhidos por um `Sound.play()` solto; a
+    reserva só cresce (o banco de efeitos e a música pedem faixas
+    diferentes e um não desfaz a do outro).
+    """
+    global _reserved
+    if pygame.mixer.get_num_channels() < count:
+        pygame.mixer.set_num_channels(count)
+    if count > _reserved:
+        _reserved = count
+        pygame.mixer.set_reserved(count)
+
+
+class SoundBank:
+    """
+    Efeitos sonoros decodificados uma vez e tocados num pool fixo de canais.
+
+    Parâmetros
+    ----------
+    channels : int, opcional
+        Quantos canais do mixer ficam reservados pros efeitos.
+    clock : GameClock, opcional
+        Relógio dos cooldowns (padrão = `game_clock`: pausado, nada
+        re-dispara; acelerado, os cooldowns acompanham o jogo).
+    """
+
+    def __init__(self, channels=DEFAULT_CHANNELS, clock=game_clock):
+        self.n_channels = channels
+        self.clock = clock
+        self.enabled = True
+
+        self._specs = {}      # nome → (caminho, max_concurrent, cooldown_ms, volume)
+        self._sounds = {}     # caminho → pygame.mixer.Sound
+        self._playing = {}    # nome → canais tocando esse efeito
+        self._last_play = {}  # nome → ms de jogo do último disparo
+        self._channels = None
+
+        self.loads = 0
+        self.plays = 0
+        self.deduplicated = 0
+        self.dropped = 0
+
+    # ------------------------------------------------------------------
+    # registro e carregamento
+    # ------------------------------------------------------------------
+    def register(self, name, path, max_concurrent=1, cooldown_ms=0, volume=1.0):
+        """
+        Registra (ou atualiza) um efeito; não carrega nada ainda.
+
+        Parameters
+        ----------
+        name : str
+            Nome usado no `play()`.
+        path : str
+            Arquivo de áudio.
+        max_concurrent : int, opcional
+            Cópias do efeito soando ao mesmo tempo, no máximo.
+        cooldown_ms : int, opcional
+            Intervalo mínimo entre dois disparos (ms de jogo).
+        volume : float, opcional
+            Volume do efeito (0.0–1.0).
+        """
+        self._specs[name] = (path, max_concurrent, cooldown_ms, volume)
+
+    def sound(self, name):
+        """`pygame.mixer.Sound` do efeito, decodificado na primeira vez."""
+        path, _, _, volume = self._specs[name]
+        sound = self._sounds.get(path)
+        if sound is None:
+            sound = self._sounds[path] = pygame.mixer.Sound(path)
+            sound.set_volume(volume)
+            self.loads += 1
+        return sound
+
+    def preload(self):
+        """Decodifica todos os efeitos registrados (tela de carregamento)."""
+        if pygame.mixer.get_init():
+            for name in self._specs:
+                self.sound(name)
+
+    def _ensure_channels(self):
+        if self._channels is None:
+            reserve_channels(self.n_channels)
+            self._channels = [pygame.mixer.Channel(i) for i in range(self.n_channels)]
+        return self._channels
+
+    # ------------------------------------------------------------------
+    # tocar
+    # ------------------------------------------------------------------
+    def play(self, name):
+        """
+        Toca o efeito `name` respeitando cooldown, limite e canais livres.
+
+        Returns
+        -------
+        pygame.mixer.Channel | None
+            Canal usado, ou `None` se o pedido foi deduplicado/descartado
+            (ou o mixer está desligado).
+        """
+        if not self.enabled or not pygame.mixer.get_init():
+            return None
+        _, max_concurrent, cooldown_ms, _ = self._specs[name]
+
+        now = self.clock.get_ticks()
+        last = self._last_play.get(name)
+        if last is not None and 0 <= now - last < cooldown_ms:  # relógio voltou = partida nova
+            self.deduplicated += 1
+            return None
+
+        sound = self.sound(name)
+        playing = [ch for ch in self._playing.get(name, ()) if ch.get_sound() is sound]
+        if len(playing) >= max_concurrent:
+            self._playing[name] = playing
+            self.dropped += 1
+            return None
+
+        channel = next((ch for ch in self._ensure_channels() if not ch.get_busy()), None)
+        if channel is None:
+            self.dropped += 1
+            return None
+
+        channel.play(sound)
+        playing.append(channel)
+        self._playing[name] = playing
+        self._last_play[name] = now
+        self.plays += 1
+        return channel
+
+    def stop_all(self):
+        """Para todos os efeitos (os canais reservados ficam livres)."""
+        for channel in self._channels or ():
+            channel.stop()
+        self._playing.clear()
+
+    # ------------------------------------------------------------------
+    def stats(self):
+        """
+        Retorna contadores do banco.
+
+        Returns
+        -------
+        dict
+            `registered`, `loads` (decodificações), `plays`,
+            `deduplicated` (dentro do cooldown) e `dropped` (acima do
+            limite ou sem canal livre).
+        """
+        return {
+            "registered": len(self._specs),
+            "loads": self.loads,
+            "plays": self.plays,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+        }
+
+
+# instância única usada pelo jogo
+sound_bank = SoundBank()
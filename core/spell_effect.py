@@ -4,12 +4,32 @@ Efeito de feitiço (**SpellEffect**) disparado pelo Bringer of Death.
 Funciona assim:
 ---------------
 - Recebe lista de `spell_frames` (animação) e posição inicial.  
-- Anda pelo `update()` e, se colidir com o player, aplica dano uma única vez.  
+- Anda pelo `update()` e, se colidir com o player, aplica dano uma única vez
+  (hitbox em `core.combat`, resolvido pelo `Game` no fim do tick).  
 - Quando acaba a animação (ou sai da tela) o sprite se auto-destrói (`kill()`).
 """
 
 import pygame
 
+from core.animation import END, Animator, compile_clips
+from core.atlas import blit_item
+from core.combat import ENEMY, Hitbox, compile_hitboxes
+from core.timing import FIXED_DT, interpolate
+
+_hitbox_data = {}  # tamanho do quadro → declaração (mesmo objeto → tabelas compartilhadas)
+
+
+def spell_hitbox_data(size):
+    """`hitbox_data` de um feitiço com quadros de `size`: o quadro inteiro menos a margem."""
+    data = _hitbox_data.get(size)
+    if data is None:
+        w, h = size
+        inset = SpellEffect.hitbox_inset
+        data = _hitbox_data[size] = {
+            "spell": {"anchor": "topleft", "rect": (inset, inset, w - 2 * inset, h - 2 * inset)},
+        }
+    return data
+
 
 class SpellEffect(pygame.sprite.Sprite):
     """
@@ -25,41 +45,51 @@ class SpellEffect(pygame.sprite.Sprite):
         Dano aplicado ao player ao colidir (padrão = 10).
     """
 
+    animation_fps = 12  # quadros/s
+    clip_data = {}      # um clipe só; no fim o feitiço some
+    hitbox_inset = 10   # hitbox 10 px menor de cada lado, pra evitar dano “fantasma”
+
     def __init__(self, pos, spell_frames, damage=10):
         super().__init__()
-        self.frames = spell_frames
-        self.frame_index = 0
-        self.animation_speed = 0.2
-        self.image = self.frames[self.frame_index]
-        self.rect = self.image.get_rect(center=pos)
+        self.frames = None
+        self.reset(pos, spell_frames, damage)
 
-        self.damage = damage
-        self.has_hit = False  # ✅ garante que só causa dano 1x
+    def reset(self, pos, spell_frames, damage=10):
+        """Rearma o feitiço em `pos` (reuso pelo `sprite_pools`)."""
+        if spell_frames is not self.frames:
+            self.frames = spell_frames
+            self.anim = Animator(
+                compile_clips({"spell": spell_frames}, self.clip_data, self.animation_fps), "spell"
+            )
+            tracks = compile_hitboxes(self.anim.clips, spell_hitbox_data(spell_frames[0].get_size()))
+            self.hitbox = Hitbox(self, tracks, ENEMY)
+        self.anim.reset("spell")
+        self.hitbox.reset()
+        self.image = self.frames[0]
+        self.rect = self.image.get_rect(center=pos)
+        self.prev_anchor = None  # midbottom do tick anterior (interpolação)
 
-        # ✅ hitbox um pouco menor pra evitar dano “fantasma”
-        self.hitbox = self.rect.inflate(-20, -20)
+        self.attack_damage = {"spell": damage}
 
     # ------------------------------------------------------------------
-    def update(self, player):
+    def update(self, player, dt=FIXED_DT):
         """
-        Avança animação e aplica dano se encostar no player.
+        Inscreve o hitbox do quadro atual (um acerto só no player, ver
+        `core.combat`) e avança a animação (`dt` segundos).
         """
-        # colisão — usa hitbox reduzida
-        if not self.has_hit and self.hitbox.colliderect(player.rect):
-            player.take_damage(self.damage)
-            self.has_hit = True
-
-        # mantém hitbox centralizada no sprite
-        self.hitbox.center = self.rect.center
+        self.hitbox.sync(self.anim, self.rect)
 
         # animação
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(self.frames):
+        if self.anim.advance(dt) == END:
             self.kill()  # some quando animação termina
         else:
-            self.image = self.frames[int(self.frame_index)]
+            self.image = self.frames[self.anim.frame]
 
     # ------------------------------------------------------------------
-    def draw(self, surface):
-        """Desenha o feitiço na tela."""
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0):
+        """Desenha o feitiço (interpolado por `alpha`) e devolve o `Rect` afetado."""
+        return surface.blit(*self.blit_item(alpha))
+
+    def blit_item(self, alpha=1.0):
+        """Item `(imagem, destino[, área])` deste frame pro `Surface.blits` da camada."""
+        return blit_item(self.image, interpolate(self.rect, self.prev_anchor, alpha))
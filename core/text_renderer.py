@@ -0,0 +1,137 @@
+"""
+Renderização de texto com cache (**TextRenderer**) do Hollow Mooni.
+
+O `draw_text` antigo criava um `pygame.font.SysFont` e renderizava a
+string do zero a cada chamada — ou seja, todo diálogo, prompt e
+mensagem de morte, todo frame. Aqui as fontes ficam num cache por
+(face, tamanho) e as Surfaces de texto num LRU por
+(texto, face, tamanho, cor, antialias), limitado em bytes.
+
+Em regime (mesmas strings na tela), desenhar texto vira só um blit.
+
+Uso típico:
+    from core.text_renderer import text_renderer
+    surface.blit(text_renderer.render("Olá", 36, (255, 255, 255)), (x, y))
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024  # teto do LRU de Surfaces de texto
+
+
+class TextRenderer:
+    """
+    Cache de fontes + LRU de textos renderizados.
+
+    Parâmetros
+    ----------
+    max_bytes : int, opcional
+        Teto (bytes de pixel) das Surfaces guardadas; as menos usadas
+        recentemente saem primeiro quando ele estoura.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._fonts = {}               # (face, tamanho) → Font
+        self._surfaces = OrderedDict()  # (texto, face, tamanho, cor, aa) → Surface
+        self.bytes = 0
+
+        self.font_misses = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    def font(self, face=None, size=36):
+        """
+        Fonte de sistema cacheada (`face=None` = fonte padrão do Pygame).
+
+        Returns
+        -------
+        pygame.font.Font
+        """
+        key = (face, size)
+        font = self._fonts.get(key)
+        if font is None:
+            self.font_misses += 1
+            font = pygame.font.SysFont(face, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text, size=36, color=(255, 255, 255), face=None, antialias=True):
+        """
+        Surface com `text` renderizado (reaproveitada se já existir).
+
+        A Surface devolvida é compartilhada: só dê blit, não desenhe nela.
+
+        Parameters
+        ----------
+        text : str
+            Conteúdo a ser exibido.
+        size : int, opcional
+            Tamanho da fonte.
+        color : tuple[int, int, int], opcional
+            Cor RGB do texto.
+        face : str, opcional
+            Nome da fonte de sistema (padrão = fonte do Pygame).
+        antialias : bool, opcional
+            Suavização das bordas.
+        """
+        key = (text, face, size, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(face, size).render(text, antialias, color)
+        self._surfaces[key] = surface
+        self.bytes += self._surface_bytes(surface)
+        self._evict()
+        return surface
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    def _evict(self):
+        """Tira as Surfaces mais antigas até caber em `max_bytes` (sempre sobra a última)."""
+        while self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, surface = self._surfaces.popitem(last=False)
+            self.bytes -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Retorna contadores do cache.
+
+        Returns
+        -------
+        dict
+            `fonts`, `font_misses`, `hits`, `misses`, `evictions`,
+            `entries` e `bytes` (Surfaces de texto em memória).
+        """
+        return {
+            "fonts": len(self._fonts),
+            "font_misses": self.font_misses,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._surfaces),
+            "bytes": self.bytes,
+        }
+
+    def clear(self):
+        """Esvazia os dois caches e zera os contadores."""
+        self._fonts.clear()
+        self._surfaces.clear()
+        self.bytes = 0
+        self.font_misses = self.hits = self.misses = self.evictions = 0
+
+
+# instância única usada pelo jogo
+text_renderer = TextRenderer()
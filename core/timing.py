@@ -0,0 +1,86 @@
+"""
+Passo fixo de simulação (**FixedTimestep**) do Hollow Mooni.
+
+A lógica do jogo avança sempre em ticks de `FIXED_DT` segundos, não
+importa quantos FPS a tela consegue desenhar. O loop principal acumula
+o tempo real de cada frame e roda quantos ticks couberem; o que sobra
+(`alpha`) serve pra interpolar a posição dos sprites entre o tick
+anterior e o atual na hora do desenho.
+
+Se um frame demorar, a simulação roda mais ticks no próximo (frames de
+desenho são pulados, o jogo não fica lento) — até `max_frame_time`, pra
+não entrar em espiral quando a máquina não dá conta.
+
+Uso típico (no main):
+    timestep = FixedTimestep()
+    for _ in timestep.advance(clock.tick() / 1000):
+        simula_um_tick(FIXED_DT)
+    desenha(timestep.alpha)
+"""
+
+SIM_HZ = 60                  # ticks de simulação por segundo
+FIXED_DT = 1 / SIM_HZ        # duração de um tick (s)
+
+
+class FixedTimestep:
+    """
+    Acumulador de tempo real → ticks fixos.
+
+    Parâmetros
+    ----------
+    dt : float, opcional
+        Duração de cada tick em segundos (padrão = `FIXED_DT`).
+    max_frame_time : float, opcional
+        Maior tempo real (s) contabilizado por frame; acima disso o jogo
+        desacelera em vez de travar tentando alcançar.
+    """
+
+    def __init__(self, dt=FIXED_DT, max_frame_time=0.25):
+        self.dt = dt
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.ticks = 0
+
+    def advance(self, frame_time, time_scale=1.0):
+        """
+        Soma `frame_time` (s) ao acumulador e gera um item por tick a simular.
+
+        Parameters
+        ----------
+        frame_time : float
+            Tempo real desde o último frame, em segundos.
+        time_scale : float, opcional
+            Multiplicador do tempo de jogo (ex.: 1.5 = 50% mais rápido).
+        """
+        self.accumulator += min(frame_time, self.max_frame_time) * time_scale
+        while self.accumulator >= self.dt:
+            self.accumulator -= self.dt
+            self.ticks += 1
+            yield self.dt
+
+    @property
+    def alpha(self):
+        """Fração (0.0–1.0) do próximo tick já decorrida, pra interpolar o desenho."""
+        return self.accumulator / self.dt
+
+
+def interpolate(rect, prev_anchor, alpha):
+    """
+    Devolve `rect` deslocado pra posição interpolada do desenho.
+
+    Parameters
+    ----------
+    rect : pygame.Rect
+        Posição no tick atual.
+    prev_anchor : tuple[int, int] | None
+        `midbottom` do tick anterior (`None` = sem interpolação, ex.: teleporte).
+    alpha : float
+        Fração do tick seguinte já decorrida (1.0 = posição atual).
+    """
+    if prev_anchor is None or alpha >= 1.0:
+        return rect
+    back = 1.0 - alpha
+    return rect.move(
+        round((prev_anchor[0] - rect.centerx) * back),
+        round((prev_anchor[1] - rect.bottom) * back),
+    )
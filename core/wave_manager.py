@@ -1,50 +1,315 @@
-from core.bringer import BringerOfDeathEnemy  # ✅ Importa o Bringer
+"""
+Ondas de inimigos da passarela (**WaveManager**) do Hollow Mooni.
 
+As ondas vêm de um arquivo JSON (`assets/waves/passarela.json`) que diz,
+pra cada onda, que tipos de inimigo entram, quantos, quando (ms de jogo
+desde o começo da onda) e onde:
+
+    {"waves": [
+        [{"type": "skeleton", "count": 3}],
+        [{"type": "skeleton", "count": 2},
+         {"type": "bringer", "count": 1, "at_ms": 500}],
+        [{"type": "skeleton", "count": 20, "every_ms": 250, "x": 100, "dx": 60}]
+    ]}
+
+Campos de cada entrada (só `type` é obrigatório): `count` (1), `at_ms`
+(0), `every_ms` (intervalo entre um e outro, 0), `x` (-150: negativo conta
+a partir da borda direita), `dx` (-100: passo entre um e o próximo) e `y`
+(altura de spawn; padrão = a do tipo, relativa ao chão).
+
+Cada tipo tem uma fábrica registrada (`register_spawn_factory`): classe,
+altura de spawn e argumentos extras do construtor — nada de checar nome
+de classe. Ao começar uma onda, as entradas viram uma fila ordenada por
+horário; cada tick spawna o que venceu, até `spawn_budget` inimigos (o
+resto fica pro tick seguinte), então uma onda enorme não cabe inteira
+num frame só. O custo dos spawns de cada tick e a latência entre pedir a
+onda e o primeiro inimigo entrar ficam em `metrics()` (e o spawn aparece
+como a fase `waves.spawn` do profiler).
+
+Uso típico (no `Game`):
+    waves = load_waves("assets/waves/passarela.json")
+    manager = WaveManager(waves, all_enemies, 1280, ground_level, room_manager)
+    manager.start_next_wave()
+    manager.update()        # 1x por tick
+"""
+
+import json
+import time
+
+from core.bringer import BringerOfDeathEnemy
+from core.clock import game_clock
+from core.event_log import event_log
+from core.nightborne import NightBorneEnemy
+from core.pool import sprite_pools
+from core.profiler import profiler
+from core.skeleton import SkeletonEnemy
+
+DEFAULT_SPAWN_BUDGET = 4        # inimigos criados por tick, no máximo
+DEFAULT_X = -150                # primeiro da entrada: 150 px antes da borda direita
+DEFAULT_DX = -100               # os seguintes, 100 px mais pra esquerda cada
+
+waves_log = event_log.channel("waves")
+
+
+# ------------------------------------------------------------------
+# fábricas por tipo de inimigo
+# ------------------------------------------------------------------
+class SpawnFactory:
+    """
+    Como um tipo de inimigo nasce numa onda.
+
+    Parâmetros
+    ----------
+    cls : type
+        Classe do inimigo (reset/construtor recebem `pos` primeiro).
+    ground_offset : int
+        Altura de spawn relativa ao chão da sala (`y = chão + offset`).
+    *args, **kwargs
+        Argumentos extras do construtor/`reset`.
+    """
+
+    def __init__(self, cls, ground_offset, *args, **kwargs):
+        self.cls = cls
+        self.ground_offset = ground_offset
+        self.args = args
+        self.kwargs = kwargs
+
+    def spawn(self, pos, all_enemies, batch=None, cls=None):
+        """
+        Põe um inimigo em campo: no `EnemyBatch` se ele suportar a classe,
+        senão um sprite do `sprite_pools` em `all_enemies`.
+
+        Parameters
+        ----------
+        cls : type, opcional
+            Subclasse a usar no lugar de `self.cls` (ex.: vida escalada
+            do `tools.balance_sim`).
+        """
+        cls = cls or self.cls
+        if batch is not None and batch.supports(cls):
+            batch.spawn(cls, pos)
+            return
+        enemy = sprite_pools.acquire(cls, pos, *self.args, **self.kwargs)
+        enemy.facing_right = False
+        all_enemies.add(enemy)
+
+
+SPAWN_FACTORIES = {}
+
+
+def register_spawn_factory(name, cls, ground_offset, *args, **kwargs):
+    """Registra (ou troca) a fábrica do tipo `name` usado nos arquivos de onda."""
+    SPAWN_FACTORIES[name] = SpawnFactory(cls, ground_offset, *args, **kwargs)
+
+
+def resolve_type(enemy_type):
+    """
+    Fábrica e classe de um tipo de onda.
+
+    Parameters
+    ----------
+    enemy_type : str | type
+        Nome registrado ou uma classe (ela mesma ou subclasse de uma
+        registrada).
+
+    Returns
+    -------
+    tuple[SpawnFactory, type]
+    """
+    if isinstance(enemy_type, str):
+        factory = SPAWN_FACTORIES.get(enemy_type)
+        if factory is None:
+            raise KeyError(f"tipo de inimigo sem fábrica registrada: {enemy_type!r}")
+        return factory, factory.cls
+    for factory in SPAWN_FACTORIES.values():
+        if issubclass(enemy_type, factory.cls):
+            return factory, enemy_type
+    raise KeyError(f"classe sem fábrica registrada: {enemy_type.__name__}")
+
+
+# chão da passarela = 750: esqueleto em 560 (topleft), NightBorne em 660 (midbottom)
+register_spawn_factory("skeleton", SkeletonEnemy, -190)
+register_spawn_factory("nightborne", NightBorneEnemy, -90, NightBorneEnemy.default_sheet)
+register_spawn_factory("bringer", BringerOfDeathEnemy, -80, scale=1.0)
+
+
+# ------------------------------------------------------------------
+# arquivos de onda
+# ------------------------------------------------------------------
+def normalize_wave(wave):
+    """
+    Entradas de uma onda no formato de dicionário.
+
+    Aceita também o formato antigo, `[(Classe, quantidade), ...]`.
+    """
+    entries = []
+    for entry in wave:
+        if not isinstance(entry, dict):
+            enemy_type, count = entry
+            entry = {"type": enemy_type, "count": count}
+        resolve_type(entry["type"])  # tipo desconhecido falha já no carregamento
+        entries.append(entry)
+    return entries
+
+
+def load_waves(path):
+    """
+    Lê um arquivo de ondas.
+
+    Returns
+    -------
+    list[list[dict]]
+        Uma lista de entradas por onda.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return [normalize_wave(wave) for wave in data["waves"]]
+
+
+# ------------------------------------------------------------------
+# agendador
+# ------------------------------------------------------------------
 class WaveManager:
-    def __init__(self, wave_definitions, all_enemies, screen_width, ground_level, room_manager):
-        self.wave_definitions = wave_definitions
+    """
+    Agenda e spawna as ondas, poucos inimigos por tick.
+
+    Parâmetros
+    ----------
+    wave_definitions : list
+        Ondas (ver `load_waves`; o formato antigo `[(Classe, qtd)]` vale).
+    all_enemies : pygame.sprite.Group
+        Grupo dos inimigos-sprite em campo.
+    screen_width : int
+        Largura da sala (posições negativas contam daqui).
+    ground_level : int
+        Chão da sala (as alturas de spawn são relativas a ele).
+    room_manager : RoomManager
+        Avisado quando todas as ondas acabam.
+    batch : EnemyBatch, opcional
+        Tipos suportados nascem em lote.
+    clock : GameClock, opcional
+        Relógio dos horários de spawn (padrão = `game_clock`).
+    spawn_budget : int, opcional
+        Inimigos criados por tick, no máximo.
+    """
+
+    def __init__(self, wave_definitions, all_enemies, screen_width, ground_level, room_manager,
+                 batch=None, clock=game_clock, spawn_budget=DEFAULT_SPAWN_BUDGET):
+        self.wave_definitions = [normalize_wave(wave) for wave in wave_definitions]
         self.all_enemies = all_enemies
+        self.batch = batch  # EnemyBatch opcional: tipos suportados nascem em lote
         self.current_wave = 1
         self.wave_in_progress = False
         self.screen_width = screen_width
         self.ground_level = ground_level
         self.room_manager = room_manager
+        self.clock = clock
+        self.spawn_budget = spawn_budget
+
+        self._queue = []          # (ms de jogo, seq, fábrica, classe, pos), do fim pro começo
+        self._wave_start = None   # (ms de jogo, perf_counter) do pedido da onda atual
+
+        self.spawned = 0
+        self.deferred = 0         # spawns empurrados pro tick seguinte pelo orçamento
+        self.spawn_ticks = 0      # ticks que spawnaram alguém
+        self.spawn_ms_total = 0.0
+        self.spawn_ms_max = 0.0
+        self.start_latency_ms = []  # por onda: pedido → 1º inimigo em campo (ms reais)
+
+    # ------------------------------------------------------------------
+    def _schedule(self, wave):
+        """Expande as entradas da onda numa fila ordenada por horário."""
+        queue = []
+        start = self.clock.get_ticks()
+        for entry in wave:
+            factory, cls = resolve_type(entry["type"])
+            x = entry.get("x", DEFAULT_X)
+            if x < 0:
+                x += self.screen_width
+            dx = entry.get("dx", DEFAULT_DX)
+            y = entry.get("y", self.ground_level + factory.ground_offset)
+            at_ms = entry.get("at_ms", 0)
+            every_ms = entry.get("every_ms", 0)
+            for i in range(entry.get("count", 1)):
+                due = start + at_ms + i * every_ms
+                queue.append((due, len(queue), factory, cls, (x + i * dx, y)))
+        queue.sort(key=lambda item: item[:2])
+        queue.reverse()  # pop() do fim = próximo a nascer
+        return queue
 
     def start_next_wave(self):
         if self.current_wave <= len(self.wave_definitions):
-            print(f"Iniciando Wave {self.current_wave}")
+            waves_log.info("start", self.current_wave)
             wave = self.wave_definitions[self.current_wave - 1]
-
-            for enemy_class, count in wave:
-                for i in range(count):
-                    spawn_x = self.screen_width - 150 - i * 100  # ✅ Mantém espaçamento
-
-                    if issubclass(enemy_class, BringerOfDeathEnemy):
-                        spawn_y = self.ground_level - 80  # ✅ Ajuste para o Bringer
-                        enemy = enemy_class((spawn_x, spawn_y), scale=1.0)
-                    else:
-                        # ✅ Correção para NightBorneEnemy
-                        if enemy_class.__name__ == "NightBorneEnemy":
-                            spawn_y = 660  # ✅ Ajuste para alinhar o NightBorne
-                            sprite_sheet_path = "assets/enemies/nightborne/NightBorne.png" 
-                            enemy = enemy_class((spawn_x, spawn_y), sprite_sheet_path)
-                        else:
-                            spawn_y = 560  # ✅ Padrão pros esqueletos
-                            enemy = enemy_class((spawn_x, spawn_y))
-
-                    enemy.facing_right = False
-                    enemy.recently_hit = False
-                    self.all_enemies.add(enemy)
-
+            self._queue = self._schedule(wave)
+            self._wave_start = (self.clock.get_ticks(), time.perf_counter())
             self.wave_in_progress = True
+            self._spawn_due()  # quem nasce no ms 0 já entra neste tick
         else:
-            print("Todas as waves concluidas!")
+            waves_log.info("done")
             self.room_manager.complete_waves()
 
+    def _spawn_due(self):
+        """Spawna o que já venceu, até `spawn_budget`; mede o custo."""
+        queue = self._queue
+        now = self.clock.get_ticks()
+        if not queue or queue[-1][0] > now:
+            return
+        with profiler.scope("waves.spawn"):
+            start = time.perf_counter()
+            count = 0
+            while queue and queue[-1][0] <= now and count < self.spawn_budget:
+                _, _, factory, cls, pos = queue.pop()
+                factory.spawn(pos, self.all_enemies, self.batch, cls)
+                count += 1
+            ms = (time.perf_counter() - start) * 1000
+        if queue and queue[-1][0] <= now:
+            self.deferred += sum(1 for item in queue if item[0] <= now)
+
+        if self._wave_start is not None:
+            self.start_latency_ms.append((time.perf_counter() - self._wave_start[1]) * 1000)
+            self._wave_start = None
+        self.spawned += count
+        self.spawn_ticks += 1
+        self.spawn_ms_total += ms
+        self.spawn_ms_max = max(self.spawn_ms_max, ms)
+
+    def pending(self):
+        """Inimigos da onda atual que ainda não nasceram."""
+        return len(self._queue)
+
+    def remaining(self):
+        """Inimigos vivos da onda (sprites + lote)."""
+        return len(self.all_enemies) + (len(self.batch) if self.batch is not None else 0)
+
     def update(self):
-        if self.wave_in_progress and len(self.all_enemies) == 0:
-            print(f"Wave {self.current_wave} concluida!")
+        self._spawn_due()
+        if self.wave_in_progress and not self._queue and self.remaining() == 0:
+            waves_log.info("clear", self.current_wave)
             self.current_wave += 1
             self.wave_in_progress = False
             if self.current_wave > len(self.wave_definitions):
                 self.room_manager.complete_waves()
+
+    # ------------------------------------------------------------------
+    def metrics(self):
+        """
+        Métricas de spawn desde a criação do manager.
+
+        Returns
+        -------
+        dict
+            `spawned`, `deferred` (inimigos já vencidos que ficaram pro
+            tick seguinte por causa do orçamento, somados tick a tick),
+            `spawn_ticks`, `spawn_ms_mean`/`spawn_ms_max` (custo dos spawns
+            por tick que spawnou) e `start_latency_ms` (lista, uma por onda:
+            pedido da onda → primeiro inimigo em campo, ms reais).
+        """
+        return {
+            "spawned": self.spawned,
+            "deferred": self.deferred,
+            "spawn_ticks": self.spawn_ticks,
+            "spawn_ms_mean": self.spawn_ms_total / self.spawn_ticks if self.spawn_ticks else 0.0,
+            "spawn_ms_max": self.spawn_ms_max,
+            "start_latency_ms": list(self.start_latency_ms),
+        }
@@ -1,10 +1,10 @@
 """
 Módulo principal do jogo **Hollow Mooni**.
 
-Aqui rola todo o fluxo do game: inicialização do Pygame, estados de tela
-(menu inicial, lore e gameplay), gerenciamento de salas (`RoomManager`),
-ondas de inimigos (`WaveManager`) e o combate contra o chefe final
-(`KnightBoss`).  
+Aqui rola a parte com tela do game: inicialização do Pygame, estados de
+tela (menu inicial, lore e gameplay), carregamento e desenho. A lógica
+do gameplay (salas, ondas, combate e chefe final) fica em `core.game.Game`,
+que roda igual sem janela (ver `core.headless`).  
 Execução típica (a partir da raiz do projeto):
 
     $ python main.py
@@ -15,66 +15,68 @@ Requisitos:
 - Pygame instalado (`pip install pygame`).
 """
 
+import os
+import time
+
 import pygame
 from core.player import Player
-from core.room_manager import RoomManager
-from core.wave_manager import WaveManager
+from core.room_manager import ROOMS, THEME
 from core.skeleton import SkeletonEnemy
 from core.nightborne import NightBorneEnemy
 from core.bringer import BringerOfDeathEnemy
-from core.spell_effect import SpellEffect
 from core.knight_boss import KnightBoss
+from core.game import Game
+from core.asset_cache import asset_cache
+from core.asset_loader import AssetLoader
+from core.text_renderer import text_renderer
+from core.dirty_renderer import DirtyRectRenderer
+from core.profiler import profiler
+from core.event_log import event_log
+from core.replay import InputRecorder
+from core.clock import game_clock
+from core.sound_bank import sound_bank
+from core.music import music_player
+from core.timing import FixedTimestep, interpolate
+
+boot_start = time.perf_counter()  # base p/ medir time-to-first-frame / time-to-playable
 
 pygame.init()
 pygame.mixer.init()
+music_player.play(THEME)  # decodifica em background; começa num `update()` quando ficar pronta
 
 # ================== CONFIG GLOBAL ==================
 SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 720
-BOSS_Y_OFFSET = -125            # deixa os pés do boss nivelados com o player
-PLAYER_CENTER_OFFSET = 50       # metade da largura do player (~) para sala 0
-
-# ================== ÁUDIO ==========================
-pygame.mixer.music.load('assets/sounds/backgroundprinci.mp3')
-pygame.mixer.music.set_volume(0.5)
-pygame.mixer.music.play(-1)
+DIRTY_RECTS = False             # opt-in: só redesenha/atualiza as áreas que mudaram
+ENEMY_BATCH = False             # opt-in: "numpy" (esqueletos/NightBornes em arrays) ou "ecs" (+ Bringers em componentes)
+TEXTURE_ATLAS = True            # frames das animações recortados e empacotados (blits menores)
+MAX_RENDER_FPS = 60             # teto de frames desenhados por segundo (0 = sem teto)
+ROOM_TIME_SCALE = {2: 1.5}      # sala do boss roda 50% mais rápida (antes: tick a 90 FPS)
+PROFILE_EXPORT = None           # ex.: "profile.csv" / "profile.jsonl": tempos por fase de cada frame (F3 = overlay)
+RECORD_INPUT = None             # ex.: "sessao.hmr": grava a entrada de cada tick (replay: python -m tools.replay)
+EVENT_LOG_EXPORT = None         # ex.: "events.jsonl": eventos de combate/ondas gravados por uma thread de fundo
+COMBAT_LOG = False              # log de combate na tela desde o começo (F4 liga/desliga)
 
 # ================== JANELA =========================
+# (a janela vem primeiro: todo o I/O pesado roda depois, com a tela inicial já visível)
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Hollow Mooni - Room System")
 clock = pygame.time.Clock()
 
 
-# =============== POSICIONAMENTO ====================
-def position_player_for_room(room_id, player):
-    """
-    Posiciona o jogador na coordenada X correta ao entrar em cada sala.
-
-    Parâmetros
-    ----------
-    room_id : int
-        ID numérico da sala (0, 1, 2…).
-    player : Player
-        Instância do jogador cuja posição será modificada.
-    """
-    if room_id == 0:
-        player.rect.centerx = SCREEN_WIDTH // 2 - PLAYER_CENTER_OFFSET
-    else:                      # salas 1 e 2
-        player.rect.left = 50
-
-
 # =============== TELA INICIAL ======================
 game_state = -2  # -2: start screen | -1: lore | 0+: jogo
 
-start_screen = pygame.image.load('assets/background/telainicial.png')
-start_screen = pygame.transform.scale(start_screen, (SCREEN_WIDTH, SCREEN_HEIGHT))
-font_ui = pygame.font.SysFont(None, 60)
-button_text = font_ui.render('INICIAR', True, (255, 255, 255))
+start_screen = asset_cache.image('assets/background/telainicial.png', (SCREEN_WIDTH, SCREEN_HEIGHT))
+button_text = text_renderer.render('INICIAR', 60)
 button_rect = button_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
 
 # =============== INTRODUÇÃO ========================
-intro_image = pygame.image.load('assets/background/introducao1.png')
-intro_image = pygame.transform.scale(intro_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
-intro_font = pygame.font.SysFont('timesnewroman', 36)
+INTRO_IMAGE_PATH = 'assets/background/introducao1.png'
+intro_image = None  # carregada em background por `load_game()`
+INTRO_FONT = 'timesnewroman'
+lore_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))  # escurece a arte do lore
+lore_overlay.set_alpha(150)
+lore_overlay.fill((0, 0, 0))
 lore_lines = [
     "Em um reino outrora próspero,",
     "uma terrível maldição selou seu destino.",
@@ -92,37 +94,104 @@ lore_lines = [
 ]
 
 # =============== SETUP DE JOGO =====================
-room_manager = RoomManager(SCREEN_WIDTH, SCREEN_HEIGHT)
-current_ground_level = room_manager.get_ground_level()
-
-player = Player((0, 0))
-player.rect.bottom = current_ground_level
-position_player_for_room(room_manager.current_room, player)
-player.attack_damage = {"smash": 15, "thrust": 10}
-
-all_enemies = pygame.sprite.Group()
-spells = pygame.sprite.Group()
-wave_definitions = [
-    [(SkeletonEnemy, 3)],
-    [(SkeletonEnemy, 2), (BringerOfDeathEnemy, 1)],
-    [(NightBorneEnemy, 1), (SkeletonEnemy, 2)],
-]
+game = None  # criado por `load_game()` enquanto a tela inicial roda
+recorder = None  # `InputRecorder` da partida, com `RECORD_INPUT` ligado
+running = True
 
-wave_manager = None
-waves_completed = False
-boss = None
-boss_group = None
-boss_intro_time = None
-boss_dialogue = [
-    "Então é você mais um a perecer para essa maldição...",
-    "Eu era o melhor amigo do rei... minha missão era salvá-lo...",
-    "Mas eu falhei... e falharei novamente agora que mais um inocente cairá",
-    "Mas você... eu reconheço...",
-    "Meu rei... mesmo em outra forma...",
-    "Por favor... salve-nos desta maldição... e me conceda seu perdão...",
-]
-current_dialogue_index = 0
-dialogue_start_time = None
+
+# =============== CARREGAMENTO ======================
+def game_image_paths():
+    """
+    Lista os PNGs que o jogo pede pro `asset_cache` antes do primeiro frame jogável.
+
+    Returns
+    -------
+    list[str]
+        Caminhos pra decodificar em background antes do gameplay.
+    """
+    paths = [INTRO_IMAGE_PATH]
+    # só a primeira sala: as outras o RoomManager busca sob demanda
+    paths += [ROOMS[0][layer] for layer in ("background", "foreground") if layer in ROOMS[0]]
+    paths += [path for path, _ in Player.animation_data.values()]
+    paths += [path for path, _ in SkeletonEnemy.animation_data.values()]
+    paths += [path for path, _, _ in KnightBoss.animation_data.values()]
+    paths += [KnightBoss.attack_sheet, NightBorneEnemy.default_sheet]
+    for folder in BringerOfDeathEnemy.animation_folders.values():
+        folder_path = os.path.join(BringerOfDeathEnemy.base_path, folder)
+        paths += [
+            os.path.join(folder_path, filename)
+            for filename in sorted(os.listdir(folder_path))
+            if filename.endswith(".png")
+        ]
+    return paths
+
+
+def load_game():
+    """
+    Carrega o resto do jogo enquanto a tela inicial já está na tela.
+
+    É um gerador: cada `yield` devolve o progresso (0.0–1.0) pro loop
+    principal, que desenha a barra antes de seguir pro próximo passo.
+    A decodificação dos PNGs roda nas threads do `AssetLoader`; aqui, na
+    thread principal, só sobram conversões e a montagem dos objetos.
+    """
+    global intro_image, game, recorder
+
+    loader = AssetLoader()
+    loader.request_many(game_image_paths())
+    steps = 4  # passos depois da decodificação (efeitos sonoros, lore, entidades+atlas, partida)
+
+    def progress(step):
+        return (loader.loaded + step) / (loader.total + steps)
+
+    while not loader.done:
+        loader.poll()
+        yield progress(0)
+    loader.shutdown()
+
+    sound_bank.preload()  # efeitos dos golpes decodificados aqui, não no primeiro ataque
+    yield progress(1)
+
+    intro_image = asset_cache.image(INTRO_IMAGE_PATH, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    yield progress(2)
+
+    # monta uma vez cada entidade só pra converter os frames agora, e não no
+    # spawn; com o atlas, os frames ainda são recortados e empacotados aqui,
+    # antes de a partida criar as entidades de verdade
+    Player((0, 0))
+    SkeletonEnemy((0, 0))
+    NightBorneEnemy((0, 0))
+    BringerOfDeathEnemy((0, 0))
+    KnightBoss((0, 0), ROOMS[2]["ground_level"])
+    if TEXTURE_ATLAS:
+        atlas = asset_cache.build_atlas()
+        print(f"[boot] atlas: {atlas.stats()}")
+    yield progress(3)
+
+    game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, enemy_batch=ENEMY_BATCH)  # salas + player
+    if RECORD_INPUT:
+        recorder = InputRecorder(RECORD_INPUT, game)
+    yield progress(4)
+
+
+def draw_loading_bar(surface, progress, rect):
+    """
+    Desenha a barra de carregamento da tela inicial.
+
+    Parameters
+    ----------
+    surface : pygame.Surface
+        Tela de destino.
+    progress : float
+        Fração carregada (0.0–1.0).
+    rect : pygame.Rect
+        Área ocupada pela barra.
+    """
+    pygame.draw.rect(surface, (30, 60, 60), rect, border_radius=6)
+    fill = rect.copy()
+    fill.width = int(rect.width * progress)
+    pygame.draw.rect(surface, (120, 200, 200), fill, border_radius=6)
+    pygame.draw.rect(surface, (255, 255, 255), rect, 2, border_radius=6)
 
 
 # =============== FUNÇÕES AUXILIARES ================
@@ -130,6 +199,9 @@ def draw_text(surface, text, pos, color=(255, 255, 255), size=36):
     """
     Desenha texto simples na tela.
 
+    Fonte e Surface do texto vêm do `text_renderer`: string repetida
+    (prompt, diálogo) não é criada nem renderizada de novo a cada frame.
+
     Parameters
     ----------
     surface : pygame.Surface
@@ -142,8 +214,13 @@ def draw_text(surface, text, pos, color=(255, 255, 255), size=36):
         Cor RGB do texto.
     size : int, opcional
         Tamanho da fonte.
+
+    Returns
+    -------
+    pygame.Rect
+        Área ocupada pelo texto.
     """
-    surface.blit(pygame.font.SysFont(None, size).render(text, True, color), pos)
+    return surface.blit(text_renderer.render(text, size, color), pos)
 
 
 def draw_health_bar(surface, player, pos=(20, 20), size=(200, 20)):
@@ -160,6 +237,11 @@ def draw_health_bar(surface, player, pos=(20, 20), size=(200, 20)):
         Posição da barra.
     size : tuple[int, int], opcional
         Largura e altura da barra.
+
+    Returns
+    -------
+    pygame.Rect
+        Área ocupada pela barra.
     """
     pygame.draw.rect(surface, (255, 0, 0), (*pos, *size))
     pygame.draw.rect(
@@ -167,7 +249,7 @@ def draw_health_bar(surface, player, pos=(20, 20), size=(200, 20)):
         (0, 255, 0),
         (*pos, size[0] * (player.health / player.max_health), size[1]),
     )
-    pygame.draw.rect(surface, (255, 255, 255), (*pos, *size), 2)
+    return pygame.draw.rect(surface, (255, 255, 255), (*pos, *size), 2)
 
 
 def draw_boss_health_bar(surface, boss, pos=(SCREEN_WIDTH // 2 - 150, 20), size=(300, 20)):
@@ -184,6 +266,11 @@ def draw_boss_health_bar(surface, boss, pos=(SCREEN_WIDTH // 2 - 150, 20), size=
         Posição da barra.
     size : tuple[int, int], opcional
         Largura e altura da barra.
+
+    Returns
+    -------
+    pygame.Rect
+        Área ocupada pela barra.
     """
     pygame.draw.rect(surface, (255, 0, 0), (*pos, *size))
     pygame.draw.rect(
@@ -191,345 +278,217 @@ def draw_boss_health_bar(surface, boss, pos=(SCREEN_WIDTH // 2 - 150, 20), size=
         (0, 255, 0),
         (*pos, size[0] * (boss.hp / boss.max_hp), size[1]),
     )
-    pygame.draw.rect(surface, (255, 255, 255), (*pos, *size), 2)
+    return pygame.draw.rect(surface, (255, 255, 255), (*pos, *size), 2)
 
 
-def hitbox_thrust(player, length, height, offset_y=0):
+# =============== DESENHO DO GAMEPLAY ================
+def draw_game(game, alpha):
     """
-    Retorna um `pygame.Rect` representando a área de dano do ataque *thrust*.
+    Desenha o gameplay no estado atual, sem mexer na simulação.
 
     Parameters
     ----------
-    player : Player
-        Jogador executando o ataque.
-    length : int
-        Comprimento horizontal do hitbox.
-    height : int
-        Altura vertical do hitbox.
-    offset_y : int, opcional
-        Deslocamento vertical adicional.
-
-    Returns
-    -------
-    pygame.Rect
-        Retângulo de colisão do ataque.
-    """
-    if player.facing_right:
-        return pygame.Rect(
-            player.rect.centerx,
-            player.rect.centery - height // 2 + offset_y,
-            length,
-            height,
-        )
-    return pygame.Rect(
-        player.rect.centerx - length,
-        player.rect.centery - height // 2 + offset_y,
-        length,
-        height,
-    )
-
-
-def hitbox_smash(player, width, height, offset_y=0):
+    game : Game
+        Partida a ser desenhada.
+    alpha : float
+        Fração do próximo tick já decorrida; as entidades são desenhadas
+        interpoladas entre o tick anterior e o atual.
     """
-    Retorna um `pygame.Rect` representando a área de dano do ataque *smash*.
-
-    Parameters
-    ----------
-    player : Player
-        Jogador executando o ataque.
-    width : int
-        Largura do hitbox.
-    height : int
-        Altura do hitbox.
-    offset_y : int, opcional
-        Deslocamento vertical adicional.
+    room_manager, player, boss = game.room_manager, game.player, game.boss
+    ground_level = game.ground_level
 
-    Returns
-    -------
-    pygame.Rect
-        Retângulo de colisão do ataque.
-    """
-    if player.facing_right:
-        return pygame.Rect(player.rect.centerx, player.rect.top + offset_y, width, height)
-    return pygame.Rect(
-        player.rect.centerx - width, player.rect.top + offset_y, width, height
+    renderer.begin_frame(
+        (room_manager.current_room, room_manager.is_loaded(room_manager.current_room))
     )
+    player_area = player.image.get_rect(
+        topleft=interpolate(player.rect, player.prev_anchor, alpha).topleft
+    )
+    with profiler.scope("room.draw"):
+        room_manager.draw_room(screen, renderer.restore_rects([player_area]))
+    with profiler.scope("player.draw"):
+        renderer.mark(player.draw(screen, alpha))
+    with profiler.scope("room.foreground"):
+        room_manager.draw_foreground(screen, renderer.dirty_rects())
+
+    # cada camada sai num `blits` só
+    with profiler.scope("enemies.draw"):
+        batch = [enemy.blit_item(alpha) for enemy in game.all_enemies]
+        if game.enemy_batch is not None:
+            batch += game.enemy_batch.blit_items(alpha)
+        for rect in screen.blits(batch):
+            renderer.mark(rect)
+
+    with profiler.scope("spells.draw"):
+        for rect in screen.blits([sp.blit_item(alpha) for sp in game.spells]):
+            renderer.mark(rect)
+
+    # ----- Boss room (diálogo / luta) -----
+    with profiler.scope("boss.draw"):
+        if room_manager.current_room == 2 and boss:
+            if game.dialogue_line:
+                renderer.mark(draw_text(
+                    screen,
+                    game.dialogue_line,
+                    (SCREEN_WIDTH // 2 - 300, ground_level - 75),
+                    (255, 255, 255),
+                    30,
+                ))
 
+            renderer.mark(boss.draw(screen, alpha))
+            renderer.mark(draw_boss_health_bar(screen, boss))
 
-def apply_damage(hitbox, enemies, damage):
-    """
-    Aplica dano aos inimigos que colidem com o `hitbox`.
-
-    Parameters
-    ----------
-    hitbox : pygame.Rect
-        Retângulo de colisão do ataque.
-    enemies : pygame.sprite.Group
-        Grupo com instâncias de inimigos.
-    damage : int
-        Quantidade de dano a ser aplicada.
-    """
-    for enemy in enemies:
-        if hitbox.colliderect(enemy.rect) and not enemy.recently_hit:
-            enemy.take_damage(damage)
-            enemy.recently_hit = True
-
-
-def check_player_attack(player, enemies, boss=None):
-    """
-    Verifica se o jogador acertou algum inimigo ou o chefe no frame atual.
-
-    Deve ser chamada uma vez por frame após `player.update()`.
-
-    Parameters
-    ----------
-    player : Player
-        Jogador em ação.
-    enemies : pygame.sprite.Group
-        Grupo de inimigos suscetíveis a levar dano.
-    boss : KnightBoss, opcional
-        Instância do chefe, se presente na sala.
-    """
-    if player.state not in ("smash", "thrust"):
-        return
-
-    dmg = player.attack_damage[player.state]
-    frame = int(player.frame_index)
-    hitbox = None
-
-    if player.state == "smash" and 8 <= frame <= 12:
-        hitbox = hitbox_smash(player, 96, 80, 20)
-    elif player.state == "thrust" and frame == 6:
-        hitbox = hitbox_thrust(player, 100, 10)
-
-    if hitbox is None:
-        return
-
-    apply_damage(hitbox, enemies, dmg)
-    if boss and hitbox.colliderect(boss.rect):
-        boss.take_damage(dmg)
-
-
-# ================= LOOP PRINCIPAL ==================
-running = True
-while running:
-    keys = pygame.key.get_pressed()
-
-    # ---------- EVENTOS ----------
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        if game_state == -2 and event.type == pygame.MOUSEBUTTONDOWN:
-            if button_rect.collidepoint(event.pos):
-                game_state = -1
-        elif game_state == -1 and event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-            game_state = 0
-
-    # ---------- TELAS ----------
-    if game_state == -2:  # Start screen
-        screen.blit(start_screen, (0, 0))
-        hover = button_rect.collidepoint(pygame.mouse.get_pos())
-        col = (50, 80, 80) if hover else (30, 60, 60)
-        pygame.draw.rect(screen, col, button_rect.inflate(30, 15), border_radius=10)
-        screen.blit(button_text, button_rect)
-
-    elif game_state == -1:  # Lore
-        screen.blit(intro_image, (0, 0))
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
-        for i, line in enumerate(lore_lines):
-            screen.blit(intro_font.render(line, True, (255, 255, 255)), (50, 50 + i * 50))
-
-    else:  # ============ JOGO ============
-        current_ground_level = room_manager.get_ground_level()
-
-        # Flags para prompts
-        show_castle_prompt = False
-        show_patio_prompt = False
-
-        # ----- Permitir movimento? -----
-        if room_manager.current_room == 0:
-            player_can_move = False
-        elif room_manager.current_room == 2 and boss and boss.passive:
-            player_can_move = False
-        else:
-            player_can_move = True
-
-        if player_can_move:
-            player.update(keys, current_ground_level, SCREEN_WIDTH)
-
-        check_player_attack(player, all_enemies, boss)
-
-        # ----- Reset flag de recently_hit -----
-        if player.state not in ("smash", "thrust"):
-            for e in all_enemies:
-                e.recently_hit = False
-
-        # ----- Spawning de waves -----
-        if room_manager.current_room == 1 and wave_manager is None:
-            wave_manager = WaveManager(
-                wave_definitions, all_enemies, SCREEN_WIDTH, current_ground_level, room_manager
-            )
-            wave_manager.start_next_wave()
-
-        if wave_manager:
-            if len(all_enemies) > 0 or wave_manager.wave_in_progress:
-                wave_manager.update()
-            if (
-                not wave_manager.wave_in_progress
-                and len(all_enemies) == 0
-                and wave_manager.current_wave <= len(wave_definitions)
-            ):
-                wave_manager.start_next_wave()
-
-        # ----- Mensagem pós-waves (sala 1) -----
-        if (
-            wave_manager
-            and wave_manager.current_wave > len(wave_definitions)
-            and len(all_enemies) == 0
-        ):
-            show_patio_prompt = True
-            if keys[pygame.K_e]:
-                room_manager.next_room()
-                current_ground_level = room_manager.get_ground_level()
-                player.rect.bottom = current_ground_level
-                position_player_for_room(room_manager.current_room, player)
-                player.health = player.max_health
-                wave_manager = None
-                all_enemies.empty()
-
-                if room_manager.current_room == 2:
-                    boss = KnightBoss(
-                        (SCREEN_WIDTH // 2 - 100, current_ground_level - 100), current_ground_level
-                    )
-                    boss.rect.bottom = current_ground_level
-                    boss.rect.y += BOSS_Y_OFFSET  # alinhamento vertical
-                    boss.state = "pray"
-                    boss.passive = True
-                    boss.animation_index = 3
-                    boss_group = pygame.sprite.GroupSingle(boss)
-                    boss_intro_time = pygame.time.get_ticks()
-                    dialogue_start_time = boss_intro_time
-                    current_dialogue_index = 0
-
-        # ----- Porta do castelo (0→1) -----
-        if room_manager.current_room == 0:
-            show_castle_prompt = True
-            if keys[pygame.K_e]:
-                room_manager.next_room()
-                player.rect.bottom = room_manager.get_ground_level()
-                position_player_for_room(room_manager.current_room, player)
-
-        # ----- Desenho de cenário e entidades -----
-        room_manager.draw_room(screen)
-        player.draw(screen)
-        room_manager.draw_foreground(screen)
-
-        for enemy in all_enemies:
-            if isinstance(enemy, BringerOfDeathEnemy):
-                enemy.update(player, spells)
-            else:
-                enemy.update(player)
-            enemy.draw(screen)
-
-        for sp in spells:
-            sp.update(player)
-            sp.draw(screen)
-
-        # ----- Boss room (diálogo / luta) -----
-        if room_manager.current_room == 2 and boss:
-            if boss.passive:
-                boss.state, boss.animation_index = "pray", 3
-                boss.image = boss.animations["pray"][boss.animation_index]
-                now = pygame.time.get_ticks()
-                if current_dialogue_index < len(boss_dialogue):
-                    draw_text(
-                        screen,
-                        boss_dialogue[current_dialogue_index],
-                        (SCREEN_WIDTH // 2 - 300, current_ground_level - 75),
-                        (255, 255, 255),
-                        30,
-                    )
-                    if now - dialogue_start_time > 3000:
-                        current_dialogue_index += 1
-                        dialogue_start_time = now
-                else:
-                    boss.passive, boss.state = False, "idle"
-            else:
-                boss_group.update(player, clock.get_time())
-                boss.check_attack_collision(player)
-
-            boss.draw(screen)
-            draw_boss_health_bar(screen, boss)
-
-            if boss.hp <= 0 and boss.state == "death":
-                draw_text(
+            if game.boss_defeated:
+                renderer.mark(draw_text(
                     screen,
                     "Você libertou o seu povo!",
                     (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2),
                     (0, 255, 0),
                     40,
-                )
-                draw_text(
+                ))
+                renderer.mark(draw_text(
                     screen,
                     "Pressione E para finalmente descansar em paz.",
                     (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 50),
                     (255, 255, 255),
                     30,
-                )
-                if keys[pygame.K_e]:
-                    running = False
+                ))
 
-        draw_health_bar(screen, player)
+    # ----- HUD: vida, mensagens e prompts -----
+    with profiler.scope("hud"):
+        renderer.mark(draw_health_bar(screen, player))
 
-        # ----- Reinício (tecla R) -----
         if not player.alive:
-            draw_text(
+            renderer.mark(draw_text(
                 screen,
                 "Você morreu! Pressione R para reiniciar",
                 (SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2),
                 (255, 0, 0),
                 40,
-            )
-            if keys[pygame.K_r]:
-                room_manager.current_room = 0
-                current_ground_level = room_manager.get_ground_level()
-
-                player = Player((0, 0))
-                player.rect.bottom = current_ground_level
-                position_player_for_room(0, player)
-                player.attack_damage = {"smash": 15, "thrust": 10}
-                player.health, player.alive = player.max_health, True
-
-                wave_manager = None
-                all_enemies.empty()
-                spells.empty()
-                boss, boss_group, boss_intro_time = None, None, None
-                current_dialogue_index, waves_completed = 0, False
+            ))
 
         # ----- DESENHA PROMPTS POR CIMA -----
-        if show_castle_prompt:
-            draw_text(
+        if game.show_castle_prompt:
+            renderer.mark(draw_text(
                 screen,
                 "Pressione E para entrar no castelo",
-                (SCREEN_WIDTH // 2 - 200, current_ground_level - 300),
+                (SCREEN_WIDTH // 2 - 200, ground_level - 300),
                 (255, 255, 0),
                 36,
-            )
+            ))
 
-        if show_patio_prompt:
-            draw_text(
+        if game.show_patio_prompt:
+            renderer.mark(draw_text(
                 screen,
                 "Pressione E para avançar para o pátio e encontrar um velho conhecido",
-                (SCREEN_WIDTH // 2 - 340, current_ground_level - 100),
+                (SCREEN_WIDTH // 2 - 340, ground_level - 100),
                 (255, 255, 0),
                 28,
-            )
+            ))
+
+
+# ================= LOOP PRINCIPAL ==================
+loading = load_game()
+load_progress = 0.0
+loading_bar_rect = pygame.Rect(0, 0, 400, 16)
+loading_bar_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)
+first_frame_logged = False
+renderer = DirtyRectRenderer(enabled=DIRTY_RECTS)
+timestep = FixedTimestep()  # lógica a SIM_HZ fixo; desenho no ritmo que der
+if PROFILE_EXPORT:
+    profiler.open_export(PROFILE_EXPORT)
+if EVENT_LOG_EXPORT:
+    event_log.open_export(EVENT_LOG_EXPORT)
+event_log.show_overlay = COMBAT_LOG
+
+while running:
+    frame_time = clock.tick(MAX_RENDER_FPS) / 1000
+    keys = pygame.key.get_pressed()
+    with profiler.scope("music"):
+        music_player.update()  # crossfades e faixas decodificadas, sem esperar a thread
+
+    # ---------- EVENTOS ----------
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            running = False
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            profiler.toggle()
+            renderer.invalidate()  # apaga o overlay que saiu da tela
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            event_log.toggle()
+            renderer.invalidate()
+        if game_state >= 0 and event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_p:                # pausa
+                game_clock.toggle_pause()
+            elif event.key == pygame.K_n:              # pausado: avança um tick
+                game_clock.step()
+            elif event.key == pygame.K_RIGHTBRACKET:   # acelera (2×, 4×…)
+                game_clock.set_time_scale(game_clock.time_scale * 2)
+            elif event.key == pygame.K_LEFTBRACKET:    # desacelera
+                game_clock.set_time_scale(game_clock.time_scale / 2)
+        if game_state == -2 and event.type == pygame.MOUSEBUTTONDOWN:
+            if loading is None and button_rect.collidepoint(event.pos):
+                game_state = -1
+        elif game_state == -1 and event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            game_state = 0
 
-    # ========== FLIP & FPS ==========
-    pygame.display.flip()
-    clock.tick(90 if game_state == 0 and room_manager.current_room == 2 else 60)
+    # ---------- CARREGAMENTO EM BACKGROUND ----------
+    if loading is not None:
+        load_progress = next(loading, None)
+        if load_progress is None:
+            loading = None
+            print(f"[boot] jogável em {(time.perf_counter() - boot_start) * 1000:.0f} ms")
 
+    # ---------- TELAS ----------
+    if game_state < 0:
+        renderer.invalidate()  # menus redesenham tudo; volta pro jogo com tela cheia
+
+    if game_state == -2:  # Start screen
+        screen.blit(start_screen, (0, 0))
+        hover = loading is None and button_rect.collidepoint(pygame.mouse.get_pos())
+        col = (50, 80, 80) if hover else (30, 60, 60)
+        pygame.draw.rect(screen, col, button_rect.inflate(30, 15), border_radius=10)
+        screen.blit(button_text, button_rect)
+        if loading is not None:
+            draw_loading_bar(screen, load_progress, loading_bar_rect)
+
+    elif game_state == -1:  # Lore
+        screen.blit(intro_image, (0, 0))
+        screen.blit(lore_overlay, (0, 0))
+        for i, line in enumerate(lore_lines):
+            screen.blit(text_renderer.render(line, 36, face=INTRO_FONT), (50, 50 + i * 50))
+
+    else:  # ============ JOGO ============
+        with profiler.scope("room.stream"):
+            game.room_manager.update()  # termina o streaming de salas sem travar o frame
+
+        # frame atrasado = vários ticks agora e um desenho só (a lógica não fica lenta)
+        time_scale = ROOM_TIME_SCALE.get(game.current_room, 1.0)
+        for dt in game_clock.ticks(timestep, frame_time, time_scale):
+            if recorder is not None:
+                recorder.record(keys, dt)
+            game.update(keys, dt)
+            if not game.running:
+                running = False
+                break
+
+        draw_game(game, timestep.alpha)
+        if game_clock.paused or game_clock.time_scale != 1.0:
+            status = "PAUSADO (N: 1 tick)" if game_clock.paused else f"{game_clock.time_scale:g}×"
+            renderer.mark(draw_text(screen, status, (SCREEN_WIDTH - 260, 20), (255, 255, 0), 30))
+        renderer.mark(event_log.draw_overlay(screen))
+        renderer.mark(profiler.draw_overlay(screen))
+
+    # ========== FLIP ==========
+    with profiler.scope("present"):
+        renderer.present()
+    profiler.end_frame()
+    if not first_frame_logged:
+        first_frame_logged = True
+        print(f"[boot] primeiro frame em {(time.perf_counter() - boot_start) * 1000:.0f} ms")
+
+profiler.close_export()
+event_log.close_export()
+music_player.shutdown()
+if recorder is not None:
+    recorder.close()
 pygame.quit()
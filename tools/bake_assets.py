@@ -0,0 +1,90 @@
+"""
+Bake dos assets do Hollow Mooni num pack binário (`assets/baked.pack`).
+
+Monta (headless) tudo que o jogo carrega — animações do Player, dos
+inimigos e do KnightBoss, fundos das salas e telas de menu/lore — já
+cortado e escalonado, e grava os pixels crus no pack. No próximo start
+o `asset_cache` lê dali via `mmap`, sem decodificar PNG nem redimensionar.
+
+Rode a partir da raiz do projeto sempre que mexer em `assets/`:
+
+    $ python -m tools.bake_assets
+    $ python -m tools.bake_assets --output /tmp/outro.pack
+
+Obs: a música (mp3) não entra no pack — quem decodifica é o mixer.
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+SCREEN_SIZE = (1280, 720)
+
+# telas estáticas carregadas pelo main.py
+UI_IMAGES = [
+    "assets/background/telainicial.png",
+    "assets/background/introducao1.png",
+]
+
+
+def build_everything():
+    """Instancia cada entidade e carrega cada cenário uma vez pra popular o `asset_cache`."""
+    from core.bringer import BringerOfDeathEnemy
+    from core.knight_boss import KnightBoss
+    from core.nightborne import NightBorneEnemy
+    from core.player import Player
+    from core.room_manager import ROOMS
+    from core.skeleton import SkeletonEnemy
+    from core.asset_cache import asset_cache
+
+    Player((0, 0))
+    SkeletonEnemy((0, 0))
+    NightBorneEnemy((0, 0), "assets/enemies/nightborne/NightBorne.png")
+    BringerOfDeathEnemy((0, 0), scale=1.0)
+    KnightBoss((0, 0), 650)
+    # cada camada de cada sala, com a mesma chave que o `RoomManager` pede
+    # (ele só carrega a sala atual; as outras chegam por streaming)
+    for room in ROOMS:
+        if "background" in room:
+            asset_cache.image(room["background"], SCREEN_SIZE, alpha=False)
+        if "foreground" in room:
+            asset_cache.image(room["foreground"], SCREEN_SIZE, alpha=True)
+    for path in UI_IMAGES:
+        asset_cache.image(path, SCREEN_SIZE)
+    return asset_cache
+
+
+def main():
+    from core.asset_pack import DEFAULT_PACK_PATH, AssetPack
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=DEFAULT_PACK_PATH, help="arquivo do pack")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    from core.asset_cache import asset_cache
+
+    asset_cache.pack_path = None  # bake sempre parte dos PNGs originais
+
+    start = time.perf_counter()
+    build_everything()
+    size = AssetPack.write(args.output, asset_cache.items())
+    elapsed = time.perf_counter() - start
+
+    stats = asset_cache.stats()
+    print(
+        f"{stats['entries']} entradas, {size / 1024 / 1024:.1f} MiB de pixels "
+        f"→ {args.output} ({elapsed:.2f} s)"
+    )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Simulador de balanceamento em lote do Hollow Mooni (vários processos).
+
+Roda milhares de partidas headless (drivers `dummy`: sem tela nem som)
+espalhadas por todos os núcleos com um pool de processos. Cada worker
+inicializa o Pygame e aquece o próprio `asset_cache` uma vez; cada
+partida tem semente própria (boss e política de entrada), então o mesmo
+comando sempre dá o mesmo relatório.
+
+Os parâmetros de balanceamento entram pela linha de comando (dano dos
+ataques do player, vida dele, vida dos inimigos, vida e dano do boss) e
+o relatório traz taxa de vitória, tempo até matar o boss e dano levado:
+
+    $ python -m tools.balance_sim --fights 2000
+    $ python -m tools.balance_sim --fights 500 --policy noisy --smash 12 --boss-damage 1.5
+    $ python -m tools.balance_sim --fights 1000 --json balance.json
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from core.headless import KeyState, init_headless, run
+from tools.headless_sim import chase_bot, fight_over
+
+POLICIES = ("chase", "noisy")
+NOISE_KEYS = (pygame.K_a, pygame.K_d, pygame.K_SPACE, pygame.K_q, pygame.K_r)
+NOISE_HOLD_TICKS = 12       # a tecla sorteada fica apertada por ~0,2 s
+
+
+# ------------------------------------------------------------------
+# políticas de entrada
+# ------------------------------------------------------------------
+def make_policy(name, rng, noise):
+    """
+    Política de entrada de uma partida.
+
+    Parameters
+    ----------
+    name : str
+        `"chase"` (o bot do `headless_sim`) ou `"noisy"` (o mesmo bot,
+        mas de vez em quando segura uma tecla aleatória — pulos, thrusts,
+        passos pro lado errado — como um jogador menos preciso).
+    rng : random.Random
+        Gerador semeado da partida.
+    noise : float
+        Chance por tick de começar uma tecla aleatória (só `"noisy"`).
+    """
+    if name == "chase":
+        return chase_bot
+
+    held = [None, 0]  # tecla aleatória apertada, ticks restantes
+
+    def noisy(game):
+        if game.show_castle_prompt or game.show_patio_prompt:
+            return chase_bot(game)
+        if held[1] == 0 and rng.random() < noise:
+            held[:] = [rng.choice(NOISE_KEYS), NOISE_HOLD_TICKS]
+        if held[1]:
+            held[1] -= 1
+            return KeyState({held[0]})
+        return chase_bot(game)
+
+    return noisy
+
+
+# ------------------------------------------------------------------
+# parâmetros de balanceamento
+# ------------------------------------------------------------------
+def scaled_enemy(cls, hp_scale):
+    """Subclasse de `cls` que nasce (e renasce do pool) com a vida multiplicada."""
+    if hp_scale == 1.0:
+        return cls
+
+    def reset(self, *args, **kwargs):
+        cls.reset(self, *args, **kwargs)
+        self.health = round(self.health * hp_scale)
+        if hasattr(self, "max_health"):
+            self.max_health = self.health
+
+    return type(cls.__name__, (cls,), {"reset": reset})
+
+
+def build_waves(hp_scale):
+    """`WAVE_DEFINITIONS` com os tipos trocados pelas classes de vida escalada."""
+    from core.game import WAVE_DEFINITIONS
+    from core.wave_manager import resolve_type
+
+    classes = {}
+    waves = []
+    for wave in WAVE_DEFINITIONS:
+        entries = []
+        for entry in wave:
+            _, cls = resolve_type(entry["type"])
+            if cls not in classes:
+                classes[cls] = scaled_enemy(cls, hp_scale)
+            entries.append(dict(entry, type=classes[cls]))
+        waves.append(entries)
+    return waves
+
+
+def tune_boss(boss, params):
+    """Aplica vida e multiplicador de dano do cenário no boss recém-spawnado."""
+    boss.max_hp = boss.hp = params["boss_hp"]
+    for attack, damage in boss.attack_damage.items():
+        boss.attack_damage[attack] = round(damage * params["boss_damage"])
+
+
+# ------------------------------------------------------------------
+# uma partida (roda no worker)
+# ------------------------------------------------------------------
+def _init_worker():
+    """Inicializador de cada processo: Pygame headless + `asset_cache` quente."""
+    init_headless()
+    from core.event_log import OFF, event_log
+    event_log.set_level(OFF)  # ninguém lê o log de combate de milhares de partidas
+    from core.bringer import BringerOfDeathEnemy
+    from core.knight_boss import KnightBoss
+    from core.nightborne import NightBorneEnemy
+    from core.skeleton import SkeletonEnemy
+
+    # monta um de cada: os frames ficam no cache deste processo pras próximas partidas
+    SkeletonEnemy((0, 0))
+    NightBorneEnemy((0, 0))
+    BringerOfDeathEnemy((0, 0))
+    KnightBoss((0, 0), 660)
+
+
+_waves_cache = {}
+
+
+def simulate(task):
+    """
+    Roda uma partida e devolve as métricas dela.
+
+    Parameters
+    ----------
+    task : tuple[int, dict]
+        Semente da partida e parâmetros do cenário.
+
+    Returns
+    -------
+    dict
+        `seed`, `won`, `died`, `ticks`, `time_s`, `boss_fight_s` (do boss
+        ficar ativo até morrer, `None` sem vitória), `damage_waves` e
+        `damage_boss` (vida perdida na passarela e na sala do boss).
+    """
+    from core.clock import game_clock
+    from core.game import Game
+
+    seed, params = task
+    game_clock.time_ms = 0.0  # toda partida começa do mesmo relógio, em qualquer worker
+    waves = _waves_cache.get(params["enemy_hp"])
+    if waves is None:
+        waves = _waves_cache[params["enemy_hp"]] = build_waves(params["enemy_hp"])
+
+    game = Game(1280, 720, wave_definitions=waves, load_scenery=False, seed=seed)
+    player = game.player
+    player.max_health = player.health = params["player_hp"]
+    player.attack_damage = {"smash": params["smash"], "thrust": params["thrust"]}
+    inner = make_policy(params["policy"], random.Random(seed), params["noise"])
+
+    stats = {"damage_waves": 0, "damage_boss": 0, "boss_start": None, "boss_end": None}
+    last = {"health": player.health, "room": game.current_room, "boss": None}
+
+    def policy(game):
+        # mede o tick anterior antes de decidir o próximo
+        player = game.player
+        if game.current_room == last["room"] and player.health < last["health"]:
+            key = "damage_boss" if game.current_room == 2 else "damage_waves"
+            stats[key] += last["health"] - player.health
+        if game.boss is not None and game.boss is not last["boss"]:
+            tune_boss(game.boss, params)
+            last["boss"] = game.boss
+        if game.boss and not game.boss.passive and stats["boss_start"] is None:
+            stats["boss_start"] = game.elapsed_ms
+        if game.boss_defeated and stats["boss_end"] is None:
+            stats["boss_end"] = game.elapsed_ms
+        last["health"], last["room"] = player.health, game.current_room
+        return inner(game)
+
+    result = run(policy, params["max_ticks"], game=game, stop=fight_over)
+    policy(game)  # contabiliza o último tick
+    game._clear_enemies()  # sobras da partida voltam pros pools do worker
+    game.spells.empty()
+
+    won = result["boss_defeated"]
+    boss_fight = None
+    if won and stats["boss_start"] is not None:
+        boss_fight = (stats["boss_end"] - stats["boss_start"]) / 1000
+    return {
+        "seed": seed,
+        "won": won,
+        "died": not result["player_alive"] or result["restarts"] > 0,
+        "ticks": result["ticks"],
+        "time_s": result["game_time_s"],
+        "boss_fight_s": boss_fight,
+        "damage_waves": stats["damage_waves"],
+        "damage_boss": stats["damage_boss"],
+    }
+
+
+# ------------------------------------------------------------------
+# relatório
+# ------------------------------------------------------------------
+def distribution(values):
+    """Média, mínimo, p10, p50, p90 e máximo de uma lista (vazia → `None`)."""
+    if not values:
+        return None
+    values = sorted(values)
+
+    def pct(p):
+        return values[min(len(values) - 1, int(p * len(values)))]
+
+    return {
+        "mean": sum(values) / len(values),
+        "min": values[0],
+        "p10": pct(0.10),
+        "p50": pct(0.50),
+        "p90": pct(0.90),
+        "max": values[-1],
+    }
+
+
+def aggregate(results):
+    """Junta as métricas de todas as partidas num relatório."""
+    n = len(results)
+    wins = [r for r in results if r["won"]]
+    return {
+        "fights": n,
+        "win_rate": len(wins) / n,
+        "death_rate": sum(r["died"] for r in results) / n,
+        "timeout_rate": sum(not r["won"] and not r["died"] for r in results) / n,
+        "time_to_win_s": distribution([r["time_s"] for r in wins]),
+        "boss_fight_s": distribution([r["boss_fight_s"] for r in wins if r["boss_fight_s"] is not None]),
+        "damage_waves": distribution([r["damage_waves"] for r in results]),
+        "damage_boss": distribution([r["damage_boss"] for r in results]),
+    }
+
+
+def print_report(report, params, elapsed, workers):
+    print(f"{report['fights']} partidas ({params['policy']}) em {elapsed:.1f} s "
+          f"com {workers} processo(s)")
+    print(f"vitórias {report['win_rate']:.1%} | mortes {report['death_rate']:.1%} | "
+          f"limite de ticks {report['timeout_rate']:.1%}")
+    print(f"{'':<22}{'média':>8}{'mín':>8}{'p10':>8}{'p50':>8}{'p90':>8}{'máx':>8}")
+    labels = {
+        "time_to_win_s": "tempo até vencer (s)",
+        "boss_fight_s": "luta com o boss (s)",
+        "damage_waves": "dano nas ondas",
+        "damage_boss": "dano no boss",
+    }
+    for key, label in labels.items():
+        d = report[key]
+        if d is None:
+            print(f"{label:<22}{'—':>8}")
+            continue
+        print(f"{label:<22}" + "".join(
+            f"{d[k]:>8.1f}" for k in ("mean", "min", "p10", "p50", "p90", "max")
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fights", type=int, default=200, help="quantas partidas simular")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processos (padrão: todos os núcleos; 1 = sem pool)")
+    parser.add_argument("--seed", type=int, default=0, help="semente da 1ª partida (seed+i nas demais)")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="limite de ticks por partida")
+    parser.add_argument("--policy", choices=POLICIES, default="chase", help="política de entrada")
+    parser.add_argument("--noise", type=float, default=0.02,
+                        help="chance por tick de uma tecla aleatória (política noisy)")
+    parser.add_argument("--smash", type=int, default=15, help="dano do smash do player")
+    parser.add_argument("--thrust", type=int, default=10, help="dano do thrust do player")
+    parser.add_argument("--player-hp", type=int, default=175, help="vida máxima do player")
+    parser.add_argument("--enemy-hp", type=float, default=1.0,
+                        help="multiplicador da vida dos inimigos das ondas")
+    parser.add_argument("--boss-hp", type=int, default=200, help="vida do boss")
+    parser.add_argument("--boss-damage", type=float, default=1.0,
+                        help="multiplicador do dano dos ataques do boss")
+    parser.add_argument("--json", metavar="ARQUIVO", help="grava relatório + partidas em JSON")
+    args = parser.parse_args()
+
+    params = {
+        "policy": args.policy, "noise": args.noise, "max_ticks": args.max_ticks,
+        "smash": args.smash, "thrust": args.thrust, "player_hp": args.player_hp,
+        "enemy_hp": args.enemy_hp, "boss_hp": args.boss_hp, "boss_damage": args.boss_damage,
+    }
+    tasks = [(args.seed + i, params) for i in range(args.fights)]
+
+    start = time.perf_counter()
+    if args.workers <= 1:
+        _init_worker()
+        results = [simulate(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (args.workers * 8))
+        with ProcessPoolExecutor(args.workers, initializer=_init_worker) as pool:
+            results = list(pool.map(simulate, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    report = aggregate(results)
+    print_report(report, params, elapsed, args.workers)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"params": params, "report": report, "fights": results}, f, indent=2)
+        print(f"relatório em {args.json}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
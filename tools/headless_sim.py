@@ -0,0 +1,128 @@
+"""
+Simulação headless de partidas do Hollow Mooni com um bot simples.
+
+Roda o jogo inteiro (porta → ondas da passarela → boss) sem janela, sem
+som e sem esperar o relógio, com um bot que anda até o inimigo mais
+perto e ataca. Serve pra balanceamento e regressão em máquina de CI:
+
+    $ python -m tools.headless_sim
+    $ python -m tools.headless_sim --runs 50 --max-ticks 30000
+    $ python -m tools.headless_sim --runs 1 --seed 7 --record bot.hmr   # vira caso de replay
+"""
+
+import argparse
+import time
+
+import pygame
+
+from core.headless import KeyState, init_headless, run
+
+ATTACK_RANGE = 60   # distância (px) em que o bot para de andar e ataca
+TURN_MARGIN = 10    # alvo praticamente em cima: ataca sem virar
+
+
+def chase_bot(game):
+    """
+    Política de entrada: avança de sala, persegue o alvo mais perto e ataca.
+
+    Parameters
+    ----------
+    game : Game
+        Partida em andamento.
+
+    Returns
+    -------
+    KeyState
+        Teclas apertadas neste tick.
+    """
+    if game.show_castle_prompt or game.show_patio_prompt:
+        return KeyState({pygame.K_e})
+
+    player = game.player
+    targets = [enemy.rect.centerx for enemy in game.all_enemies]
+    if game.enemy_batch is not None:
+        targets.extend(game.enemy_batch.centers())
+    if game.boss and not game.boss.passive and game.boss.state != "death":
+        targets.append(game.boss.rect.centerx)
+    if not targets:
+        return KeyState()
+
+    target_x = min(targets, key=lambda x: abs(x - player.rect.centerx))
+    dx = target_x - player.rect.centerx
+    if abs(dx) > ATTACK_RANGE:
+        return KeyState({pygame.K_d if dx > 0 else pygame.K_a})
+    if abs(dx) > TURN_MARGIN and (dx > 0) != player.facing_right:
+        return KeyState({pygame.K_d if dx > 0 else pygame.K_a})  # vira pro alvo
+    return KeyState({pygame.K_r})  # smash dura enquanto R estiver apertado
+
+
+def fight_over(game):
+    """
+    Para a simulação quando o player morre ou o boss cai.
+
+    Conta também a morte seguida de reinício no mesmo tick: o bot segura
+    R pro smash, e R com o player morto reinicia a partida.
+    """
+    return not game.player.alive or game.restarts > 0 or game.boss_defeated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="quantas partidas simular")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="limite de ticks por partida")
+    parser.add_argument("--batch", nargs="?", const="numpy", choices=("numpy", "ecs"),
+                        help="inimigos comuns em lote: numpy (EnemyBatch, padrão) ou ecs (EnemyWorld)")
+    parser.add_argument("--seed", type=int,
+                        help="semente da 1ª partida (as seguintes usam seed+1, seed+2…)")
+    parser.add_argument("--record", metavar="ARQUIVO",
+                        help="grava a entrada da 1ª partida pra `python -m tools.replay`")
+    parser.add_argument("--log", metavar="ARQUIVO",
+                        help="grava os eventos de combate/ondas (JSON Lines, `core.event_log`)")
+    args = parser.parse_args()
+
+    init_headless()
+    from core.event_log import event_log
+    from core.game import Game
+    from core.replay import InputRecorder
+    from core.timing import FIXED_DT
+
+    if args.log:
+        event_log.open_export(args.log)
+    results = []
+    spawn_ms_max = 0.0
+    latencies = []
+    start = time.perf_counter()
+    for i in range(args.runs):
+        seed = None if args.seed is None else args.seed + i
+        game = Game(1280, 720, load_scenery=False, enemy_batch=args.batch, seed=seed)
+        policy = chase_bot
+        recorder = InputRecorder(args.record, game) if args.record and i == 0 else None
+        if recorder is not None:
+            def policy(game, recorder=recorder):
+                keys = chase_bot(game)
+                recorder.record(keys, FIXED_DT)
+                return keys
+        results.append(run(policy, args.max_ticks, game=game, stop=fight_over))
+        if game.wave_metrics is not None:
+            spawn_ms_max = max(spawn_ms_max, game.wave_metrics["spawn_ms_max"])
+            latencies += game.wave_metrics["start_latency_ms"]
+        if recorder is not None:
+            recorder.close()
+    elapsed = time.perf_counter() - start
+    event_log.close_export()
+
+    wins = sum(r["boss_defeated"] for r in results)
+    deaths = sum(not r["player_alive"] or r["restarts"] > 0 for r in results)
+    ticks = sum(r["ticks"] for r in results)
+    print(f"{args.runs} partidas: {wins} vitórias, {deaths} mortes, "
+          f"{args.runs - wins - deaths} no limite de ticks")
+    print(f"{ticks} ticks em {elapsed:.2f} s ({ticks / elapsed:,.0f} ticks/s, "
+          f"{ticks / 60 / elapsed:.0f}× tempo real)")
+    if latencies:
+        print(f"spawn das ondas: pior tick {spawn_ms_max:.2f} ms, "
+              f"início de onda em {sum(latencies) / len(latencies):.2f} ms (média de {len(latencies)})")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
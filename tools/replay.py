@@ -0,0 +1,58 @@
+"""
+Replay headless de uma sessão gravada (`core.replay`) do Hollow Mooni.
+
+Monta a partida com a mesma semente e o mesmo relógio da gravação e
+devolve a entrada tick a tick, o mais rápido possível, conferindo os
+checkpoints de estado pelo caminho. Serve pra transformar uma sessão
+ruim num caso de regressão (o replay diverge) ou de perf (ticks/s):
+
+    $ python -m tools.replay sessao.hmr
+    $ python -m tools.replay sessao.hmr --repeat 5 --no-verify
+"""
+
+import argparse
+import sys
+import time
+
+import pygame
+
+from core.headless import init_headless
+from core.replay import Replay, ReplayDivergence
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="arquivo .hmr gravado")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="roda a sessão N vezes (medição de perf)")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="não confere os checkpoints de estado")
+    args = parser.parse_args()
+
+    init_headless()
+    replay = Replay(args.path)
+    print(f"{args.path}: {replay.ticks} ticks ({replay.ticks / 60:.0f} s de jogo), "
+          f"semente {replay.seed}, {len(replay.checkpoints)} checkpoints")
+
+    best = None
+    for _ in range(args.repeat):
+        game = replay.new_game()
+        start = time.perf_counter()
+        try:
+            result = replay.play(game, verify=not args.no_verify)
+        except ReplayDivergence as exc:
+            print(f"DIVERGIU: {exc}")
+            pygame.quit()
+            return 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(f"fim: {result}")
+    print(f"{result['ticks']} ticks em {best:.2f} s ({result['ticks'] / best:,.0f} ticks/s, "
+          f"{result['ticks'] / 60 / best:.0f}× tempo real)")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())